@@ -0,0 +1,93 @@
+"""
+Regression tests for the incremental error highlighting.
+"""
+
+import unittest
+
+import numpy as np
+
+from utils.backend import scan_text_change, text_to_codepoints
+from utils.ui_utils import TypingTrainerApp
+
+
+class _StubText:
+    """
+    Minimal stand-in for a Tk text widget that accepts error tags.
+    """
+
+    def tag_add(self, *args) -> None:
+        pass
+
+    def tag_remove(self, *args) -> None:
+        pass
+
+
+def _full_recount(typed_text: str, target_text: str) -> int:
+    """
+    Count correct characters the way a full recount without spans does.
+    """
+    return sum(
+        1
+        for typed, target in zip(typed_text, target_text)
+        if typed == target
+    )
+
+
+class HighlightErrorsTest(unittest.TestCase):
+    TARGET = "hello world"
+
+    def setUp(self) -> None:
+        app = TypingTrainerApp.__new__(TypingTrainerApp)
+        app._target_codepoints = text_to_codepoints(self.TARGET)
+        app._typed_error_mask = np.zeros(0, dtype=bool)
+        app._error_mask_widget = None
+        app._error_mask_tags_shown = False
+        app._error_tagged_inputs = set()
+        app.correct_count = 0
+        app.input_text = _StubText()
+        self.blind = False
+        app.is_blind_mode_active = lambda: self.blind
+        self.app = app
+        self.previous = ""
+
+    def _type(self, text: str) -> None:
+        for end in range(1, len(text) + 1):
+            current = text[:end]
+            prefix_len, prev_end, curr_end, _ = scan_text_change(
+                self.previous,
+                current,
+                self.app._target_codepoints
+            )
+            self.app.highlight_errors(
+                current,
+                (prefix_len, prev_end, curr_end)
+            )
+            self.previous = current
+
+    def test_widget_switch_recounts_from_scratch(self) -> None:
+        self._type("hello w")
+        self.app.input_text = _StubText()
+        self._type("hello wo")
+        self.assertEqual(
+            self.app.correct_count,
+            _full_recount("hello wo", self.TARGET)
+        )
+
+    def test_blind_toggle_recounts_from_scratch(self) -> None:
+        self._type("hellp w")
+        self.blind = True
+        self._type("hellp wo")
+        self.assertEqual(
+            self.app.correct_count,
+            _full_recount("hellp wo", self.TARGET)
+        )
+        self.blind = False
+        self._type("hellp wor")
+        self.assertEqual(
+            self.app.correct_count,
+            _full_recount("hellp wor", self.TARGET)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Tests that the fast_histogram and NumPy joint histogram paths agree.
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from utils import plot_utils
+
+
+@unittest.skipIf(
+    plot_utils.fast_histogram is None,
+    "fast_histogram is not installed"
+)
+class JointHistogramTest(unittest.TestCase):
+    def _assert_paths_match(
+        self,
+        x_values: np.ndarray,
+        y_values: np.ndarray,
+        bin_count: int,
+        x_range: tuple[float, float],
+        y_range: tuple[float, float]
+    ) -> None:
+        fast = plot_utils._joint_histogram(
+            x_values,
+            y_values,
+            bin_count,
+            x_range,
+            y_range
+        )
+        with mock.patch.object(plot_utils, "fast_histogram", None):
+            reference = plot_utils._joint_histogram(
+                x_values,
+                y_values,
+                bin_count,
+                x_range,
+                y_range
+            )
+        np.testing.assert_array_equal(fast, reference)
+        self.assertEqual(fast.sum(), len(x_values))
+
+    def test_values_on_bin_edges(self) -> None:
+        x_values = np.array([0.0, 2.0, 4.0, 6.0, 8.0, 10.0, 10.0, 3.3])
+        y_values = np.array([10.0, 0.0, 5.0, 2.5, 10.0, 7.5, 0.0, 10.0])
+        for bin_count in (4, 5):
+            self._assert_paths_match(
+                x_values,
+                y_values,
+                bin_count,
+                (0.0, 10.0),
+                (0.0, 10.0)
+            )
+
+    def test_ranges_from_data(self) -> None:
+        rng = np.random.default_rng(7)
+        x_values = np.round(rng.uniform(20.0, 120.0, 500), 3)
+        y_values = np.round(rng.uniform(0.0, 15.0, 500), 3)
+        self._assert_paths_match(
+            x_values,
+            y_values,
+            17,
+            (float(x_values.min()), float(x_values.max())),
+            (float(y_values.min()), float(y_values.max()))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Tests for the background statistics writer.
+"""
+
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from utils import backend
+
+
+class StatsWriterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.stats_path = Path(self.tmp_dir.name) / "stats.csv"
+
+    def tearDown(self) -> None:
+        backend.close_stats_files()
+        self.tmp_dir.cleanup()
+
+    def test_failed_write_is_reported_and_writer_keeps_running(self) -> None:
+        with mock.patch.object(
+            backend,
+            "_write_stats_text",
+            side_effect=TypeError("bad line")
+        ), redirect_stderr(StringIO()):
+            backend.save_wpm_result(self.stats_path, 50.0, 1.0, 30.0, False)
+            failures = backend.flush_stats_writes()
+
+            self.assertEqual(len(failures), 1)
+            self.assertEqual(failures[0][0], self.stats_path)
+            self.assertIsInstance(failures[0][1], TypeError)
+
+        backend.save_wpm_result(self.stats_path, 60.0, 2.0, 40.0, True)
+        self.assertEqual(backend.flush_stats_writes(), [])
+        lines = self.stats_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines[0], backend.STATS_FILE_HEADER)
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].endswith(";60.000;2.000;40.000;1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,8 +4,17 @@ Backend helpers for the typing trainer application.
 
 from __future__ import annotations
 
+import atexit
+import os
+import queue
+import threading
 import time
+import traceback
+from datetime import date
 from pathlib import Path
+from typing import Sequence
+
+import numpy as np
 
 from .io_utils import (
     BLIND_LETTER_STATS_FILE_HEADER,
@@ -23,6 +32,28 @@ from .io_utils import (
     ensure_stats_file_header,
 )
 
+_STATS_FILE_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+)
+_stats_file_descriptors: dict[Path, int] = {}
+_last_timestamp_second: int = -1
+_last_timestamp_text: str = ""
+_stats_write_queue: queue.Queue[tuple[Path, str, str]] = queue.Queue()
+_stats_writer_thread: threading.Thread | None = None
+_stats_write_failures: list[tuple[Path, Exception]] = []
+_stats_write_failures_lock = threading.Lock()
+_STATS_CACHE_TAIL_BYTES = 64
+_TRAINING_FLAG_VALUES = frozenset({"1", "true", "yes", "y"})
+_stats_table_cache: dict[
+    tuple,
+    tuple[
+        int,
+        bytes,
+        tuple[np.ndarray, np.ndarray, np.ndarray],
+        tuple[int, int] | None,
+    ]
+] = {}
+
 
 def parse_training_flag(parts: list[str], flag_index: int) -> bool:
     """
@@ -30,8 +61,275 @@ def parse_training_flag(parts: list[str], flag_index: int) -> bool:
     """
     if len(parts) <= flag_index:
         return False
-    value = parts[flag_index].strip().lower()
-    return value in {"1", "true", "yes", "y"}
+    return parts[flag_index].strip().lower() in _TRAINING_FLAG_VALUES
+
+
+def _split_stats_lines(lines: list[str]) -> np.ndarray:
+    """
+    Split semicolon separated lines into a 2D string array padded with "".
+    """
+    try:
+        return np.loadtxt(
+            lines,
+            delimiter=";",
+            dtype=str,
+            comments=None,
+            ndmin=2
+        )
+    except ValueError:
+        # Rows written by older versions can have fewer columns.
+        rows = [line.split(";") for line in lines]
+        width = max(len(row) for row in rows)
+        return np.array(
+            [row + [""] * (width - len(row)) for row in rows],
+            dtype=str
+        )
+
+
+def _parse_float_column(column: np.ndarray) -> np.ndarray:
+    """
+    Convert a string column to floats, using NaN for unparsable entries.
+    """
+    try:
+        return column.astype(np.float64)
+    except ValueError:
+        values = np.full(len(column), np.nan)
+        for index, text in enumerate(column.tolist()):
+            try:
+                values[index] = float(text)
+            except ValueError:
+                pass
+        return values
+
+
+def _parse_day_column(column: np.ndarray) -> np.ndarray:
+    """
+    Convert "%Y-%m-%d %H:%M:%S" timestamps to days, using NaT when invalid.
+    """
+    try:
+        return column.astype("datetime64[s]").astype("datetime64[D]")
+    except ValueError:
+        days = np.full(len(column), np.datetime64("NaT"), dtype="datetime64[D]")
+        for index, text in enumerate(column.tolist()):
+            try:
+                days[index] = date.fromisoformat(text[:10])
+            except ValueError:
+                pass
+        return days
+
+
+def _parse_stats_lines(
+    lines: list[str],
+    header: str,
+    value_columns: Sequence[int],
+    flag_index: int,
+    min_fields: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parse statistics lines into day, value and training flag arrays.
+    """
+    lines = [line.strip() for line in lines]
+    lines = [line for line in lines if line and line != header]
+    if min_fields > 1 and lines:
+        field_counts = np.char.count(np.array(lines), ";") + 1
+        lines = [
+            line
+            for line, keep in zip(lines, (field_counts >= min_fields).tolist())
+            if keep
+        ]
+    if not lines:
+        return (
+            np.empty(0, dtype="datetime64[D]"),
+            np.empty((0, len(value_columns))),
+            np.zeros(0, dtype=bool),
+        )
+
+    table = _split_stats_lines(lines)
+
+    def column(index: int) -> np.ndarray:
+        if index < table.shape[1]:
+            return table[:, index]
+        return np.full(len(table), "", dtype=str)
+
+    days = _parse_day_column(column(0))
+    values = np.column_stack(
+        [_parse_float_column(column(index)) for index in value_columns]
+    ) if len(value_columns) > 0 else np.empty((len(table), 0))
+    flags = np.char.lower(np.char.strip(column(flag_index)))
+    training = np.isin(flags, tuple(_TRAINING_FLAG_VALUES))
+    return days, values, training
+
+
+def _concat_stats_tables(
+    first: tuple[np.ndarray, np.ndarray, np.ndarray],
+    second: tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Append the rows of one parsed statistics table to another.
+    """
+    return tuple(
+        np.concatenate([left, right])
+        for left, right in zip(first, second)
+    )
+
+
+def load_stats_table(
+    file_path: Path,
+    header: str,
+    value_columns: Sequence[int],
+    flag_index: int,
+    min_fields: int = 1,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load a statistics CSV file into NumPy arrays.
+
+    Blank lines, the header line and rows with fewer than ``min_fields``
+    fields are skipped. The parsed rows are kept in memory: an unchanged
+    file (same size and mtime) is not read at all, not even to check its
+    header, and a grown file only has the lines appended since the last
+    call parsed. The file is parsed
+    again from the start when the bytes before the cached offset no longer
+    match.
+
+    :return: Day of each row (``datetime64[D]``, NaT if the timestamp is
+        invalid), a float array with one column per entry of
+        ``value_columns`` (NaN if missing or invalid) and the training flags.
+    """
+    key = (file_path, header, tuple(value_columns), flag_index, min_fields)
+    cached = _stats_table_cache.get(key)
+    stat = file_path.stat()
+    stat_key = (stat.st_size, stat.st_mtime_ns)
+    if cached is not None and cached[3] == stat_key:
+        return cached[2]
+
+    ensure_stats_file_header(file_path, header, create_if_missing=False)
+    stat = file_path.stat()
+    stat_key = (stat.st_size, stat.st_mtime_ns)
+
+    offset = 0
+    with file_path.open("rb") as file:
+        if cached is not None:
+            cached_offset, cached_tail, _, _ = cached
+            file.seek(cached_offset - len(cached_tail))
+            if file.read(len(cached_tail)) == cached_tail:
+                offset = cached_offset
+            else:
+                file.seek(0)
+        data = file.read()
+
+    # Only complete lines are cached; a trailing partial line is parsed
+    # for this call and read again once it has been finished.
+    complete_end = data.rfind(b"\n") + 1
+    complete = data[:complete_end]
+
+    def parse(chunk: bytes) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return _parse_stats_lines(
+            chunk.decode("utf-8").splitlines(),
+            header,
+            value_columns,
+            flag_index,
+            min_fields
+        )
+
+    table = parse(complete)
+    if offset:
+        table = _concat_stats_tables(cached[2], table)
+        tail = (cached[1] + complete)[-_STATS_CACHE_TAIL_BYTES:]
+    else:
+        tail = complete[-_STATS_CACHE_TAIL_BYTES:]
+    _stats_table_cache[key] = (
+        offset + complete_end,
+        tail,
+        table,
+        stat_key if complete_end == len(data) else None,
+    )
+
+    if data[complete_end:].strip():
+        table = _concat_stats_tables(table, parse(data[complete_end:]))
+    return table
+
+
+def text_to_codepoints(text: str) -> np.ndarray:
+    """
+    Return the Unicode code points of the text as a uint32 array.
+
+    Fixed-width code points keep array positions aligned with character
+    positions, which a UTF-8 byte view would not do for umlauts and symbols.
+    """
+    return np.frombuffer(
+        text.encode("utf-32-le", "surrogatepass"),
+        dtype=np.uint32
+    )
+
+
+def _common_prefix_length(first: str, second: str, limit: int) -> int:
+    """
+    Return the length of the common prefix of both strings, at most ``limit``.
+
+    The search doubles the probed length and then bisects, so only a
+    logarithmic number of (C level) slice comparisons is needed.
+    """
+    step = 1
+    while step <= limit and first[:step] == second[:step]:
+        step *= 2
+    low = step // 2
+    high = min(step, limit + 1)
+    while high - low > 1:
+        middle = (low + high) // 2
+        if first[:middle] == second[:middle]:
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+def _common_suffix_length(first: str, second: str, limit: int) -> int:
+    """
+    Return the length of the common suffix of both strings, at most ``limit``.
+    """
+    first_length = len(first)
+    second_length = len(second)
+    step = 1
+    while (
+        step <= limit
+        and first[first_length - step:] == second[second_length - step:]
+    ):
+        step *= 2
+    low = step // 2
+    high = min(step, limit + 1)
+    while high - low > 1:
+        middle = (low + high) // 2
+        if first[first_length - middle:] == second[second_length - middle:]:
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+def scan_text_change(
+    previous: str,
+    current: str,
+    target: np.ndarray,
+) -> tuple[int, int, int, int]:
+    """
+    Locate the edited span between two texts and count the new errors in it.
+
+    :param target: Code point array of the target text.
+    :return: Common prefix length, end of the changed span in ``previous`` and
+        in ``current``, and the number of characters in the changed span of
+        ``current`` that do not match ``target``.
+    """
+    shared = min(len(previous), len(current))
+    prefix_len = _common_prefix_length(previous, current, shared)
+    suffix_len = _common_suffix_length(previous, current, shared - prefix_len)
+    prev_end = len(previous) - suffix_len
+    curr_end = len(current) - suffix_len
+
+    changed = text_to_codepoints(current[prefix_len:curr_end])
+    compared = target[prefix_len:curr_end]
+    new_errors = len(changed) - len(compared)
+    new_errors += int(np.count_nonzero(changed[:len(compared)] != compared))
+    return prefix_len, prev_end, curr_end, new_errors
 
 
 def calculate_end_error_percentage(
@@ -41,22 +339,134 @@ def calculate_end_error_percentage(
 ) -> float:
     """
     Compute the percentage of mismatched characters between target and typed text.
+
+    Only the first ``total_targets`` characters of ``target`` are compared, so a
+    longer target sequence can be passed without slicing it first.
     """
     if total_targets is None:
         total_targets = len(typed)
     if total_targets <= 0:
         return 0.0
-    wrong = 0
-    for index in range(total_targets):
-        target_char = target[index] if index < len(target) else ""
-        typed_char = typed[index] if index < len(typed) else ""
-        if typed_char != target_char:
-            wrong += 1
+    target_length = min(len(target), total_targets)
+    typed_length = min(len(typed), total_targets)
+    shared_length = min(target_length, typed_length)
+    wrong = abs(target_length - typed_length)
+    if shared_length > 0:
+        wrong += int(np.count_nonzero(
+            text_to_codepoints(target[:shared_length])
+            != text_to_codepoints(typed[:shared_length])
+        ))
     if len(typed) > total_targets:
         wrong += len(typed) - total_targets
     return (wrong / total_targets) * 100.0
 
 
+def _current_timestamp() -> str:
+    """
+    Return the local time formatted for the statistics files, cached per second.
+    """
+    global _last_timestamp_second, _last_timestamp_text
+    now = int(time.time())
+    if now != _last_timestamp_second:
+        _last_timestamp_second = now
+        _last_timestamp_text = time.strftime(
+            "%Y-%m-%d %H:%M:%S",
+            time.localtime(now)
+        )
+    return _last_timestamp_text
+
+
+def _write_stats_text(file_path: Path, header: str, text: str) -> None:
+    """
+    Append text through a cached O_APPEND descriptor for the file.
+
+    The header is checked only when the file is opened for the first time.
+    The text goes out in a single ``os.write``.
+    """
+    descriptor = _stats_file_descriptors.get(file_path)
+    if descriptor is None:
+        ensure_stats_file_header(file_path, header)
+        descriptor = os.open(file_path, _STATS_FILE_OPEN_FLAGS, 0o644)
+        _stats_file_descriptors[file_path] = descriptor
+    # Match the line endings the text-mode header write produces.
+    os.write(descriptor, text.replace("\n", os.linesep).encode("utf-8"))
+
+
+def _stats_writer_loop() -> None:
+    """
+    Write queued result lines, batching everything queued per file.
+
+    Failures are recorded for flush_stats_writes() to report and never stop
+    the thread, so every queued item is always marked done.
+    """
+    while True:
+        batch = [_stats_write_queue.get()]
+        while True:
+            try:
+                batch.append(_stats_write_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            pending: dict[Path, tuple[str, list[str]]] = {}
+            for file_path, header, line in batch:
+                pending.setdefault(file_path, (header, []))[1].append(line)
+            for file_path, (header, lines) in pending.items():
+                try:
+                    _write_stats_text(file_path, header, "".join(lines))
+                except Exception as exc:
+                    traceback.print_exc()
+                    with _stats_write_failures_lock:
+                        _stats_write_failures.append((file_path, exc))
+        finally:
+            for _ in batch:
+                _stats_write_queue.task_done()
+
+
+def _append_stats_line(file_path: Path, header: str, line: str) -> None:
+    """
+    Queue a result line for the background statistics writer.
+
+    Saving at the end of a run therefore never waits on the disk. Readers
+    call flush_stats_writes() first so they see every queued result.
+    """
+    global _stats_writer_thread
+    if _stats_writer_thread is None:
+        _stats_writer_thread = threading.Thread(
+            target=_stats_writer_loop,
+            name="stats-writer",
+            daemon=True
+        )
+        _stats_writer_thread.start()
+    _stats_write_queue.put((file_path, header, line))
+
+
+def flush_stats_writes() -> list[tuple[Path, Exception]]:
+    """
+    Block until all queued result lines have been written.
+
+    :return: The writes that failed since the previous flush, as pairs of
+        the statistics file and the raised exception.
+    """
+    _stats_write_queue.join()
+    with _stats_write_failures_lock:
+        failures = list(_stats_write_failures)
+        _stats_write_failures.clear()
+    return failures
+
+
+def close_stats_files() -> None:
+    """
+    Write pending results and close all cached statistics file descriptors.
+    """
+    flush_stats_writes()
+    for descriptor in _stats_file_descriptors.values():
+        os.close(descriptor)
+    _stats_file_descriptors.clear()
+
+
+atexit.register(close_stats_files)
+
+
 def save_wpm_result(
     file_path: Path,
     wpm: float,
@@ -67,15 +477,13 @@ def save_wpm_result(
     """
     Append the given WPM value and error rate to the statistics file.
     """
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    timestamp = _current_timestamp()
     training_flag = "1" if is_training_run else "0"
     line = (
         f"{timestamp};{wpm:.3f};{error_percentage:.3f};"
         f"{duration_seconds:.3f};{training_flag}\n"
     )
-    ensure_stats_file_header(file_path, STATS_FILE_HEADER)
-    with file_path.open("a", encoding="utf-8") as stats_file:
-        stats_file.write(line)
+    _append_stats_line(file_path, STATS_FILE_HEADER, line)
 
 
 def save_sudden_death_wpm_result(
@@ -89,16 +497,14 @@ def save_sudden_death_wpm_result(
     """
     Store sudden death typing results with the number of correct characters.
     """
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    timestamp = _current_timestamp()
     completed_flag = "1" if completed else "0"
     training_flag = "1" if is_training_run else "0"
     line = (
         f"{timestamp};{wpm:.3f};{correct_characters};"
         f"{duration_seconds:.3f};{completed_flag};{training_flag}\n"
     )
-    ensure_stats_file_header(file_path, SUDDEN_DEATH_TYPING_STATS_FILE_HEADER)
-    with file_path.open("a", encoding="utf-8") as stats_file:
-        stats_file.write(line)
+    _append_stats_line(file_path, SUDDEN_DEATH_TYPING_STATS_FILE_HEADER, line)
 
 
 def save_letter_result(
@@ -111,15 +517,13 @@ def save_letter_result(
     """
     Append the letter mode statistics to the dedicated CSV file.
     """
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    timestamp = _current_timestamp()
     training_flag = "1" if is_training_run else "0"
     line = (
         f"{timestamp};{letters_per_minute:.3f};{error_percentage:.3f};"
         f"{duration_seconds:.3f};{training_flag}\n"
     )
-    ensure_stats_file_header(file_path, LETTER_STATS_FILE_HEADER)
-    with file_path.open("a", encoding="utf-8") as stats_file:
-        stats_file.write(line)
+    _append_stats_line(file_path, LETTER_STATS_FILE_HEADER, line)
 
 
 def save_sudden_death_letter_result(
@@ -133,16 +537,14 @@ def save_sudden_death_letter_result(
     """
     Store sudden death letter mode results.
     """
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    timestamp = _current_timestamp()
     completed_flag = "1" if completed else "0"
     training_flag = "1" if is_training_run else "0"
     line = (
         f"{timestamp};{letters_per_minute:.3f};{correct_letters};"
         f"{duration_seconds:.3f};{completed_flag};{training_flag}\n"
     )
-    ensure_stats_file_header(file_path, SUDDEN_DEATH_LETTER_STATS_FILE_HEADER)
-    with file_path.open("a", encoding="utf-8") as stats_file:
-        stats_file.write(line)
+    _append_stats_line(file_path, SUDDEN_DEATH_LETTER_STATS_FILE_HEADER, line)
 
 
 def save_special_result(
@@ -155,15 +557,13 @@ def save_special_result(
     """
     Append the special character mode statistics to the dedicated CSV file.
     """
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    timestamp = _current_timestamp()
     training_flag = "1" if is_training_run else "0"
     line = (
         f"{timestamp};{symbols_per_minute:.3f};{error_percentage:.3f};"
         f"{duration_seconds:.3f};{training_flag}\n"
     )
-    ensure_stats_file_header(file_path, SPECIAL_STATS_FILE_HEADER)
-    with file_path.open("a", encoding="utf-8") as stats_file:
-        stats_file.write(line)
+    _append_stats_line(file_path, SPECIAL_STATS_FILE_HEADER, line)
 
 
 def save_sudden_death_special_result(
@@ -177,16 +577,14 @@ def save_sudden_death_special_result(
     """
     Store sudden death special mode results.
     """
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    timestamp = _current_timestamp()
     completed_flag = "1" if completed else "0"
     training_flag = "1" if is_training_run else "0"
     line = (
         f"{timestamp};{symbols_per_minute:.3f};{correct_symbols};"
         f"{duration_seconds:.3f};{completed_flag};{training_flag}\n"
     )
-    ensure_stats_file_header(file_path, SUDDEN_DEATH_SPECIAL_STATS_FILE_HEADER)
-    with file_path.open("a", encoding="utf-8") as stats_file:
-        stats_file.write(line)
+    _append_stats_line(file_path, SUDDEN_DEATH_SPECIAL_STATS_FILE_HEADER, line)
 
 
 def save_number_result(
@@ -199,15 +597,13 @@ def save_number_result(
     """
     Append the number mode statistics to the dedicated CSV file.
     """
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    timestamp = _current_timestamp()
     training_flag = "1" if is_training_run else "0"
     line = (
         f"{timestamp};{digits_per_minute:.3f};{error_percentage:.3f};"
         f"{duration_seconds:.3f};{training_flag}\n"
     )
-    ensure_stats_file_header(file_path, NUMBER_STATS_FILE_HEADER)
-    with file_path.open("a", encoding="utf-8") as stats_file:
-        stats_file.write(line)
+    _append_stats_line(file_path, NUMBER_STATS_FILE_HEADER, line)
 
 
 def save_sudden_death_number_result(
@@ -221,16 +617,37 @@ def save_sudden_death_number_result(
     """
     Store sudden death number mode results.
     """
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    timestamp = _current_timestamp()
     completed_flag = "1" if completed else "0"
     training_flag = "1" if is_training_run else "0"
     line = (
         f"{timestamp};{digits_per_minute:.3f};{correct_digits};"
         f"{duration_seconds:.3f};{completed_flag};{training_flag}\n"
     )
-    ensure_stats_file_header(file_path, SUDDEN_DEATH_NUMBER_STATS_FILE_HEADER)
-    with file_path.open("a", encoding="utf-8") as stats_file:
-        stats_file.write(line)
+    _append_stats_line(file_path, SUDDEN_DEATH_NUMBER_STATS_FILE_HEADER, line)
+
+
+def _append_blind_result(
+    file_path: Path,
+    header: str,
+    rate: float,
+    typed_count: int,
+    duration_seconds: float,
+    completed: bool,
+    end_error_percentage: float,
+    is_training_run: bool,
+) -> None:
+    """
+    Format and append one blind mode result line; shared by all blind modes.
+    """
+    completed_flag = "1" if completed else "0"
+    training_flag = "1" if is_training_run else "0"
+    line = (
+        f"{_current_timestamp()};{rate:.3f};{typed_count};"
+        f"{duration_seconds:.3f};{completed_flag};"
+        f"{end_error_percentage:.3f};{training_flag}\n"
+    )
+    _append_stats_line(file_path, header, line)
 
 
 def save_blind_typing_result(
@@ -245,16 +662,16 @@ def save_blind_typing_result(
     """
     Store blind mode typing results with the final error percentage.
     """
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-    completed_flag = "1" if completed else "0"
-    training_flag = "1" if is_training_run else "0"
-    line = (
-        f"{timestamp};{wpm:.3f};{typed_characters};{duration_seconds:.3f};"
-        f"{completed_flag};{end_error_percentage:.3f};{training_flag}\n"
+    _append_blind_result(
+        file_path,
+        BLIND_TYPING_STATS_FILE_HEADER,
+        wpm,
+        typed_characters,
+        duration_seconds,
+        completed,
+        end_error_percentage,
+        is_training_run
     )
-    ensure_stats_file_header(file_path, BLIND_TYPING_STATS_FILE_HEADER)
-    with file_path.open("a", encoding="utf-8") as stats_file:
-        stats_file.write(line)
 
 
 def save_blind_letter_result(
@@ -269,17 +686,16 @@ def save_blind_letter_result(
     """
     Store blind mode letter results including the end-error percentage.
     """
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-    completed_flag = "1" if completed else "0"
-    training_flag = "1" if is_training_run else "0"
-    line = (
-        f"{timestamp};{letters_per_minute:.3f};{typed_letters};"
-        f"{duration_seconds:.3f};{completed_flag};"
-        f"{end_error_percentage:.3f};{training_flag}\n"
+    _append_blind_result(
+        file_path,
+        BLIND_LETTER_STATS_FILE_HEADER,
+        letters_per_minute,
+        typed_letters,
+        duration_seconds,
+        completed,
+        end_error_percentage,
+        is_training_run
     )
-    ensure_stats_file_header(file_path, BLIND_LETTER_STATS_FILE_HEADER)
-    with file_path.open("a", encoding="utf-8") as stats_file:
-        stats_file.write(line)
 
 
 def save_blind_special_result(
@@ -294,17 +710,16 @@ def save_blind_special_result(
     """
     Store blind mode special-character results with final error data.
     """
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-    completed_flag = "1" if completed else "0"
-    training_flag = "1" if is_training_run else "0"
-    line = (
-        f"{timestamp};{symbols_per_minute:.3f};{typed_symbols};"
-        f"{duration_seconds:.3f};{completed_flag};"
-        f"{end_error_percentage:.3f};{training_flag}\n"
+    _append_blind_result(
+        file_path,
+        BLIND_SPECIAL_STATS_FILE_HEADER,
+        symbols_per_minute,
+        typed_symbols,
+        duration_seconds,
+        completed,
+        end_error_percentage,
+        is_training_run
     )
-    ensure_stats_file_header(file_path, BLIND_SPECIAL_STATS_FILE_HEADER)
-    with file_path.open("a", encoding="utf-8") as stats_file:
-        stats_file.write(line)
 
 
 def save_blind_number_result(
@@ -319,14 +734,13 @@ def save_blind_number_result(
     """
     Store blind mode number results with final error data.
     """
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-    completed_flag = "1" if completed else "0"
-    training_flag = "1" if is_training_run else "0"
-    line = (
-        f"{timestamp};{digits_per_minute:.3f};{typed_digits};"
-        f"{duration_seconds:.3f};{completed_flag};"
-        f"{end_error_percentage:.3f};{training_flag}\n"
+    _append_blind_result(
+        file_path,
+        BLIND_NUMBER_STATS_FILE_HEADER,
+        digits_per_minute,
+        typed_digits,
+        duration_seconds,
+        completed,
+        end_error_percentage,
+        is_training_run
     )
-    ensure_stats_file_header(file_path, BLIND_NUMBER_STATS_FILE_HEADER)
-    with file_path.open("a", encoding="utf-8") as stats_file:
-        stats_file.write(line)
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import time
 from datetime import date, datetime, timedelta
-from typing import Any, List
+from typing import Any, Callable, List, Sequence
 
 import tkinter as tk
 from tkinter import messagebox
@@ -16,7 +16,15 @@ import matplotlib.ticker as mticker
 from matplotlib.widgets import Button
 import numpy as np
 
-from .backend import parse_training_flag
+try:
+    import fast_histogram
+except ImportError:
+    fast_histogram = None
+
+from .backend import (
+    flush_stats_writes,
+    load_stats_table,
+)
 from .io_utils import (
     BLIND_LETTER_STATS_FILE_HEADER,
     BLIND_LETTER_STATS_FILE_NAME,
@@ -43,9 +51,67 @@ from .io_utils import (
     SUDDEN_DEATH_TYPING_STATS_FILE_HEADER,
     SUDDEN_DEATH_TYPING_STATS_FILE_NAME,
     TRAINING_FLAG_COLUMN,
-    ensure_stats_file_header,
 )
 
+STATS_JOB_POLL_INTERVAL_MS = 20
+MAX_DAILY_TICK_LABELS = 30
+
+# Column index of the training flag for every stats file header, or None
+# when a header has no such column.
+_TRAINING_FLAG_INDICES: dict[str, int | None] = {
+    header: (
+        header.split(";").index(TRAINING_FLAG_COLUMN)
+        if TRAINING_FLAG_COLUMN in header.split(";")
+        else None
+    )
+    for header in (
+        STATS_FILE_HEADER,
+        LETTER_STATS_FILE_HEADER,
+        SPECIAL_STATS_FILE_HEADER,
+        NUMBER_STATS_FILE_HEADER,
+        SUDDEN_DEATH_TYPING_STATS_FILE_HEADER,
+        SUDDEN_DEATH_LETTER_STATS_FILE_HEADER,
+        SUDDEN_DEATH_SPECIAL_STATS_FILE_HEADER,
+        SUDDEN_DEATH_NUMBER_STATS_FILE_HEADER,
+        BLIND_TYPING_STATS_FILE_HEADER,
+        BLIND_LETTER_STATS_FILE_HEADER,
+        BLIND_SPECIAL_STATS_FILE_HEADER,
+        BLIND_NUMBER_STATS_FILE_HEADER,
+    )
+}
+
+
+
+def _joint_histogram(
+    x_values: np.ndarray,
+    y_values: np.ndarray,
+    bin_count: int,
+    x_range: tuple[float, float],
+    y_range: tuple[float, float]
+) -> np.ndarray:
+    """
+    Count values into bin_count x bin_count uniform bins over the ranges.
+
+    Like np.histogram2d, the last bin of each axis includes its upper edge.
+    """
+    if fast_histogram is None:
+        hist, _, _ = np.histogram2d(
+            x_values,
+            y_values,
+            bins=bin_count,
+            range=[x_range, y_range]
+        )
+        return hist
+    # fast_histogram bins by arithmetic on the uniform edges instead of a
+    # binary search, but excludes the upper edge. Values on it are moved
+    # just below it, which keeps the ranges (and the drawn extent) exact.
+    return fast_histogram.histogram2d(
+        np.minimum(x_values, np.nextafter(x_range[1], -np.inf)),
+        np.minimum(y_values, np.nextafter(y_range[1], -np.inf)),
+        bins=bin_count,
+        range=[x_range, y_range]
+    )
+
 
 class PlotMixin:
     """Shared plotting helpers for TypingTrainerApp."""
@@ -277,23 +343,79 @@ class PlotMixin:
         except Exception:
             pass
 
+    def _flush_stats_writes(self) -> None:
+        """
+        Wait for queued results and report any that could not be saved.
+        """
+        failures = flush_stats_writes()
+        if not failures:
+            return
+        details = "\n".join(
+            f"{file_path.name}: {exc}" for file_path, exc in failures
+        )
+        messagebox.showerror(
+            "Statistics",
+            f"Some results could not be saved:\n{details}"
+        )
+
+    def _run_in_background(
+        self,
+        work: Callable[[], Any],
+        on_done: Callable[[Any], None]
+    ) -> None:
+        """
+        Run work on the statistics worker thread and pass its result to
+        on_done on the Tk thread once it is ready.
+
+        The future is polled with ``after`` because Tk must only be used
+        from the thread that runs the main loop.
+        """
+        future = self._stats_executor.submit(work)
+
+        def _poll() -> None:
+            if not future.done():
+                self.master.after(STATS_JOB_POLL_INTERVAL_MS, _poll)
+                return
+            on_done(future.result())
+
+        _poll()
+
+    def _get_stats_figure(self, label: str) -> plt.Figure:
+        """
+        Return a cleared figure for the given statistics view.
+
+        A window that is still open from an earlier call is reused so that
+        repeated views skip creating and placing a new Tk window.
+        """
+        reuse = plt.fignum_exists(label)
+        fig = plt.figure(num=label, figsize=(12, 10), clear=True)
+        if not reuse:
+            self._configure_figure_window(fig)
+        return fig
+
     def _draw_joint_heatmap(
         self,
         *,
         fig: plt.Figure,
         ax: plt.Axes,
-        x_values: list[float],
-        y_values: list[float],
+        x_values: Sequence[float],
+        y_values: Sequence[float],
         x_label: str,
         y_label: str,
         title: str,
-        palette: dict[str, Any]
+        palette: dict[str, Any],
+        x_bin_edges: np.ndarray | None = None,
+        y_bin_edges: np.ndarray | None = None
     ) -> None:
         """
         Draw a square joint heatmap with a shared bin count on both axes.
+
+        ``x_bin_edges``/``y_bin_edges`` may pass "auto" edges the caller has
+        already computed for exactly the same values, so they are not
+        estimated a second time.
         """
         ax.set_title(title)
-        if not x_values or not y_values:
+        if len(x_values) == 0 or len(y_values) == 0:
             ax.text(
                 0.5,
                 0.5,
@@ -326,16 +448,10 @@ class PlotMixin:
             ax.set_yticks([])
             return
 
-        x_edges = np.histogram_bin_edges(x_arr, bins="auto")
-        y_edges = np.histogram_bin_edges(y_arr, bins="auto")
-        bin_count = int(max(len(x_edges), len(y_edges)) - 1)
-        if bin_count < 1:
-            bin_count = 1
-
-        x_min = float(np.nanmin(x_arr))
-        x_max = float(np.nanmax(x_arr))
-        y_min = float(np.nanmin(y_arr))
-        y_max = float(np.nanmax(y_arr))
+        x_min = float(x_arr.min())
+        x_max = float(x_arr.max())
+        y_min = float(y_arr.min())
+        y_max = float(y_arr.max())
         if x_min == x_max:
             x_min -= 1.0
             x_max += 1.0
@@ -343,12 +459,23 @@ class PlotMixin:
             y_min -= 1.0
             y_max += 1.0
 
-        xedges = np.linspace(x_min, x_max, bin_count + 1)
-        yedges = np.linspace(y_min, y_max, bin_count + 1)
-        hist, xedges, yedges = np.histogram2d(
+        bin_count = 1
+        if x_arr.size > 1:
+            # Only the bin counts of the "auto" estimate are needed; the
+            # edges themselves are produced once by histogram2d below.
+            if x_bin_edges is None:
+                x_bin_edges = np.histogram_bin_edges(x_arr, bins="auto")
+            if y_bin_edges is None:
+                y_bin_edges = np.histogram_bin_edges(y_arr, bins="auto")
+            bin_count = max(len(x_bin_edges), len(y_bin_edges)) - 1
+            bin_count = max(bin_count, 1)
+
+        hist = _joint_histogram(
             x_arr,
             y_arr,
-            bins=[xedges, yedges]
+            bin_count,
+            (x_min, x_max),
+            (y_min, y_max)
         )
         cmap = mcolors.LinearSegmentedColormap.from_list(
             "joint_heatmap",
@@ -357,12 +484,15 @@ class PlotMixin:
                 palette["heatmap_high_color"]
             ]
         )
-        im = ax.pcolormesh(
-            xedges,
-            yedges,
+        # The bins are uniform, so a single image is enough; it draws much
+        # faster than a mesh of one quadrilateral per bin.
+        im = ax.imshow(
             hist.T,
-            cmap=cmap,
-            shading="auto"
+            origin="lower",
+            extent=(x_min, x_max, y_min, y_max),
+            aspect="auto",
+            interpolation="nearest",
+            cmap=cmap
         )
         ax.set_xlim(x_min, x_max)
         ax.set_ylim(y_min, y_max)
@@ -376,181 +506,171 @@ class PlotMixin:
         ax.set_xlabel(x_label)
         ax.set_ylabel(y_label)
 
-    def _show_sudden_death_stats(
+    @staticmethod
+    def _aggregate_by_day(
+        days: np.ndarray,
+        value_columns: list[np.ndarray]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sum each value column per day, ignoring NaN values and undated rows.
+
+        Only days with at least one entry are returned, in ascending order.
+
+        :return: The days plus per-column sums and counts, each shaped
+            (len(value_columns), len(days)).
+        """
+        dated = ~np.isnat(days)
+        stat_days, day_index = np.unique(days[dated], return_inverse=True)
+        day_count = len(stat_days)
+        sums = np.zeros((len(value_columns), day_count))
+        counts = np.zeros((len(value_columns), day_count))
+        for row, values in enumerate(value_columns):
+            values = values[dated]
+            valid = ~np.isnan(values)
+            sums[row] = np.bincount(
+                day_index[valid],
+                weights=values[valid],
+                minlength=day_count
+            )
+            counts[row] = np.bincount(day_index[valid], minlength=day_count)
+        return stat_days, sums, counts
+
+    @staticmethod
+    def _set_daily_ticks(
+        ax: plt.Axes,
+        positions: np.ndarray,
+        labels: np.ndarray
+    ) -> None:
+        """
+        Label the x axis of a per-day plot with the given datetime64 days.
+
+        At most MAX_DAILY_TICK_LABELS days get a label, to avoid laying out
+        hundreds of overlapping tick texts on long histories.
+        """
+        tick_step = -(-len(positions) // MAX_DAILY_TICK_LABELS)
+        ax.set_xticks(
+            positions[::tick_step],
+            labels=np.datetime_as_string(labels[::tick_step], unit="D"),
+            rotation=45,
+            ha="right"
+        )
+
+    def _render_stats_figure(
         self,
         *,
-        file_path: Path,
-        header: str,
-        mode_label: str,
+        title: str,
+        days: np.ndarray,
+        speed_values: np.ndarray,
+        second_values: np.ndarray,
+        duration_values: np.ndarray,
         speed_label: str,
+        speed_hist_title: str,
         speed_short_label: str,
-        correct_label: str
+        second_label: str,
+        second_hist_title: str,
+        second_color_key: str,
+        second_empty_text: str,
+        second_daily_label: str,
+        joint_x_label: str,
+        joint_title: str,
+        daily_title: str
     ) -> None:
         """
-        Shared visualization helper for sudden death statistics across modes.
+        Draw a stats figure with speed and second-value histograms, their
+        joint heatmap, daily averages and the time spent per day.
+
+        ``second_values`` is the error percentage or correct character count
+        of each run. Runs without one (NaN) still count towards the speed
+        histogram and the daily averages but not the other two plots.
         """
-        title = f"Sudden death {mode_label} statistics"
-        if not file_path.exists():
-            messagebox.showinfo(
-                title,
-                f"No sudden death {mode_label} statistics available yet. "
-                "Finish at least one sudden death run."
-            )
-            return
+        has_second = ~np.isnan(second_values)
+        second_rates = second_values[has_second]
 
-        ensure_stats_file_header(
-            file_path,
-            header,
-            create_if_missing=False
+        daily_dates, sums, counts = self._aggregate_by_day(
+            days,
+            [speed_values, second_values, np.maximum(duration_values, 0.0)]
         )
-
-        speed_values: List[float] = []
-        correct_counts: List[float] = []
-        daily_stats: dict = {}
-
-        with file_path.open("r", encoding="utf-8") as file:
-            for line in file:
-                parts = line.strip().split(";")
-                if len(parts) < 6:
-                    continue
-                is_training_run = parse_training_flag(parts, 5)
-                if not self._should_include_training_entry(is_training_run):
-                    continue
-                try:
-                    speed_val = float(parts[1])
-                    correct_val = float(parts[2])
-                except ValueError:
-                    continue
-                try:
-                    day = datetime.strptime(
-                        parts[0],
-                        "%Y-%m-%d %H:%M:%S"
-                    ).date()
-                except ValueError:
-                    day = None
-                duration_val: float | None = None
-                if len(parts) >= 4:
-                    try:
-                        duration_val = float(parts[3])
-                    except ValueError:
-                        duration_val = None
-
-                speed_values.append(speed_val)
-                correct_counts.append(correct_val)
-                if day is not None:
-                    entry = daily_stats.setdefault(
-                        day,
-                        {
-                            "speed_sum": 0.0,
-                            "speed_count": 0,
-                            "correct_sum": 0.0,
-                            "correct_count": 0,
-                            "duration_sum": 0.0,
-                        }
-                    )
-                    entry["speed_sum"] += speed_val
-                    entry["speed_count"] += 1
-                    entry["correct_sum"] += correct_val
-                    entry["correct_count"] += 1
-                    if duration_val is not None:
-                        entry["duration_sum"] += max(duration_val, 0.0)
-
-        if not speed_values:
-            messagebox.showinfo(
-                title,
-                "No statistics available for the current filter selection."
-            )
-            return
-
-        daily_dates: List[date] = []
-        daily_speed: List[float] = []
-        daily_correct: List[float] = []
-        daily_duration_minutes: List[float] = []
-        if daily_stats:
-            start_date = min(daily_stats)
-            end_date = max(datetime.now().date(), start_date)
-            current_day = start_date
-            while current_day <= end_date:
-                daily_dates.append(current_day)
-                stats = daily_stats.get(current_day)
-                if stats:
-                    daily_speed.append(stats["speed_sum"] / stats["speed_count"])
-                    daily_correct.append(
-                        stats["correct_sum"] / stats["correct_count"]
-                    )
-                    daily_duration_minutes.append(
-                        stats.get("duration_sum", 0.0) / 60.0
-                    )
-                else:
-                    daily_speed.append(0.0)
-                    daily_correct.append(0.0)
-                    daily_duration_minutes.append(0.0)
-                current_day += timedelta(days=1)
+        daily_speed = np.divide(
+            sums[0],
+            counts[0],
+            out=np.zeros(len(daily_dates)),
+            where=counts[0] > 0
+        )
+        daily_second = np.divide(
+            sums[1],
+            counts[1],
+            out=np.zeros(len(daily_dates)),
+            where=counts[1] > 0
+        )
+        daily_duration_minutes = sums[2] / 60.0
 
         palette = self._get_plot_palette()
-        fig = plt.figure(figsize=(12, 10))
-        self._configure_figure_window(fig)
+        fig = self._get_stats_figure(title)
         grid_spec = fig.add_gridspec(4, 2, height_ratios=[1.0, 1.2, 1.0, 0.8])
         grid_spec.update(hspace=0.75, wspace=0.4)
 
         ax_speed = fig.add_subplot(grid_spec[0, 0])
-        ax_correct = fig.add_subplot(grid_spec[0, 1])
+        ax_second = fig.add_subplot(grid_spec[0, 1])
         ax_joint = fig.add_subplot(grid_spec[1, :])
         ax_time = fig.add_subplot(grid_spec[2, :])
         ax_time_spent = fig.add_subplot(grid_spec[3, :])
         ax_time_spent_right = ax_time_spent.twinx()
 
+        speed_edges = np.histogram_bin_edges(speed_values, bins="auto")
+        second_edges = np.histogram_bin_edges(second_rates, bins="auto")
         ax_speed.hist(
             speed_values,
-            bins="auto",
+            bins=speed_edges,
             color=palette["hist_speed_color"],
             edgecolor=palette["axes_facecolor"],
             alpha=0.85
         )
-        ax_speed.set_title(f"{speed_label} distribution")
+        ax_speed.set_title(speed_hist_title)
         ax_speed.set_xlabel(speed_label)
         ax_speed.set_ylabel("Frequency")
 
-        if correct_counts:
-            ax_correct.hist(
-                correct_counts,
-                bins="auto",
-                color=palette["hist_correct_color"],
+        ax_second.set_title(second_hist_title)
+        if second_rates.size > 0:
+            ax_second.hist(
+                second_rates,
+                bins=second_edges,
+                color=palette[second_color_key],
                 edgecolor=palette["axes_facecolor"],
                 alpha=0.85
             )
-            ax_correct.set_title(f"{correct_label} distribution")
-            ax_correct.set_xlabel(correct_label)
-            ax_correct.set_ylabel("Frequency")
+            ax_second.set_xlabel(second_label)
+            ax_second.set_ylabel("Frequency")
         else:
-            ax_correct.set_title(f"{correct_label} distribution")
-            ax_correct.text(
+            ax_second.text(
                 0.5,
                 0.5,
-                "No data available",
+                second_empty_text,
                 ha="center",
                 va="center",
-                transform=ax_correct.transAxes,
+                transform=ax_second.transAxes,
                 color=palette["text_color"]
             )
-            ax_correct.set_xticks([])
-            ax_correct.set_yticks([])
+            ax_second.set_xticks([])
+            ax_second.set_yticks([])
 
+        # The speed edges only fit the joint heatmap when no run was dropped
+        # from it for a missing second value.
         self._draw_joint_heatmap(
             fig=fig,
             ax=ax_joint,
-            x_values=speed_values,
-            y_values=correct_counts,
-            x_label=speed_short_label,
-            y_label=correct_label,
-            title=(
-                f"Joint {speed_short_label} / "
-                f"{correct_label.lower()} distribution"
-            ),
-            palette=palette
+            x_values=speed_values[has_second],
+            y_values=second_rates,
+            x_label=joint_x_label,
+            y_label=second_label,
+            title=joint_title,
+            palette=palette,
+            x_bin_edges=speed_edges if has_second.all() else None,
+            y_bin_edges=second_edges
         )
 
-        if daily_dates:
+        ax_time.set_title(daily_title)
+        ax_time_spent.set_title("Time spent per day")
+        if daily_dates.size > 0:
             positions = np.arange(len(daily_dates))
             bar_width = 0.25
             ax_time.bar(
@@ -562,10 +682,10 @@ class PlotMixin:
             )
             ax_time.bar(
                 positions,
-                daily_correct,
+                daily_second,
                 width=bar_width,
                 color=palette["daily_error_color"],
-                label=f"Average {correct_label.lower()}"
+                label=second_daily_label
             )
             ax_time.bar(
                 positions + bar_width,
@@ -574,26 +694,11 @@ class PlotMixin:
                 color=palette["daily_duration_color"],
                 label="Total time (min)"
             )
-            formatted_days = [day.strftime("%Y-%m-%d") for day in daily_dates]
-            ax_time.set_xticks(positions)
-            ax_time.set_xticklabels(
-                formatted_days,
-                rotation=45,
-                ha="right"
-            )
+            self._set_daily_ticks(ax_time, positions, daily_dates)
             ax_time.set_ylabel("Daily averages / total time")
-            ax_time.set_title(
-                f"Daily averages ({speed_short_label} vs {correct_label.lower()})"
-            )
             legend = ax_time.legend()
             self._style_legend(legend, palette)
 
-            cumulative_duration_minutes: List[float] = []
-            running_total = 0.0
-            for minutes in daily_duration_minutes:
-                running_total += minutes
-                cumulative_duration_minutes.append(running_total)
-
             ax_time_spent.bar(
                 positions,
                 daily_duration_minutes,
@@ -603,22 +708,16 @@ class PlotMixin:
             )
             ax_time_spent_right.plot(
                 positions,
-                cumulative_duration_minutes,
+                np.cumsum(daily_duration_minutes),
                 color=palette["time_cumulative_line_color"],
                 marker="o",
                 markerfacecolor=palette["axes_facecolor"],
                 markeredgecolor=palette["time_cumulative_line_color"],
                 label="Cumulative time (min)"
             )
-            ax_time_spent.set_xticks(positions)
-            ax_time_spent.set_xticklabels(
-                formatted_days,
-                rotation=45,
-                ha="right"
-            )
+            self._set_daily_ticks(ax_time_spent, positions, daily_dates)
             ax_time_spent.set_ylabel("Daily time (min)")
             ax_time_spent_right.set_ylabel("Cumulative time (min)")
-            ax_time_spent.set_title("Time spent per day")
             handles, labels = ax_time_spent.get_legend_handles_labels()
             handles2, labels2 = ax_time_spent_right.get_legend_handles_labels()
             legend = ax_time_spent.legend(
@@ -628,33 +727,19 @@ class PlotMixin:
             )
             self._style_legend(legend, palette)
         else:
-            ax_time.set_title(
-                f"Daily averages ({speed_short_label} vs {correct_label.lower()})"
-            )
-            ax_time.text(
-                0.5,
-                0.5,
-                "No dated entries available",
-                ha="center",
-                va="center",
-                transform=ax_time.transAxes,
-                color=palette["text_color"]
-            )
-            ax_time.set_xticks([])
-            ax_time.set_yticks([])
-            ax_time_spent.set_title("Time spent per day")
-            ax_time_spent.text(
-                0.5,
-                0.5,
-                "No dated entries available",
-                ha="center",
-                va="center",
-                transform=ax_time_spent.transAxes,
-                color=palette["text_color"]
-            )
-            ax_time_spent.set_xticks([])
-            ax_time_spent.set_yticks([])
-        ax_time_spent_right.set_yticks([])
+            for ax in (ax_time, ax_time_spent):
+                ax.text(
+                    0.5,
+                    0.5,
+                    "No dated entries available",
+                    ha="center",
+                    va="center",
+                    transform=ax.transAxes,
+                    color=palette["text_color"]
+                )
+                ax.set_xticks([])
+                ax.set_yticks([])
+            ax_time_spent_right.set_yticks([])
 
         formatter = mticker.FormatStrFormatter("%.1f")
         ax_time_spent.yaxis.set_major_formatter(formatter)
@@ -664,6 +749,97 @@ class PlotMixin:
         plt.tight_layout(pad=1.3)
         plt.show()
 
+    def _show_sudden_death_stats(
+        self,
+        *,
+        file_path: Path,
+        header: str,
+        mode_label: str,
+        speed_label: str,
+        speed_short_label: str,
+        correct_label: str
+    ) -> None:
+        """
+        Shared visualization helper for sudden death statistics across modes.
+        """
+        title = f"Sudden death {mode_label} statistics"
+        if not file_path.exists():
+            messagebox.showinfo(
+                title,
+                f"No sudden death {mode_label} statistics available yet. "
+                "Finish at least one sudden death run."
+            )
+            return
+
+        self._run_in_background(
+            lambda: load_stats_table(
+                file_path,
+                header,
+                value_columns=[1, 2, 3],
+                flag_index=5,
+                min_fields=6
+            ),
+            lambda table: self._render_sudden_death_stats(
+                table,
+                title=title,
+                speed_label=speed_label,
+                speed_short_label=speed_short_label,
+                correct_label=correct_label
+            )
+        )
+
+    def _render_sudden_death_stats(
+        self,
+        table: tuple[np.ndarray, np.ndarray, np.ndarray],
+        *,
+        title: str,
+        speed_label: str,
+        speed_short_label: str,
+        correct_label: str
+    ) -> None:
+        """
+        Draw the sudden death statistics figure from a loaded stats table.
+        """
+        days, values, training = table
+        keep = (
+            self._training_filter_mask(training)
+            & ~np.isnan(values[:, 0])
+            & ~np.isnan(values[:, 1])
+        )
+        speed_values, correct_counts, duration_values = values[keep].T
+
+        if speed_values.size == 0:
+            messagebox.showinfo(
+                title,
+                "No statistics available for the current filter selection."
+            )
+            return
+
+        self._render_stats_figure(
+            title=title,
+            days=days[keep],
+            speed_values=speed_values,
+            second_values=correct_counts,
+            duration_values=duration_values,
+            speed_label=speed_label,
+            speed_hist_title=f"{speed_label} distribution",
+            speed_short_label=speed_short_label,
+            second_label=correct_label,
+            second_hist_title=f"{correct_label} distribution",
+            second_color_key="hist_correct_color",
+            second_empty_text="No data available",
+            second_daily_label=f"Average {correct_label.lower()}",
+            joint_x_label=speed_short_label,
+            joint_title=(
+                f"Joint {speed_short_label} / "
+                f"{correct_label.lower()} distribution"
+            ),
+            daily_title=(
+                f"Daily averages ({speed_short_label} vs "
+                f"{correct_label.lower()})"
+            )
+        )
+
     def _show_blind_stats(
         self,
         *,
@@ -685,1185 +861,319 @@ class PlotMixin:
             )
             return
 
-        ensure_stats_file_header(
-            file_path,
-            header,
-            create_if_missing=False
+        self._run_in_background(
+            lambda: load_stats_table(
+                file_path,
+                header,
+                value_columns=[1, 5, 3],
+                flag_index=6,
+                min_fields=6
+            ),
+            lambda table: self._render_blind_stats(
+                table,
+                title=title,
+                speed_label=speed_label,
+                speed_short_label=speed_short_label
+            )
         )
 
-        speed_values: List[float] = []
-        error_rates: List[float] = []
-        speed_for_3d: List[float] = []
-        error_for_3d: List[float] = []
-        daily_stats: dict = {}
-
-        with file_path.open("r", encoding="utf-8") as file:
-            for line in file:
-                line = line.strip()
-                if not line:
-                    continue
-                parts = line.split(";")
-                if len(parts) < 6:
-                    continue
-                is_training_run = parse_training_flag(parts, 6)
-                if not self._should_include_training_entry(is_training_run):
-                    continue
-                try:
-                    day = datetime.strptime(
-                        parts[0],
-                        "%Y-%m-%d %H:%M:%S"
-                    ).date()
-                except ValueError:
-                    day = None
-                try:
-                    speed_val = float(parts[1])
-                except ValueError:
-                    continue
-                speed_values.append(speed_val)
-
-                err_val: float | None = None
-                if len(parts) >= 6:
-                    try:
-                        err_val = float(parts[5])
-                    except ValueError:
-                        err_val = None
-                    if err_val is not None:
-                        error_rates.append(err_val)
-                        speed_for_3d.append(speed_val)
-                        error_for_3d.append(err_val)
-
-                duration_val: float | None = None
-                if len(parts) >= 4:
-                    try:
-                        duration_val = float(parts[3])
-                    except ValueError:
-                        duration_val = None
-
-                if day is not None:
-                    entry = daily_stats.setdefault(
-                        day,
-                        {
-                            "speed_sum": 0.0,
-                            "speed_count": 0,
-                            "error_sum": 0.0,
-                            "error_count": 0,
-                            "duration_sum": 0.0,
-                        }
-                    )
-                    entry["speed_sum"] += speed_val
-                    entry["speed_count"] += 1
-                    if err_val is not None:
-                        entry["error_sum"] += err_val
-                        entry["error_count"] += 1
-                    if duration_val is not None:
-                        entry["duration_sum"] += max(duration_val, 0.0)
-
-        if not speed_values:
+    def _render_blind_stats(
+        self,
+        table: tuple[np.ndarray, np.ndarray, np.ndarray],
+        *,
+        title: str,
+        speed_label: str,
+        speed_short_label: str
+    ) -> None:
+        """
+        Draw the blind mode statistics figure from a loaded stats table.
+        """
+        days, values, training = table
+        keep = self._training_filter_mask(training) & ~np.isnan(values[:, 0])
+        speed_values, error_values, duration_values = values[keep].T
+
+        if speed_values.size == 0:
             messagebox.showinfo(
                 title,
                 "No statistics available for the current filter selection."
             )
             return
 
-        daily_dates: List[date] = []
-        daily_speed: List[float] = []
-        daily_error: List[float] = []
-        daily_duration_minutes: List[float] = []
-        if daily_stats:
-            start_date = min(daily_stats)
-            end_date = max(datetime.now().date(), start_date)
-            current_day = start_date
-            while current_day <= end_date:
-                daily_dates.append(current_day)
-                stats = daily_stats.get(current_day)
-                if stats:
-                    daily_speed.append(stats["speed_sum"] / stats["speed_count"])
-                    if stats["error_count"] > 0:
-                        daily_error.append(
-                            stats["error_sum"] / stats["error_count"]
-                        )
-                    else:
-                        daily_error.append(0.0)
-                    daily_duration_minutes.append(
-                        stats.get("duration_sum", 0.0) / 60.0
-                    )
-                else:
-                    daily_speed.append(0.0)
-                    daily_error.append(0.0)
-                    daily_duration_minutes.append(0.0)
-                current_day += timedelta(days=1)
+        self._render_stats_figure(
+            title=title,
+            days=days[keep],
+            speed_values=speed_values,
+            second_values=error_values,
+            duration_values=duration_values,
+            speed_label=speed_label,
+            speed_hist_title=f"{speed_label} distribution",
+            speed_short_label=speed_short_label,
+            second_label="End error percentage (%)",
+            second_hist_title="End error percentage distribution",
+            second_color_key="hist_error_color",
+            second_empty_text="No end error data available",
+            second_daily_label="Average end error %",
+            joint_x_label=speed_short_label,
+            joint_title=f"Joint {speed_short_label} / end error distribution",
+            daily_title=f"Daily averages ({speed_short_label} vs end error %)"
+        )
 
-        palette = self._get_plot_palette()
-        fig = plt.figure(figsize=(12, 10))
-        self._configure_figure_window(fig)
-        grid_spec = fig.add_gridspec(4, 2, height_ratios=[1.0, 1.2, 1.0, 0.8])
-        grid_spec.update(hspace=0.75, wspace=0.4)
+    def show_stats(self) -> None:
+        """
+        Show histograms of WPM, error percentage, and a 2D joint heatmap
+        in a single Matplotlib figure.
 
-        ax_speed = fig.add_subplot(grid_spec[0, 0])
-        ax_error = fig.add_subplot(grid_spec[0, 1])
-        ax_joint = fig.add_subplot(grid_spec[1, :])
-        ax_time = fig.add_subplot(grid_spec[2, :])
-        ax_time_spent = fig.add_subplot(grid_spec[3, :])
-        ax_time_spent_right = ax_time_spent.twinx()
+        If no statistics file exists or no valid values can be read, an
+        information dialog is shown instead.
+        """
+        self._flush_stats_writes()
+        if self.is_blind_mode_active():
+            self._show_blind_stats(
+                file_path=self.blind_typing_stats_file_path,
+                header=BLIND_TYPING_STATS_FILE_HEADER,
+                mode_label="typing",
+                speed_label="Words per minute",
+                speed_short_label="WPM"
+            )
+            return
 
-        ax_speed.hist(
-            speed_values,
-            bins="auto",
-            color=palette["hist_speed_color"],
-            edgecolor=palette["axes_facecolor"],
-            alpha=0.85
-        )
-        ax_speed.set_title(f"{speed_label} distribution")
-        ax_speed.set_xlabel(speed_label)
-        ax_speed.set_ylabel("Frequency")
+        if self.is_sudden_death_active():
+            self._show_sudden_death_stats(
+                file_path=self.sudden_death_typing_stats_file_path,
+                header=SUDDEN_DEATH_TYPING_STATS_FILE_HEADER,
+                mode_label="typing",
+                speed_label="Words per minute",
+                speed_short_label="WPM",
+                correct_label="Correct characters"
+            )
+            return
 
-        if error_rates:
-            ax_error.hist(
-                error_rates,
-                bins="auto",
-                color=palette["hist_error_color"],
-                edgecolor=palette["axes_facecolor"],
-                alpha=0.85
+        if not self.stats_file_path.exists():
+            messagebox.showinfo(
+                "Statistics",
+                "No statistics file found yet. "
+                "Finish at least one session."
             )
-            ax_error.set_title("End error percentage distribution")
-            ax_error.set_xlabel("End error percentage (%)")
-            ax_error.set_ylabel("Frequency")
-        else:
-            ax_error.set_title("End error percentage distribution")
-            ax_error.text(
-                0.5,
-                0.5,
-                "No end error data available",
-                ha="center",
-                va="center",
-                transform=ax_error.transAxes,
-                color=palette["text_color"]
+            return
+
+        self._run_in_background(
+            lambda: load_stats_table(
+                self.stats_file_path,
+                STATS_FILE_HEADER,
+                value_columns=[1, 2, 3],
+                flag_index=4,
+                min_fields=2
+            ),
+            self._render_typing_stats
+        )
+
+    def _render_typing_stats(
+        self,
+        table: tuple[np.ndarray, np.ndarray, np.ndarray]
+    ) -> None:
+        """
+        Draw the typing statistics figure from a loaded stats table.
+        """
+        days, values, training = table
+        keep = self._training_filter_mask(training) & ~np.isnan(values[:, 0])
+        wpm_values, error_values, duration_values = values[keep].T
+
+        if wpm_values.size == 0:
+            messagebox.showinfo(
+                "Statistics",
+                "No statistics available for the current filter selection.",
             )
-            ax_error.set_xticks([])
-            ax_error.set_yticks([])
+            return
 
-        self._draw_joint_heatmap(
-            fig=fig,
-            ax=ax_joint,
-            x_values=speed_for_3d,
-            y_values=error_for_3d,
-            x_label=speed_short_label,
-            y_label="End error percentage (%)",
-            title=f"Joint {speed_short_label} / end error distribution",
-            palette=palette
+        self._render_stats_figure(
+            title="Typing statistics",
+            days=days[keep],
+            speed_values=wpm_values,
+            second_values=error_values,
+            duration_values=duration_values,
+            speed_label="Words per minute",
+            speed_hist_title="WPM distribution",
+            speed_short_label="WPM",
+            second_label="Error percentage (%)",
+            second_hist_title="Error percentage distribution",
+            second_color_key="hist_error_color",
+            second_empty_text="No error-rate data available",
+            second_daily_label="Average error %",
+            joint_x_label="WPM",
+            joint_title="Joint WPM / error percentage distribution",
+            daily_title="Daily averages (WPM vs error %)"
         )
 
-        if daily_dates:
-            positions = np.arange(len(daily_dates))
-            bar_width = 0.25
-            ax_time.bar(
-                positions - bar_width,
-                daily_speed,
-                width=bar_width,
-                color=palette["daily_speed_color"],
-                label=f"Average {speed_short_label}"
+    def _show_mode_stats(
+        self,
+        *,
+        file_path: Path,
+        header: str,
+        title: str,
+        speed_label: str,
+        speed_short_label: str,
+        joint_title: str
+    ) -> None:
+        """
+        Shared visualization helper for letter, special and number statistics.
+        """
+        self._run_in_background(
+            lambda: load_stats_table(
+                file_path,
+                header,
+                value_columns=[1, 2, 3],
+                flag_index=4,
+                min_fields=3
+            ),
+            lambda table: self._render_mode_stats(
+                table,
+                title=title,
+                speed_label=speed_label,
+                speed_short_label=speed_short_label,
+                joint_title=joint_title
             )
-            ax_time.bar(
-                positions,
-                daily_error,
-                width=bar_width,
-                color=palette["daily_error_color"],
-                label="Average end error %"
-            )
-            ax_time.bar(
-                positions + bar_width,
-                daily_duration_minutes,
-                width=bar_width,
-                color=palette["daily_duration_color"],
-                label="Total time (min)"
-            )
-            formatted_days = [day.strftime("%Y-%m-%d") for day in daily_dates]
-            ax_time.set_xticks(positions)
-            ax_time.set_xticklabels(
-                formatted_days,
-                rotation=45,
-                ha="right"
-            )
-            ax_time.set_ylabel("Daily averages / total time")
-            ax_time.set_title(
-                f"Daily averages ({speed_short_label} vs end error %)"
-            )
-            legend = ax_time.legend()
-            self._style_legend(legend, palette)
-
-            cumulative_duration_minutes: List[float] = []
-            cumulative_total = 0.0
-            for minutes in daily_duration_minutes:
-                cumulative_total += minutes
-                cumulative_duration_minutes.append(cumulative_total)
-
-            ax_time_spent.bar(
-                positions,
-                daily_duration_minutes,
-                width=0.6,
-                color=palette["time_per_day_bar_color"],
-                label="Time per day (min)"
-            )
-            ax_time_spent_right.plot(
-                positions,
-                cumulative_duration_minutes,
-                color=palette["time_cumulative_line_color"],
-                marker="o",
-                markerfacecolor=palette["axes_facecolor"],
-                markeredgecolor=palette["time_cumulative_line_color"],
-                linewidth=1.8,
-                label="Cumulative time (min)"
-            )
-            ax_time_spent.set_xticks(positions)
-            ax_time_spent.set_xticklabels(
-                formatted_days,
-                rotation=45,
-                ha="right"
-            )
-            ax_time_spent.set_ylabel("Time per day (min)")
-            ax_time_spent_right.set_ylabel("Cumulative time (min)")
-            ax_time_spent.set_title("Time spent per day")
-            handles, labels = ax_time_spent.get_legend_handles_labels()
-            handles2, labels2 = ax_time_spent_right.get_legend_handles_labels()
-            legend = ax_time_spent.legend(
-                handles + handles2,
-                labels + labels2,
-                loc="upper left",
-                frameon=False
-            )
-            self._style_legend(legend, palette)
-        else:
-            ax_time.text(
-                0.5,
-                0.5,
-                "No dated entries available",
-                ha="center",
-                va="center",
-                transform=ax_time.transAxes,
-                color=palette["text_color"]
-            )
-            ax_time.set_xticks([])
-            ax_time.set_yticks([])
-            ax_time_spent.set_title("Time spent per day")
-            ax_time_spent.text(
-                0.5,
-                0.5,
-                "No dated entries available",
-                ha="center",
-                va="center",
-                transform=ax_time_spent.transAxes,
-                color=palette["text_color"]
-            )
-            ax_time_spent.set_xticks([])
-            ax_time_spent.set_yticks([])
-            ax_time_spent_right.set_yticks([])
-
-        formatter = mticker.FormatStrFormatter("%.1f")
-        ax_time_spent.yaxis.set_major_formatter(formatter)
-        ax_time_spent_right.yaxis.set_major_formatter(formatter)
-
-        self._apply_plot_theme(fig, palette)
-        plt.tight_layout(pad=1.3)
-        plt.show()
+        )
 
-    def show_stats(self) -> None:
+    def _render_mode_stats(
+        self,
+        table: tuple[np.ndarray, np.ndarray, np.ndarray],
+        *,
+        title: str,
+        speed_label: str,
+        speed_short_label: str,
+        joint_title: str
+    ) -> None:
         """
-        Show histograms of WPM, error percentage, and a 2D joint heatmap
-        in a single Matplotlib figure.
+        Draw the letter, special or number statistics figure.
 
-        If no statistics file exists or no valid values can be read, an
-        information dialog is shown instead.
+        Rows need a valid timestamp, speed and error percentage.
         """
-        if self.is_blind_mode_active():
-            self._show_blind_stats(
-                file_path=self.blind_typing_stats_file_path,
-                header=BLIND_TYPING_STATS_FILE_HEADER,
-                mode_label="typing",
-                speed_label="Words per minute",
-                speed_short_label="WPM"
-            )
-            return
-
-        if self.is_sudden_death_active():
-            self._show_sudden_death_stats(
-                file_path=self.sudden_death_typing_stats_file_path,
-                header=SUDDEN_DEATH_TYPING_STATS_FILE_HEADER,
-                mode_label="typing",
-                speed_label="Words per minute",
-                speed_short_label="WPM",
-                correct_label="Correct characters"
-            )
-            return
-
-        if not self.stats_file_path.exists():
-            messagebox.showinfo(
-                "Statistics",
-                "No statistics file found yet. "
-                "Finish at least one session."
-            )
-            return
-
-        ensure_stats_file_header(
-            self.stats_file_path,
-            STATS_FILE_HEADER,
-            create_if_missing=False
+        days, values, training = table
+        keep = (
+            self._training_filter_mask(training)
+            & ~np.isnat(days)
+            & ~np.isnan(values[:, 0])
+            & ~np.isnan(values[:, 1])
         )
+        speed_values, error_values, duration_values = values[keep].T
 
-        wpm_values: List[float] = []
-        error_rates: List[float] = []
-        wpm_for_3d: List[float] = []
-        error_for_3d: List[float] = []
-        daily_stats: dict = {}
-
-        with self.stats_file_path.open("r", encoding="utf-8") as stats_file:
-            for line in stats_file:
-                line = line.strip()
-                if not line:
-                    continue
-                parts = line.split(";")
-                if len(parts) < 2:
-                    continue
-                is_training_run = parse_training_flag(parts, 4)
-                if not self._should_include_training_entry(is_training_run):
-                    continue
-
-                try:
-                    day = datetime.strptime(parts[0], "%Y-%m-%d %H:%M:%S").date()
-                except ValueError:
-                    day = None
-
-                try:
-                    wpm_val = float(parts[1])
-                except ValueError:
-                    continue
-                wpm_values.append(wpm_val)
-
-                err_val: float | None = None
-                if len(parts) >= 3:
-                    try:
-                        err_val = float(parts[2])
-                    except ValueError:
-                        err_val = None
-                    if err_val is not None:
-                        error_rates.append(err_val)
-                        wpm_for_3d.append(wpm_val)
-                        error_for_3d.append(err_val)
-
-                duration_val: float | None = None
-                if len(parts) >= 4:
-                    try:
-                        duration_val = float(parts[3])
-                    except ValueError:
-                        duration_val = None
-
-                if day is not None:
-                    entry = daily_stats.setdefault(
-                        day,
-                        {
-                            "wpm_sum": 0.0,
-                            "wpm_count": 0,
-                            "error_sum": 0.0,
-                            "error_count": 0,
-                            "duration_sum": 0.0,
-                        }
-                    )
-                    entry["wpm_sum"] += wpm_val
-                    entry["wpm_count"] += 1
-                    if err_val is not None:
-                        entry["error_sum"] += err_val
-                        entry["error_count"] += 1
-                    if duration_val is not None:
-                        entry["duration_sum"] += max(duration_val, 0.0)
-
-        if not wpm_values:
+        if speed_values.size == 0:
             messagebox.showinfo(
-                "Statistics",
-                "No statistics available for the current filter selection.",
+                title,
+                "No statistics available for the current filter selection."
             )
             return
 
-        daily_dates: List[date] = []
-        daily_wpm: List[float] = []
-        daily_error: List[float] = []
-        daily_duration_minutes: List[float] = []
-        if daily_stats:
-            start_date = min(daily_stats)
-            end_date = max(datetime.now().date(), start_date)
-            current_day = start_date
-            while current_day <= end_date:
-                daily_dates.append(current_day)
-                stats = daily_stats.get(current_day)
-                if stats:
-                    daily_wpm.append(stats["wpm_sum"] / stats["wpm_count"])
-                    if stats["error_count"] > 0:
-                        daily_error.append(
-                            stats["error_sum"] / stats["error_count"]
-                        )
-                    else:
-                        daily_error.append(0.0)
-                    daily_duration_minutes.append(
-                        stats.get("duration_sum", 0.0) / 60.0
-                    )
-                else:
-                    daily_wpm.append(0.0)
-                    daily_error.append(0.0)
-                    daily_duration_minutes.append(0.0)
-                current_day += timedelta(days=1)
-
-        palette = self._get_plot_palette()
-        fig = plt.figure(figsize=(12, 10))
-        self._configure_figure_window(fig)
-        grid_spec = fig.add_gridspec(4, 2, height_ratios=[1.0, 1.2, 1.0, 0.8])
-        grid_spec.update(hspace=0.75, wspace=0.4)
-
-        ax_wpm = fig.add_subplot(grid_spec[0, 0])
-        ax_error = fig.add_subplot(grid_spec[0, 1])
-        ax_joint = fig.add_subplot(grid_spec[1, :])
-        ax_time = fig.add_subplot(grid_spec[2, :])
-        ax_time_spent = fig.add_subplot(grid_spec[3, :])
-        ax_time_spent_right = ax_time_spent.twinx()
-
-        ax_wpm.hist(
-            wpm_values,
-            bins="auto",
-            color=palette["hist_speed_color"],
-            edgecolor=palette["axes_facecolor"],
-            alpha=0.85
-        )
-        ax_wpm.set_title("WPM distribution")
-        ax_wpm.set_xlabel("Words per minute")
-        ax_wpm.set_ylabel("Frequency")
-
-        if error_rates:
-            ax_error.hist(
-                error_rates,
-                bins="auto",
-                color=palette["hist_error_color"],
-                edgecolor=palette["axes_facecolor"],
-                alpha=0.85
-            )
-            ax_error.set_title("Error percentage distribution")
-            ax_error.set_xlabel("Error percentage (%)")
-            ax_error.set_ylabel("Frequency")
-        else:
-            ax_error.set_title("Error percentage distribution")
-            ax_error.text(
-                0.5,
-                0.5,
-                "No error-rate data available",
-                ha="center",
-                va="center",
-                transform=ax_error.transAxes,
-                color=palette["text_color"]
-            )
-            ax_error.set_xticks([])
-            ax_error.set_yticks([])
-
-        self._draw_joint_heatmap(
-            fig=fig,
-            ax=ax_joint,
-            x_values=wpm_for_3d,
-            y_values=error_for_3d,
-            x_label="WPM",
-            y_label="Error percentage (%)",
-            title="Joint WPM / error percentage distribution",
-            palette=palette
+        self._render_stats_figure(
+            title=title,
+            days=days[keep],
+            speed_values=speed_values,
+            second_values=error_values,
+            duration_values=duration_values,
+            speed_label=speed_label,
+            speed_hist_title=f"{speed_label} distribution",
+            speed_short_label=speed_short_label,
+            second_label="Error percentage (%)",
+            second_hist_title="Error percentage distribution",
+            second_color_key="hist_error_color",
+            second_empty_text="No error data available",
+            second_daily_label="Average error %",
+            joint_x_label=speed_label,
+            joint_title=joint_title,
+            daily_title=f"Daily averages ({speed_short_label} vs error %)"
         )
 
-        if daily_dates:
-            positions = np.arange(len(daily_dates))
-            bar_width = 0.25
-            ax_time.bar(
-                positions - bar_width,
-                daily_wpm,
-                width=bar_width,
-                color=palette["daily_speed_color"],
-                label="Average WPM"
-            )
-            ax_time.bar(
-                positions,
-                daily_error,
-                width=bar_width,
-                color=palette["daily_error_color"],
-                label="Average error %"
-            )
-            ax_time.bar(
-                positions + bar_width,
-                daily_duration_minutes,
-                width=bar_width,
-                color=palette["daily_duration_color"],
-                label="Total time (min)"
-            )
-            formatted_days = [day.strftime("%Y-%m-%d") for day in daily_dates]
-            ax_time.set_xticks(positions)
-            ax_time.set_xticklabels(
-                formatted_days,
-                rotation=45,
-                ha="right"
-            )
-            ax_time.set_ylabel("Daily averages / total time")
-            ax_time.set_title("Daily averages (WPM vs error %)")
-            legend = ax_time.legend()
-            self._style_legend(legend, palette)
-
-            cumulative_duration_minutes: List[float] = []
-            running_total = 0.0
-            for minutes in daily_duration_minutes:
-                running_total += minutes
-                cumulative_duration_minutes.append(running_total)
-
-            ax_time_spent.bar(
-                positions,
-                daily_duration_minutes,
-                width=0.4,
-                color=palette["time_per_day_bar_color"],
-                label="Time per day (min)"
-            )
-            ax_time_spent_right.plot(
-                positions,
-                cumulative_duration_minutes,
-                color=palette["time_cumulative_line_color"],
-                marker="o",
-                markerfacecolor=palette["axes_facecolor"],
-                markeredgecolor=palette["time_cumulative_line_color"],
-                label="Cumulative time (min)"
-            )
-            ax_time_spent.set_xticks(positions)
-            ax_time_spent.set_xticklabels(
-                formatted_days,
-                rotation=45,
-                ha="right"
-            )
-            ax_time_spent.set_ylabel("Daily time (min)")
-            ax_time_spent_right.set_ylabel("Cumulative time (min)")
-            ax_time_spent.set_title("Time spent per day")
-            handles, labels = ax_time_spent.get_legend_handles_labels()
-            handles2, labels2 = ax_time_spent_right.get_legend_handles_labels()
-            legend = ax_time_spent.legend(
-                handles + handles2,
-                labels + labels2,
-                loc="upper left"
-            )
-            self._style_legend(legend, palette)
-        else:
-            ax_time.set_title("Daily averages (WPM vs error %)")
-            ax_time.text(
-                0.5,
-                0.5,
-                "No dated entries available",
-                ha="center",
-                va="center",
-                transform=ax_time.transAxes,
-                color=palette["text_color"]
-            )
-            ax_time.set_xticks([])
-            ax_time.set_yticks([])
-            ax_time_spent.set_title("Time spent per day")
-            ax_time_spent.text(
-                0.5,
-                0.5,
-                "No dated entries available",
-                ha="center",
-                va="center",
-                transform=ax_time_spent.transAxes,
-                color=palette["text_color"]
-            )
-            ax_time_spent.set_xticks([])
-            ax_time_spent.set_yticks([])
-            ax_time_spent_right.set_yticks([])
-
-        formatter = mticker.FormatStrFormatter("%.1f")
-        ax_time_spent.yaxis.set_major_formatter(formatter)
-        ax_time_spent_right.yaxis.set_major_formatter(formatter)
-
-        self._apply_plot_theme(fig, palette)
-        plt.tight_layout(pad=1.3)
-        plt.show()
-
     def show_letter_stats(self) -> None:
         """
         Visualize stored letter mode statistics (letters per minute and errors).
         """
+        self._flush_stats_writes()
         if self.is_blind_mode_active():
             self._show_blind_stats(
                 file_path=self.blind_letter_stats_file_path,
                 header=BLIND_LETTER_STATS_FILE_HEADER,
                 mode_label="letter",
                 speed_label="Letters per minute",
-                speed_short_label="Letters/min"
-            )
-            return
-
-        if self.is_sudden_death_active():
-            self._show_sudden_death_stats(
-                file_path=self.sudden_death_letter_stats_file_path,
-                header=SUDDEN_DEATH_LETTER_STATS_FILE_HEADER,
-                mode_label="letter",
-                speed_label="Letters per minute",
-                speed_short_label="Letters/min",
-                correct_label="Correct letters"
-            )
-            return
-
-        if not self.letter_stats_file_path.exists():
-            messagebox.showinfo(
-                "Letter statistics",
-                "No letter statistics available yet. "
-                "Finish at least one letter mode session."
-            )
-            return
-
-        ensure_stats_file_header(
-            self.letter_stats_file_path,
-            LETTER_STATS_FILE_HEADER,
-            create_if_missing=False
-        )
-
-        letters_per_minute: List[float] = []
-        error_rates: List[float] = []
-        daily_stats: dict = {}
-
-        with self.letter_stats_file_path.open("r", encoding="utf-8") as file:
-            for line in file:
-                parts = line.strip().split(";")
-                if len(parts) < 3:
-                    continue
-                is_training_run = parse_training_flag(parts, 4)
-                if not self._should_include_training_entry(is_training_run):
-                    continue
-                try:
-                    day = datetime.strptime(
-                        parts[0],
-                        "%Y-%m-%d %H:%M:%S"
-                    ).date()
-                    lpm_val = float(parts[1])
-                    err_val = float(parts[2])
-                except ValueError:
-                    continue
-                duration_val: float | None = None
-                if len(parts) >= 4:
-                    try:
-                        duration_val = float(parts[3])
-                    except ValueError:
-                        duration_val = None
-                letters_per_minute.append(lpm_val)
-                error_rates.append(err_val)
-                entry = daily_stats.setdefault(
-                    day,
-                    {
-                        "speed_sum": 0.0,
-                        "speed_count": 0,
-                        "error_sum": 0.0,
-                        "error_count": 0,
-                        "duration_sum": 0.0,
-                    }
-                )
-                entry["speed_sum"] += lpm_val
-                entry["speed_count"] += 1
-                entry["error_sum"] += err_val
-                entry["error_count"] += 1
-                if duration_val is not None:
-                    entry["duration_sum"] += max(duration_val, 0.0)
-
-        if not letters_per_minute:
-            messagebox.showinfo(
-                "Letter statistics",
-                "No statistics available for the current filter selection."
-            )
-            return
-
-        daily_dates: List[date] = []
-        daily_speed: List[float] = []
-        daily_error: List[float] = []
-        daily_duration_minutes: List[float] = []
-        if daily_stats:
-            start_date = min(daily_stats)
-            end_date = max(datetime.now().date(), start_date)
-            current_day = start_date
-            while current_day <= end_date:
-                daily_dates.append(current_day)
-                stats = daily_stats.get(current_day)
-                if stats:
-                    daily_speed.append(stats["speed_sum"] / stats["speed_count"])
-                    if stats["error_count"] > 0:
-                        daily_error.append(
-                            stats["error_sum"] / stats["error_count"]
-                        )
-                    else:
-                        daily_error.append(0.0)
-                    daily_duration_minutes.append(
-                        stats.get("duration_sum", 0.0) / 60.0
-                    )
-                else:
-                    daily_speed.append(0.0)
-                    daily_error.append(0.0)
-                    daily_duration_minutes.append(0.0)
-                current_day += timedelta(days=1)
-
-        palette = self._get_plot_palette()
-        fig = plt.figure(figsize=(12, 10))
-        self._configure_figure_window(fig)
-        grid_spec = fig.add_gridspec(4, 2, height_ratios=[1.0, 1.2, 1.0, 0.8])
-        grid_spec.update(hspace=0.75, wspace=0.4)
-
-        ax_speed = fig.add_subplot(grid_spec[0, 0])
-        ax_error = fig.add_subplot(grid_spec[0, 1])
-        ax_joint = fig.add_subplot(grid_spec[1, :])
-        ax_time = fig.add_subplot(grid_spec[2, :])
-        ax_time_spent = fig.add_subplot(grid_spec[3, :])
-        ax_time_spent_right = ax_time_spent.twinx()
-
-        ax_speed.hist(
-            letters_per_minute,
-            bins="auto",
-            color=palette["hist_speed_color"],
-            edgecolor=palette["axes_facecolor"],
-            alpha=0.85
-        )
-        ax_speed.set_title("Letters per minute distribution")
-        ax_speed.set_xlabel("Letters per minute")
-        ax_speed.set_ylabel("Frequency")
-
-        if error_rates:
-            ax_error.hist(
-                error_rates,
-                bins="auto",
-                color=palette["hist_error_color"],
-                edgecolor=palette["axes_facecolor"],
-                alpha=0.85
-            )
-            ax_error.set_title("Error percentage distribution")
-            ax_error.set_xlabel("Error percentage (%)")
-            ax_error.set_ylabel("Frequency")
-        else:
-            ax_error.set_title("Error percentage distribution")
-            ax_error.text(
-                0.5,
-                0.5,
-                "No error data available",
-                ha="center",
-                va="center",
-                transform=ax_error.transAxes,
-                color=palette["text_color"]
-            )
-            ax_error.set_xticks([])
-            ax_error.set_yticks([])
-
-        self._draw_joint_heatmap(
-            fig=fig,
-            ax=ax_joint,
-            x_values=letters_per_minute,
-            y_values=error_rates,
-            x_label="Letters per minute",
-            y_label="Error percentage (%)",
-            title="Joint letters/minute and error distribution",
-            palette=palette
-        )
-
-        if daily_dates:
-            positions = np.arange(len(daily_dates))
-            bar_width = 0.25
-            ax_time.bar(
-                positions - bar_width,
-                daily_speed,
-                width=bar_width,
-                color=palette["daily_speed_color"],
-                label="Average letters/min"
-            )
-            ax_time.bar(
-                positions,
-                daily_error,
-                width=bar_width,
-                color=palette["daily_error_color"],
-                label="Average error %"
-            )
-            ax_time.bar(
-                positions + bar_width,
-                daily_duration_minutes,
-                width=bar_width,
-                color=palette["daily_duration_color"],
-                label="Total time (min)"
-            )
-            formatted_days = [day.strftime("%Y-%m-%d") for day in daily_dates]
-            ax_time.set_xticks(positions)
-            ax_time.set_xticklabels(
-                formatted_days,
-                rotation=45,
-                ha="right"
-            )
-            ax_time.set_ylabel("Daily averages / total time")
-            ax_time.set_title("Daily averages (letters/min vs error %)")
-            legend = ax_time.legend()
-            self._style_legend(legend, palette)
-
-            cumulative_duration_minutes: List[float] = []
-            running_total = 0.0
-            for minutes in daily_duration_minutes:
-                running_total += minutes
-                cumulative_duration_minutes.append(running_total)
-
-            ax_time_spent.bar(
-                positions,
-                daily_duration_minutes,
-                width=0.4,
-                color=palette["time_per_day_bar_color"],
-                label="Time per day (min)"
-            )
-            ax_time_spent_right.plot(
-                positions,
-                cumulative_duration_minutes,
-                color=palette["time_cumulative_line_color"],
-                marker="o",
-                markerfacecolor=palette["axes_facecolor"],
-                markeredgecolor=palette["time_cumulative_line_color"],
-                label="Cumulative time (min)"
-            )
-            ax_time_spent.set_xticks(positions)
-            ax_time_spent.set_xticklabels(
-                formatted_days,
-                rotation=45,
-                ha="right"
-            )
-            ax_time_spent.set_ylabel("Daily time (min)")
-            ax_time_spent_right.set_ylabel("Cumulative time (min)")
-            ax_time_spent.set_title("Time spent per day")
-            handles, labels = ax_time_spent.get_legend_handles_labels()
-            handles2, labels2 = ax_time_spent_right.get_legend_handles_labels()
-            legend = ax_time_spent.legend(
-                handles + handles2,
-                labels + labels2,
-                loc="upper left"
-            )
-            self._style_legend(legend, palette)
-        else:
-            ax_time.set_title("Daily averages (letters/min vs error %)")
-            ax_time.text(
-                0.5,
-                0.5,
-                "No dated entries available",
-                ha="center",
-                va="center",
-                transform=ax_time.transAxes,
-                color=palette["text_color"]
-            )
-            ax_time.set_xticks([])
-            ax_time.set_yticks([])
-            ax_time_spent.set_title("Time spent per day")
-            ax_time_spent.text(
-                0.5,
-                0.5,
-                "No dated entries available",
-                ha="center",
-                va="center",
-                transform=ax_time_spent.transAxes,
-                color=palette["text_color"]
-            )
-            ax_time_spent.set_xticks([])
-            ax_time_spent.set_yticks([])
-            ax_time_spent_right.set_yticks([])
-
-        formatter = mticker.FormatStrFormatter("%.1f")
-        ax_time_spent.yaxis.set_major_formatter(formatter)
-        ax_time_spent_right.yaxis.set_major_formatter(formatter)
-
-        self._apply_plot_theme(fig, palette)
-        plt.tight_layout(pad=1.3)
-        plt.show()
-
-    def show_special_stats(self) -> None:
-        """
-        Visualize stored special character mode statistics.
-        """
-        if self.is_blind_mode_active():
-            self._show_blind_stats(
-                file_path=self.blind_special_stats_file_path,
-                header=BLIND_SPECIAL_STATS_FILE_HEADER,
-                mode_label="character",
-                speed_label="Special chars per minute",
-                speed_short_label="Special chars/min"
-            )
-            return
-
-        if self.is_sudden_death_active():
-            self._show_sudden_death_stats(
-                file_path=self.sudden_death_special_stats_file_path,
-                header=SUDDEN_DEATH_SPECIAL_STATS_FILE_HEADER,
-                mode_label="special",
-                speed_label="Special chars per minute",
-                speed_short_label="Special chars/min",
-                correct_label="Correct symbols"
-            )
-            return
-
-        if not self.special_stats_file_path.exists():
-            messagebox.showinfo(
-                "Special character statistics",
-                "No special character statistics available yet. "
-                "Finish at least one special mode session."
-            )
-            return
-
-        ensure_stats_file_header(
-            self.special_stats_file_path,
-            SPECIAL_STATS_FILE_HEADER,
-            create_if_missing=False
-        )
-
-        symbols_per_minute: List[float] = []
-        error_rates: List[float] = []
-        daily_stats: dict = {}
-
-        with self.special_stats_file_path.open("r", encoding="utf-8") as file:
-            for line in file:
-                parts = line.strip().split(";")
-                if len(parts) < 3:
-                    continue
-                is_training_run = parse_training_flag(parts, 4)
-                if not self._should_include_training_entry(is_training_run):
-                    continue
-                try:
-                    day = datetime.strptime(
-                        parts[0],
-                        "%Y-%m-%d %H:%M:%S"
-                    ).date()
-                    spm_val = float(parts[1])
-                    err_val = float(parts[2])
-                except ValueError:
-                    continue
-                duration_val: float | None = None
-                if len(parts) >= 4:
-                    try:
-                        duration_val = float(parts[3])
-                    except ValueError:
-                        duration_val = None
-                symbols_per_minute.append(spm_val)
-                error_rates.append(err_val)
-                entry = daily_stats.setdefault(
-                    day,
-                    {
-                        "speed_sum": 0.0,
-                        "speed_count": 0,
-                        "error_sum": 0.0,
-                        "error_count": 0,
-                        "duration_sum": 0.0,
-                    }
-                )
-                entry["speed_sum"] += spm_val
-                entry["speed_count"] += 1
-                entry["error_sum"] += err_val
-                entry["error_count"] += 1
-                if duration_val is not None:
-                    entry["duration_sum"] += max(duration_val, 0.0)
-
-        if not symbols_per_minute:
-            messagebox.showinfo(
-                "Special character statistics",
-                "No statistics available for the current filter selection."
-            )
-            return
-
-        daily_dates: List[date] = []
-        daily_speed: List[float] = []
-        daily_error: List[float] = []
-        daily_duration_minutes: List[float] = []
-        if daily_stats:
-            start_date = min(daily_stats)
-            end_date = max(datetime.now().date(), start_date)
-            current_day = start_date
-            while current_day <= end_date:
-                daily_dates.append(current_day)
-                stats = daily_stats.get(current_day)
-                if stats:
-                    daily_speed.append(stats["speed_sum"] / stats["speed_count"])
-                    if stats["error_count"] > 0:
-                        daily_error.append(
-                            stats["error_sum"] / stats["error_count"]
-                        )
-                    else:
-                        daily_error.append(0.0)
-                    daily_duration_minutes.append(
-                        stats.get("duration_sum", 0.0) / 60.0
-                    )
-                else:
-                    daily_speed.append(0.0)
-                    daily_error.append(0.0)
-                    daily_duration_minutes.append(0.0)
-                current_day += timedelta(days=1)
-
-        palette = self._get_plot_palette()
-        fig = plt.figure(figsize=(12, 10))
-        self._configure_figure_window(fig)
-        grid_spec = fig.add_gridspec(4, 2, height_ratios=[1.0, 1.2, 1.0, 0.8])
-        grid_spec.update(hspace=0.75, wspace=0.4)
-
-        ax_speed = fig.add_subplot(grid_spec[0, 0])
-        ax_error = fig.add_subplot(grid_spec[0, 1])
-        ax_joint = fig.add_subplot(grid_spec[1, :])
-        ax_time = fig.add_subplot(grid_spec[2, :])
-        ax_time_spent = fig.add_subplot(grid_spec[3, :])
-        ax_time_spent_right = ax_time_spent.twinx()
-
-        ax_speed.hist(
-            symbols_per_minute,
-            bins="auto",
-            color=palette["hist_speed_color"],
-            edgecolor=palette["axes_facecolor"],
-            alpha=0.85
-        )
-        ax_speed.set_title("Special chars per minute distribution")
-        ax_speed.set_xlabel("Special chars per minute")
-        ax_speed.set_ylabel("Frequency")
-
-        if error_rates:
-            ax_error.hist(
-                error_rates,
-                bins="auto",
-                color=palette["hist_error_color"],
-                edgecolor=palette["axes_facecolor"],
-                alpha=0.85
-            )
-            ax_error.set_title("Error percentage distribution")
-            ax_error.set_xlabel("Error percentage (%)")
-            ax_error.set_ylabel("Frequency")
-        else:
-            ax_error.set_title("Error percentage distribution")
-            ax_error.text(
-                0.5,
-                0.5,
-                "No error data available",
-                ha="center",
-                va="center",
-                transform=ax_error.transAxes,
-                color=palette["text_color"]
-            )
-            ax_error.set_xticks([])
-            ax_error.set_yticks([])
-
-        self._draw_joint_heatmap(
-            fig=fig,
-            ax=ax_joint,
-            x_values=symbols_per_minute,
-            y_values=error_rates,
-            x_label="Special chars per minute",
-            y_label="Error percentage (%)",
-            title="Joint special chars/min and error distribution",
-            palette=palette
-        )
-
-        if daily_dates:
-            positions = np.arange(len(daily_dates))
-            bar_width = 0.25
-            ax_time.bar(
-                positions - bar_width,
-                daily_speed,
-                width=bar_width,
-                color=palette["daily_speed_color"],
-                label="Average special chars/min"
-            )
-            ax_time.bar(
-                positions,
-                daily_error,
-                width=bar_width,
-                color=palette["daily_error_color"],
-                label="Average error %"
-            )
-            ax_time.bar(
-                positions + bar_width,
-                daily_duration_minutes,
-                width=bar_width,
-                color=palette["daily_duration_color"],
-                label="Total time (min)"
-            )
-            formatted_days = [day.strftime("%Y-%m-%d") for day in daily_dates]
-            ax_time.set_xticks(positions)
-            ax_time.set_xticklabels(
-                formatted_days,
-                rotation=45,
-                ha="right"
-            )
-            ax_time.set_ylabel("Daily averages / total time")
-            ax_time.set_title("Daily averages (special chars/min vs error %)")
-            legend = ax_time.legend()
-            self._style_legend(legend, palette)
-
-            cumulative_duration_minutes: List[float] = []
-            running_total = 0.0
-            for minutes in daily_duration_minutes:
-                running_total += minutes
-                cumulative_duration_minutes.append(running_total)
-
-            ax_time_spent.bar(
-                positions,
-                daily_duration_minutes,
-                width=0.4,
-                color=palette["time_per_day_bar_color"],
-                label="Time per day (min)"
-            )
-            ax_time_spent_right.plot(
-                positions,
-                cumulative_duration_minutes,
-                color=palette["time_cumulative_line_color"],
-                marker="o",
-                markerfacecolor=palette["axes_facecolor"],
-                markeredgecolor=palette["time_cumulative_line_color"],
-                label="Cumulative time (min)"
+                speed_short_label="Letters/min"
             )
-            ax_time_spent.set_xticks(positions)
-            ax_time_spent.set_xticklabels(
-                formatted_days,
-                rotation=45,
-                ha="right"
+            return
+
+        if self.is_sudden_death_active():
+            self._show_sudden_death_stats(
+                file_path=self.sudden_death_letter_stats_file_path,
+                header=SUDDEN_DEATH_LETTER_STATS_FILE_HEADER,
+                mode_label="letter",
+                speed_label="Letters per minute",
+                speed_short_label="Letters/min",
+                correct_label="Correct letters"
             )
-            ax_time_spent.set_ylabel("Daily time (min)")
-            ax_time_spent_right.set_ylabel("Cumulative time (min)")
-            ax_time_spent.set_title("Time spent per day")
-            handles, labels = ax_time_spent.get_legend_handles_labels()
-            handles2, labels2 = ax_time_spent_right.get_legend_handles_labels()
-            legend = ax_time_spent.legend(
-                handles + handles2,
-                labels + labels2,
-                loc="upper left"
+            return
+
+        if not self.letter_stats_file_path.exists():
+            messagebox.showinfo(
+                "Letter statistics",
+                "No letter statistics available yet. "
+                "Finish at least one letter mode session."
             )
-            self._style_legend(legend, palette)
-        else:
-            ax_time.set_title("Daily averages (special chars/min vs error %)")
-            ax_time.text(
-                0.5,
-                0.5,
-                "No dated entries available",
-                ha="center",
-                va="center",
-                transform=ax_time.transAxes,
-                color=palette["text_color"]
+            return
+
+        self._show_mode_stats(
+            file_path=self.letter_stats_file_path,
+            header=LETTER_STATS_FILE_HEADER,
+            title="Letter statistics",
+            speed_label="Letters per minute",
+            speed_short_label="letters/min",
+            joint_title="Joint letters/minute and error distribution"
+        )
+
+    def show_special_stats(self) -> None:
+        """
+        Visualize stored special character mode statistics.
+        """
+        self._flush_stats_writes()
+        if self.is_blind_mode_active():
+            self._show_blind_stats(
+                file_path=self.blind_special_stats_file_path,
+                header=BLIND_SPECIAL_STATS_FILE_HEADER,
+                mode_label="character",
+                speed_label="Special chars per minute",
+                speed_short_label="Special chars/min"
             )
-            ax_time.set_xticks([])
-            ax_time.set_yticks([])
-            ax_time_spent.set_title("Time spent per day")
-            ax_time_spent.text(
-                0.5,
-                0.5,
-                "No dated entries available",
-                ha="center",
-                va="center",
-                transform=ax_time_spent.transAxes,
-                color=palette["text_color"]
+            return
+
+        if self.is_sudden_death_active():
+            self._show_sudden_death_stats(
+                file_path=self.sudden_death_special_stats_file_path,
+                header=SUDDEN_DEATH_SPECIAL_STATS_FILE_HEADER,
+                mode_label="special",
+                speed_label="Special chars per minute",
+                speed_short_label="Special chars/min",
+                correct_label="Correct symbols"
             )
-            ax_time_spent.set_xticks([])
-            ax_time_spent.set_yticks([])
-            ax_time_spent_right.set_yticks([])
+            return
 
-        formatter = mticker.FormatStrFormatter("%.1f")
-        ax_time_spent.yaxis.set_major_formatter(formatter)
-        ax_time_spent_right.yaxis.set_major_formatter(formatter)
+        if not self.special_stats_file_path.exists():
+            messagebox.showinfo(
+                "Special character statistics",
+                "No special character statistics available yet. "
+                "Finish at least one special mode session."
+            )
+            return
 
-        self._apply_plot_theme(fig, palette)
-        plt.tight_layout(pad=1.3)
-        plt.show()
+        self._show_mode_stats(
+            file_path=self.special_stats_file_path,
+            header=SPECIAL_STATS_FILE_HEADER,
+            title="Special character statistics",
+            speed_label="Special chars per minute",
+            speed_short_label="special chars/min",
+            joint_title="Joint special chars/min and error distribution"
+        )
 
     def show_number_stats(self) -> None:
         """
         Visualize stored number mode statistics.
         """
+        self._flush_stats_writes()
         if self.is_blind_mode_active():
             self._show_blind_stats(
                 file_path=self.blind_number_stats_file_path,
@@ -1893,362 +1203,92 @@ class PlotMixin:
             )
             return
 
-        ensure_stats_file_header(
-            self.number_stats_file_path,
-            NUMBER_STATS_FILE_HEADER,
-            create_if_missing=False
-        )
-
-        digits_per_minute: List[float] = []
-        error_rates: List[float] = []
-        daily_stats: dict = {}
-
-        with self.number_stats_file_path.open("r", encoding="utf-8") as file:
-            for line in file:
-                parts = line.strip().split(";")
-                if len(parts) < 3:
-                    continue
-                is_training_run = parse_training_flag(parts, 4)
-                if not self._should_include_training_entry(is_training_run):
-                    continue
-                try:
-                    day = datetime.strptime(
-                        parts[0],
-                        "%Y-%m-%d %H:%M:%S"
-                    ).date()
-                    dpm_val = float(parts[1])
-                    err_val = float(parts[2])
-                except ValueError:
-                    continue
-                duration_val: float | None = None
-                if len(parts) >= 4:
-                    try:
-                        duration_val = float(parts[3])
-                    except ValueError:
-                        duration_val = None
-                digits_per_minute.append(dpm_val)
-                error_rates.append(err_val)
-                entry = daily_stats.setdefault(
-                    day,
-                    {
-                        "speed_sum": 0.0,
-                        "speed_count": 0,
-                        "error_sum": 0.0,
-                        "error_count": 0,
-                        "duration_sum": 0.0,
-                    }
-                )
-                entry["speed_sum"] += dpm_val
-                entry["speed_count"] += 1
-                entry["error_sum"] += err_val
-                entry["error_count"] += 1
-                if duration_val is not None:
-                    entry["duration_sum"] += max(duration_val, 0.0)
-
-        if not digits_per_minute:
-            messagebox.showinfo(
-                "Number statistics",
-                "No statistics available for the current filter selection."
-            )
-            return
-
-        daily_dates: List[date] = []
-        daily_speed: List[float] = []
-        daily_error: List[float] = []
-        daily_duration_minutes: List[float] = []
-        if daily_stats:
-            start_date = min(daily_stats)
-            end_date = max(datetime.now().date(), start_date)
-            current_day = start_date
-            while current_day <= end_date:
-                daily_dates.append(current_day)
-                stats = daily_stats.get(current_day)
-                if stats:
-                    daily_speed.append(stats["speed_sum"] / stats["speed_count"])
-                    if stats["error_count"] > 0:
-                        daily_error.append(
-                            stats["error_sum"] / stats["error_count"]
-                        )
-                    else:
-                        daily_error.append(0.0)
-                    daily_duration_minutes.append(
-                        stats.get("duration_sum", 0.0) / 60.0
-                    )
-                else:
-                    daily_speed.append(0.0)
-                    daily_error.append(0.0)
-                    daily_duration_minutes.append(0.0)
-                current_day += timedelta(days=1)
-
-        palette = self._get_plot_palette()
-        fig = plt.figure(figsize=(12, 10))
-        self._configure_figure_window(fig)
-        grid_spec = fig.add_gridspec(4, 2, height_ratios=[1.0, 1.2, 1.0, 0.8])
-        grid_spec.update(hspace=0.75, wspace=0.4)
-
-        ax_speed = fig.add_subplot(grid_spec[0, 0])
-        ax_error = fig.add_subplot(grid_spec[0, 1])
-        ax_joint = fig.add_subplot(grid_spec[1, :])
-        ax_time = fig.add_subplot(grid_spec[2, :])
-        ax_time_spent = fig.add_subplot(grid_spec[3, :])
-        ax_time_spent_right = ax_time_spent.twinx()
-
-        ax_speed.hist(
-            digits_per_minute,
-            bins="auto",
-            color=palette["hist_speed_color"],
-            edgecolor=palette["axes_facecolor"],
-            alpha=0.85
-        )
-        ax_speed.set_title("Digits per minute distribution")
-        ax_speed.set_xlabel("Digits per minute")
-        ax_speed.set_ylabel("Frequency")
-
-        if error_rates:
-            ax_error.hist(
-                error_rates,
-                bins="auto",
-                color=palette["hist_error_color"],
-                edgecolor=palette["axes_facecolor"],
-                alpha=0.85
-            )
-            ax_error.set_title("Error percentage distribution")
-            ax_error.set_xlabel("Error percentage (%)")
-            ax_error.set_ylabel("Frequency")
-        else:
-            ax_error.set_title("Error percentage distribution")
-            ax_error.text(
-                0.5,
-                0.5,
-                "No error data available",
-                ha="center",
-                va="center",
-                transform=ax_error.transAxes,
-                color=palette["text_color"]
-            )
-            ax_error.set_xticks([])
-            ax_error.set_yticks([])
-
-        self._draw_joint_heatmap(
-            fig=fig,
-            ax=ax_joint,
-            x_values=digits_per_minute,
-            y_values=error_rates,
-            x_label="Digits per minute",
-            y_label="Error percentage (%)",
-            title="Joint digits/minute and error distribution",
-            palette=palette
+        self._show_mode_stats(
+            file_path=self.number_stats_file_path,
+            header=NUMBER_STATS_FILE_HEADER,
+            title="Number statistics",
+            speed_label="Digits per minute",
+            speed_short_label="digits/min",
+            joint_title="Joint digits/minute and error distribution"
         )
 
-        if daily_dates:
-            positions = np.arange(len(daily_dates))
-            bar_width = 0.25
-            ax_time.bar(
-                positions - bar_width,
-                daily_speed,
-                width=bar_width,
-                color=palette["daily_speed_color"],
-                label="Average digits/min"
-            )
-            ax_time.bar(
-                positions,
-                daily_error,
-                width=bar_width,
-                color=palette["daily_error_color"],
-                label="Average error %"
-            )
-            ax_time.bar(
-                positions + bar_width,
-                daily_duration_minutes,
-                width=bar_width,
-                color=palette["daily_duration_color"],
-                label="Total time (min)"
-            )
-            formatted_days = [day.strftime("%Y-%m-%d") for day in daily_dates]
-            ax_time.set_xticks(positions)
-            ax_time.set_xticklabels(
-                formatted_days,
-                rotation=45,
-                ha="right"
-            )
-            ax_time.set_ylabel("Daily averages / total time")
-            ax_time.set_title("Daily averages (digits/min vs error %)")
-            legend = ax_time.legend()
-            self._style_legend(legend, palette)
-
-            cumulative_duration_minutes: List[float] = []
-            running_total = 0.0
-            for minutes in daily_duration_minutes:
-                running_total += minutes
-                cumulative_duration_minutes.append(running_total)
-
-            ax_time_spent.bar(
-                positions,
-                daily_duration_minutes,
-                width=0.4,
-                color=palette["time_per_day_bar_color"],
-                label="Time per day (min)"
-            )
-            ax_time_spent_right.plot(
-                positions,
-                cumulative_duration_minutes,
-                color=palette["time_cumulative_line_color"],
-                marker="o",
-                markerfacecolor=palette["axes_facecolor"],
-                markeredgecolor=palette["time_cumulative_line_color"],
-                label="Cumulative time (min)"
-            )
-            ax_time_spent.set_xticks(positions)
-            ax_time_spent.set_xticklabels(
-                formatted_days,
-                rotation=45,
-                ha="right"
-            )
-            ax_time_spent.set_ylabel("Daily time (min)")
-            ax_time_spent_right.set_ylabel("Cumulative time (min)")
-            ax_time_spent.set_title("Time spent per day")
-            handles, labels = ax_time_spent.get_legend_handles_labels()
-            handles2, labels2 = ax_time_spent_right.get_legend_handles_labels()
-            legend = ax_time_spent.legend(
-                handles + handles2,
-                labels + labels2,
-                loc="upper left"
-            )
-            self._style_legend(legend, palette)
-        else:
-            ax_time.set_title("Daily averages (digits/min vs error %)")
-            ax_time.text(
-                0.5,
-                0.5,
-                "No dated entries available",
-                ha="center",
-                va="center",
-                transform=ax_time.transAxes,
-                color=palette["text_color"]
-            )
-            ax_time.set_xticks([])
-            ax_time.set_yticks([])
-            ax_time_spent.set_title("Time spent per day")
-            ax_time_spent.text(
-                0.5,
-                0.5,
-                "No dated entries available",
-                ha="center",
-                va="center",
-                transform=ax_time_spent.transAxes,
-                color=palette["text_color"]
-            )
-            ax_time_spent.set_xticks([])
-            ax_time_spent.set_yticks([])
-            ax_time_spent_right.set_yticks([])
-
-        formatter = mticker.FormatStrFormatter("%.1f")
-        ax_time_spent.yaxis.set_major_formatter(formatter)
-        ax_time_spent_right.yaxis.set_major_formatter(formatter)
-
-        self._apply_plot_theme(fig, palette)
-        plt.tight_layout(pad=1.3)
-        plt.show()
-
     def show_general_stats(self) -> None:
         """
         Display cumulative time spent across all modes with heatmap and timeline views.
         """
-        def _training_flag_index_from_header(header: str) -> int | None:
-            columns = header.split(";")
-            try:
-                return columns.index(TRAINING_FLAG_COLUMN)
-            except ValueError:
-                return None
-
+        self._flush_stats_writes()
         stats_sources = [
             (
                 self.stats_file_path,
                 STATS_FILE_HEADER,
                 "typing",
-                _training_flag_index_from_header(STATS_FILE_HEADER)
+                _TRAINING_FLAG_INDICES[STATS_FILE_HEADER]
             ),
             (
                 self.letter_stats_file_path,
                 LETTER_STATS_FILE_HEADER,
                 "letter",
-                _training_flag_index_from_header(LETTER_STATS_FILE_HEADER)
+                _TRAINING_FLAG_INDICES[LETTER_STATS_FILE_HEADER]
             ),
             (
                 self.special_stats_file_path,
                 SPECIAL_STATS_FILE_HEADER,
                 "character",
-                _training_flag_index_from_header(SPECIAL_STATS_FILE_HEADER)
+                _TRAINING_FLAG_INDICES[SPECIAL_STATS_FILE_HEADER]
             ),
             (
                 self.number_stats_file_path,
                 NUMBER_STATS_FILE_HEADER,
                 "number",
-                _training_flag_index_from_header(NUMBER_STATS_FILE_HEADER)
+                _TRAINING_FLAG_INDICES[NUMBER_STATS_FILE_HEADER]
             ),
             (
                 self.sudden_death_typing_stats_file_path,
                 SUDDEN_DEATH_TYPING_STATS_FILE_HEADER,
                 "typing",
-                _training_flag_index_from_header(
-                    SUDDEN_DEATH_TYPING_STATS_FILE_HEADER
-                )
+                _TRAINING_FLAG_INDICES[SUDDEN_DEATH_TYPING_STATS_FILE_HEADER]
             ),
             (
                 self.sudden_death_letter_stats_file_path,
                 SUDDEN_DEATH_LETTER_STATS_FILE_HEADER,
                 "letter",
-                _training_flag_index_from_header(
-                    SUDDEN_DEATH_LETTER_STATS_FILE_HEADER
-                )
+                _TRAINING_FLAG_INDICES[SUDDEN_DEATH_LETTER_STATS_FILE_HEADER]
             ),
             (
                 self.sudden_death_special_stats_file_path,
                 SUDDEN_DEATH_SPECIAL_STATS_FILE_HEADER,
                 "character",
-                _training_flag_index_from_header(
-                    SUDDEN_DEATH_SPECIAL_STATS_FILE_HEADER
-                )
+                _TRAINING_FLAG_INDICES[SUDDEN_DEATH_SPECIAL_STATS_FILE_HEADER]
             ),
             (
                 self.sudden_death_number_stats_file_path,
                 SUDDEN_DEATH_NUMBER_STATS_FILE_HEADER,
                 "number",
-                _training_flag_index_from_header(
-                    SUDDEN_DEATH_NUMBER_STATS_FILE_HEADER
-                )
+                _TRAINING_FLAG_INDICES[SUDDEN_DEATH_NUMBER_STATS_FILE_HEADER]
             ),
             (
                 self.blind_typing_stats_file_path,
                 BLIND_TYPING_STATS_FILE_HEADER,
                 "typing",
-                _training_flag_index_from_header(
-                    BLIND_TYPING_STATS_FILE_HEADER
-                )
+                _TRAINING_FLAG_INDICES[BLIND_TYPING_STATS_FILE_HEADER]
             ),
             (
                 self.blind_letter_stats_file_path,
                 BLIND_LETTER_STATS_FILE_HEADER,
                 "letter",
-                _training_flag_index_from_header(
-                    BLIND_LETTER_STATS_FILE_HEADER
-                )
+                _TRAINING_FLAG_INDICES[BLIND_LETTER_STATS_FILE_HEADER]
             ),
             (
                 self.blind_special_stats_file_path,
                 BLIND_SPECIAL_STATS_FILE_HEADER,
                 "character",
-                _training_flag_index_from_header(
-                    BLIND_SPECIAL_STATS_FILE_HEADER
-                )
+                _TRAINING_FLAG_INDICES[BLIND_SPECIAL_STATS_FILE_HEADER]
             ),
             (
                 self.blind_number_stats_file_path,
                 BLIND_NUMBER_STATS_FILE_HEADER,
                 "number",
-                _training_flag_index_from_header(
-                    BLIND_NUMBER_STATS_FILE_HEADER
-                )
+                _TRAINING_FLAG_INDICES[BLIND_NUMBER_STATS_FILE_HEADER]
             )
         ]
 
@@ -2259,68 +1299,75 @@ class PlotMixin:
             "character": "Character mode"
         }
 
-        daily_seconds: dict[date, float] = {}
         total_seconds = 0.0
         mode_seconds: dict[str, float] = {key: 0.0 for key in mode_labels}
         training_seconds = {"training": 0.0, "regular": 0.0}
-
-        def _is_training_run(parts: list[str], flag_index: int | None) -> bool:
-            if flag_index is None or flag_index >= len(parts):
-                return False
-            return parts[flag_index].strip().lower() in {"1", "true", "yes", "y"}
+        dated_days: List[np.ndarray] = []
+        dated_seconds: List[np.ndarray] = []
 
         for path, header, mode_key, training_index in stats_sources:
             if not path.exists():
                 continue
-            ensure_stats_file_header(
+            days, values, training = load_stats_table(
                 path,
                 header,
-                create_if_missing=False
-            )
-            with path.open("r", encoding="utf-8") as file:
-                for line in file:
-                    line = line.strip()
-                    if not line or line == header:
-                        continue
-                    parts = line.split(";")
-                    if len(parts) <= 3:
-                        continue
-                    try:
-                        timestamp = datetime.strptime(
-                            parts[0],
-                            "%Y-%m-%d %H:%M:%S"
-                        )
-                    except ValueError:
-                        continue
-                    try:
-                        duration_seconds = float(parts[3])
-                    except ValueError:
-                        continue
-                    duration_seconds = max(duration_seconds, 0.0)
-                    if duration_seconds == 0.0:
-                        continue
-                    day = timestamp.date()
-                    daily_seconds[day] = (
-                        daily_seconds.get(day, 0.0) + duration_seconds
-                    )
-                    total_seconds += duration_seconds
-                    mode_seconds[mode_key] += duration_seconds
-                    if _is_training_run(parts, training_index):
-                        training_seconds["training"] += duration_seconds
-                    else:
-                        training_seconds["regular"] += duration_seconds
+                value_columns=[3],
+                flag_index=0 if training_index is None else training_index,
+                min_fields=4
+            )
+            if training_index is None:
+                training = np.zeros(len(days), dtype=bool)
+            seconds = np.maximum(values[:, 0], 0.0)
+            keep = ~np.isnat(days) & (seconds > 0.0)
+            days = days[keep]
+            seconds = seconds[keep]
+            training = training[keep]
+
+            file_seconds = float(seconds.sum())
+            training_total = float(seconds[training].sum())
+            total_seconds += file_seconds
+            mode_seconds[mode_key] += file_seconds
+            training_seconds["training"] += training_total
+            training_seconds["regular"] += file_seconds - training_total
+            dated_days.append(days)
+            dated_seconds.append(seconds)
+
+        # Ordinals match date.toordinal() so the year views can index by them.
+        epoch_ordinal = date(1970, 1, 1).toordinal()
+        all_ordinals = (
+            np.concatenate(dated_days).astype(np.int64)
+            if dated_days
+            else np.empty(0, dtype=np.int64)
+        ) + epoch_ordinal
+        day_ordinals, day_index = np.unique(all_ordinals, return_inverse=True)
+        day_minutes = np.bincount(
+            day_index,
+            weights=(
+                np.concatenate(dated_seconds)
+                if dated_seconds
+                else np.empty(0)
+            ),
+            minlength=len(day_ordinals)
+        ) / 60.0
+        day_months = (day_ordinals - epoch_ordinal).astype(
+            "datetime64[D]"
+        ).astype("datetime64[M]")
 
         today = datetime.now().date()
         current_year_offset = 0
 
-        def _first_of_month(value: date) -> date:
-            return date(value.year, value.month, 1)
-
         today_ordinal = today.toordinal()
         min_end_ordinal = date.min.toordinal() + 364
         max_end_ordinal = date.max.toordinal()
 
+        # The loaded stats do not change while the window is open, so each
+        # year view is computed once and reused when navigating back to it.
+        year_views: dict[int, dict[str, Any]] = {}
+
         def _compute_year_view(year_offset: int) -> dict[str, Any]:
+            cached_view = year_views.get(year_offset)
+            if cached_view is not None:
+                return cached_view
             target_end = today_ordinal - year_offset * 365
             target_end = max(min_end_ordinal, min(max_end_ordinal, target_end))
             window_end = date.fromordinal(target_end)
@@ -2341,22 +1388,37 @@ class PlotMixin:
             total_days = (end_week - start_week).days + 1
             num_weeks = max(total_days // 7, 1)
 
-            heatmap_data = np.full((7, num_weeks), np.nan, dtype=float)
-            date_grid: List[List[date | None]] = [
-                [None for _ in range(num_weeks)] for _ in range(7)
-            ]
-
-            current_day = start_week
-            for idx in range(total_days):
-                week_idx = idx // 7
-                weekday_idx = current_day.weekday()
-                if week_idx >= num_weeks:
-                    break
-                date_grid[weekday_idx][week_idx] = current_day
-                if window_start <= current_day <= window_end:
-                    seconds = daily_seconds.get(current_day, 0.0)
-                    heatmap_data[weekday_idx, week_idx] = seconds / 60.0
-                current_day += timedelta(days=1)
+            # Cells are laid out week by week from the Monday start_week,
+            # so a day's flat index is its ordinal offset from that Monday.
+            # The hover grid keeps date ordinals (-1 past the last week) and
+            # only builds a date object for the cell under the cursor.
+            cell_count = num_weeks * 7
+            cell_ordinals = np.arange(
+                start_week_ordinal,
+                start_week_ordinal + cell_count,
+                dtype=np.int64
+            )
+            date_grid = np.where(
+                cell_ordinals <= end_week_ordinal,
+                cell_ordinals,
+                -1
+            ).reshape(num_weeks, 7).T
+
+            window_start_ordinal = window_start.toordinal()
+            window_end_ordinal = window_end.toordinal()
+            heatmap_cells = np.full(cell_count, np.nan)
+            heatmap_cells[
+                window_start_ordinal - start_week_ordinal:
+                min(window_end_ordinal - start_week_ordinal + 1, cell_count)
+            ] = 0.0
+            in_window = (
+                (day_ordinals >= window_start_ordinal)
+                & (day_ordinals <= window_end_ordinal)
+            )
+            heatmap_cells[day_ordinals[in_window] - start_week_ordinal] = (
+                day_minutes[in_window]
+            )
+            heatmap_data = heatmap_cells.reshape(num_weeks, 7).T
 
             week_start_days = [
                 start_week + timedelta(days=week_idx * 7)
@@ -2369,35 +1431,20 @@ class PlotMixin:
                     tick_positions.append(idx)
                     tick_labels.append(week_start.strftime("%b %d"))
 
-            monthly_totals: dict[tuple[int, int], float] = {}
-            for day_value, seconds in daily_seconds.items():
-                if window_start <= day_value <= window_end:
-                    key = (day_value.year, day_value.month)
-                    monthly_totals[key] = (
-                        monthly_totals.get(key, 0.0) + seconds / 60.0
-                    )
-
-            monthly_labels: List[str] = []
-            monthly_minutes: List[float] = []
-            cumulative_minutes: List[float] = []
-            cumulative_total = 0.0
-            current_month = _first_of_month(window_start)
-            last_month = _first_of_month(window_end)
-            while current_month <= last_month:
-                key = (current_month.year, current_month.month)
-                minutes_value = monthly_totals.get(key, 0.0)
-                cumulative_total += minutes_value
-                monthly_labels.append(current_month.strftime("%b %Y"))
-                monthly_minutes.append(minutes_value)
-                cumulative_minutes.append(cumulative_total)
-                if current_month.month == 12:
-                    current_month = date(current_month.year + 1, 1, 1)
-                else:
-                    current_month = date(
-                        current_month.year,
-                        current_month.month + 1,
-                        1
-                    )
+            first_month = np.datetime64(window_start, "M")
+            months = np.arange(
+                first_month,
+                np.datetime64(window_end, "M") + 1
+            )
+            monthly_minutes = np.bincount(
+                (day_months[in_window] - first_month).astype(np.int64),
+                weights=day_minutes[in_window],
+                minlength=len(months)
+            )
+            cumulative_minutes = np.cumsum(monthly_minutes)
+            monthly_labels: List[str] = [
+                month.strftime("%b %Y") for month in months.astype(object)
+            ]
 
             max_minutes = np.nanmax(heatmap_data)
             if not np.isfinite(max_minutes) or max_minutes == 0.0:
@@ -2408,7 +1455,7 @@ class PlotMixin:
                 f"{window_end.strftime('%b %d, %Y')}"
             )
 
-            return {
+            year_views[year_offset] = {
                 "window_start": window_start,
                 "window_end": window_end,
                 "heatmap_data": heatmap_data,
@@ -2422,6 +1469,7 @@ class PlotMixin:
                 "max_minutes": max_minutes,
                 "range_label": range_label
             }
+            return year_views[year_offset]
 
         palette = self._get_plot_palette()
         fig = plt.figure(figsize=(14, 10.2))
@@ -2471,11 +1519,14 @@ class PlotMixin:
 
         heatmap_state: dict[str, Any] = {
             "heatmap_data": None,
-            "date_grid": [],
+            "date_grid": None,
             "num_weeks": 0,
-            "annotation": None
+            "annotation": None,
+            "annotated_cell": None,
+            "image": None,
+            "month_bars": None,
+            "cumulative_line": None
         }
-        colorbar = None
 
         def _style_year_buttons() -> None:
             button_prev.ax.set_facecolor(palette["toolbar_background"])
@@ -2491,27 +1542,55 @@ class PlotMixin:
             return f"{value:.1f} min"
 
         def _draw_year_view(year_offset: int) -> None:
-            nonlocal colorbar
             view_data = _compute_year_view(year_offset)
-            ax_heatmap.clear()
-            norm = mcolors.Normalize(
-                vmin=0.0,
-                vmax=view_data["max_minutes"]
-            )
-            im = ax_heatmap.imshow(
-                view_data["heatmap_data"],
-                aspect="auto",
-                origin="upper",
-                cmap=cmap,
-                norm=norm
-            )
-            if colorbar is None:
-                colorbar = fig.colorbar(im, ax=ax_heatmap, pad=0.02)
+            heatmap_data = view_data["heatmap_data"]
+            num_weeks = view_data["num_weeks"]
+            # The artists are created on the first draw and then updated in
+            # place, so navigating between years does not rebuild the axes.
+            image = heatmap_state["image"]
+            if image is None:
+                image = ax_heatmap.imshow(
+                    heatmap_data,
+                    aspect="auto",
+                    origin="upper",
+                    cmap=cmap,
+                    norm=mcolors.Normalize(
+                        vmin=0.0,
+                        vmax=view_data["max_minutes"]
+                    )
+                )
+                colorbar = fig.colorbar(image, ax=ax_heatmap, pad=0.02)
+                colorbar.set_label("Minutes spent per day")
+                ax_heatmap.set_yticks(range(7))
+                ax_heatmap.set_yticklabels(weekday_labels)
+                ax_heatmap.set_xlabel("Weeks (starting Mondays)")
+                ax_heatmap.set_ylabel("Day of week")
+                annotation = ax_heatmap.annotate(
+                    "",
+                    xy=(0, 0),
+                    xytext=(15, 15),
+                    textcoords="offset points",
+                    bbox=dict(
+                        boxstyle="round",
+                        fc=palette["annotation_face_color"],
+                        ec=palette["annotation_edge_color"],
+                        alpha=0.9
+                    ),
+                    arrowprops=dict(
+                        arrowstyle="->",
+                        color=palette["annotation_edge_color"]
+                    ),
+                    color=palette["annotation_text_color"]
+                )
+                heatmap_state["image"] = image
+                heatmap_state["annotation"] = annotation
             else:
-                colorbar.update_normal(im)
-            colorbar.set_label("Minutes spent per day")
-            ax_heatmap.set_yticks(range(7))
-            ax_heatmap.set_yticklabels(weekday_labels)
+                # The colorbar follows the image's limits by itself.
+                image.set_data(heatmap_data)
+                image.set_clim(0.0, view_data["max_minutes"])
+                image.set_extent((-0.5, num_weeks - 0.5, 6.5, -0.5))
+                annotation = heatmap_state["annotation"]
+            annotation.set_visible(False)
             if view_data["tick_positions"]:
                 ax_heatmap.set_xticks(view_data["tick_positions"])
                 ax_heatmap.set_xticklabels(
@@ -2522,55 +1601,72 @@ class PlotMixin:
             else:
                 ax_heatmap.set_xticks([])
                 ax_heatmap.set_xticklabels([])
-            ax_heatmap.set_xlabel("Weeks (starting Mondays)")
-            ax_heatmap.set_ylabel("Day of week")
             ax_heatmap.set_title(
                 f"Daily time spent ({view_data['range_label']})"
             )
-            annotation = ax_heatmap.annotate(
-                "",
-                xy=(0, 0),
-                xytext=(15, 15),
-                textcoords="offset points",
-                bbox=dict(
-                    boxstyle="round",
-                    fc=palette["annotation_face_color"],
-                    ec=palette["annotation_edge_color"],
-                    alpha=0.9
-                ),
-                arrowprops=dict(
-                    arrowstyle="->",
-                    color=palette["annotation_edge_color"]
-                ),
-                color=palette["annotation_text_color"]
-            )
-            annotation.set_visible(False)
 
-            heatmap_state["heatmap_data"] = view_data["heatmap_data"]
+            heatmap_state["heatmap_data"] = heatmap_data
             heatmap_state["date_grid"] = view_data["date_grid"]
-            heatmap_state["num_weeks"] = view_data["num_weeks"]
-            heatmap_state["annotation"] = annotation
+            heatmap_state["num_weeks"] = num_weeks
+            heatmap_state["annotated_cell"] = None
 
-            ax_time_spent.clear()
-            ax_cumulative.clear()
             month_positions = np.arange(len(view_data["monthly_minutes"]))
-            ax_time_spent.bar(
-                month_positions,
-                view_data["monthly_minutes"],
-                width=0.5,
-                color=palette["time_per_day_bar_color"],
-                label="Time per month (min)"
-            )
-            ax_cumulative.plot(
-                month_positions,
-                view_data["cumulative_minutes"],
-                color=palette["time_cumulative_line_color"],
-                marker="o",
-                markerfacecolor=palette["axes_facecolor"],
-                markeredgecolor=palette["time_cumulative_line_color"],
-                linewidth=1.8,
-                label="Cumulative time (min)"
-            )
+            month_bars = heatmap_state["month_bars"]
+            if month_bars is not None and len(month_bars) == len(
+                month_positions
+            ):
+                for bar, minutes in zip(
+                    month_bars,
+                    view_data["monthly_minutes"]
+                ):
+                    bar.set_height(minutes)
+            else:
+                # A window can span 12 or 13 months; rebuild the bars only
+                # when that count changes.
+                if month_bars is not None:
+                    month_bars.remove()
+                heatmap_state["month_bars"] = ax_time_spent.bar(
+                    month_positions,
+                    view_data["monthly_minutes"],
+                    width=0.5,
+                    color=palette["time_per_day_bar_color"],
+                    label="Time per month (min)"
+                )
+            cumulative_line = heatmap_state["cumulative_line"]
+            if cumulative_line is None:
+                (heatmap_state["cumulative_line"],) = ax_cumulative.plot(
+                    month_positions,
+                    view_data["cumulative_minutes"],
+                    color=palette["time_cumulative_line_color"],
+                    marker="o",
+                    markerfacecolor=palette["axes_facecolor"],
+                    markeredgecolor=palette["time_cumulative_line_color"],
+                    linewidth=1.8,
+                    label="Cumulative time (min)"
+                )
+                ax_time_spent.set_ylabel("Minutes per month")
+                ax_cumulative.set_ylabel("Cumulative minutes")
+                ax_time_spent.set_xlabel("Month")
+                ax_time_spent.yaxis.set_major_formatter(y_formatter)
+                ax_cumulative.yaxis.set_major_formatter(y_formatter)
+                handles, labels = ax_time_spent.get_legend_handles_labels()
+                handles2, labels2 = ax_cumulative.get_legend_handles_labels()
+                legend = ax_time_spent.legend(
+                    handles + handles2,
+                    labels + labels2,
+                    loc="upper left",
+                    frameon=False
+                )
+                self._style_legend(legend, palette)
+            else:
+                cumulative_line.set_data(
+                    month_positions,
+                    view_data["cumulative_minutes"]
+                )
+                ax_time_spent.relim()
+                ax_time_spent.autoscale_view()
+                ax_cumulative.relim()
+                ax_cumulative.autoscale_view()
             if len(month_positions) > 0:
                 ax_time_spent.set_xticks(month_positions)
                 ax_time_spent.set_xticklabels(
@@ -2581,23 +1677,9 @@ class PlotMixin:
             else:
                 ax_time_spent.set_xticks([])
                 ax_time_spent.set_xticklabels([])
-            ax_time_spent.set_ylabel("Minutes per month")
-            ax_cumulative.set_ylabel("Cumulative minutes")
-            ax_time_spent.set_xlabel("Month")
             ax_time_spent.set_title(
                 f"Time spent progression ({view_data['range_label']})"
             )
-            ax_time_spent.yaxis.set_major_formatter(y_formatter)
-            ax_cumulative.yaxis.set_major_formatter(y_formatter)
-            handles, labels = ax_time_spent.get_legend_handles_labels()
-            handles2, labels2 = ax_cumulative.get_legend_handles_labels()
-            legend = ax_time_spent.legend(
-                handles + handles2,
-                labels + labels2,
-                loc="upper left",
-                frameon=False
-            )
-            self._style_legend(legend, palette)
             self._apply_plot_theme(fig, palette)
             _style_year_buttons()
             fig.canvas.draw_idle()
@@ -2618,7 +1700,7 @@ class PlotMixin:
                 or event.ydata is None
                 or annotation is None
                 or heatmap_data is None
-                or not date_grid
+                or date_grid is None
             ):
                 if annotation and annotation.get_visible():
                     annotation.set_visible(False)
@@ -2636,9 +1718,16 @@ class PlotMixin:
                     annotation.set_visible(False)
                     fig.canvas.draw_idle()
                 return
-            date_value = date_grid[weekday_idx][week_idx]
+            # Moving within the cell that is already annotated changes
+            # nothing, so skip the redraw.
+            if (
+                annotation.get_visible()
+                and heatmap_state["annotated_cell"] == (week_idx, weekday_idx)
+            ):
+                return
+            date_ordinal = int(date_grid[weekday_idx, week_idx])
             cell_value = heatmap_data[weekday_idx, week_idx]
-            if date_value is None or not np.isfinite(cell_value):
+            if date_ordinal < 0 or not np.isfinite(cell_value):
                 if annotation.get_visible():
                     annotation.set_visible(False)
                     fig.canvas.draw_idle()
@@ -2650,16 +1739,18 @@ class PlotMixin:
             else:
                 annotation.xytext = (15, 15)
                 annotation.set_ha("left")
+            date_value = date.fromordinal(date_ordinal)
             annotation.set_text(
                 f"{date_value.strftime('%Y-%m-%d (%a)')}\n"
                 f"Time: {_format_minutes(cell_value)}"
             )
             annotation.set_visible(True)
+            heatmap_state["annotated_cell"] = (week_idx, weekday_idx)
             fig.canvas.draw_idle()
 
         def _build_pie_chart(
             ax: plt.Axes,
-            values: list[float],
+            values: np.ndarray,
             label_texts: list[str],
             colors: list[str],
             title: str
@@ -2670,7 +1761,7 @@ class PlotMixin:
             ax.set_yticks([])
             for spine in ax.spines.values():
                 spine.set_visible(False)
-            total = sum(values)
+            total = float(values.sum())
             if total <= 0.0:
                 ax.text(
                     0.5,
@@ -2704,11 +1795,12 @@ class PlotMixin:
             ax.set_title(title, pad=16)
 
         mode_order = ["typing", "letter", "number", "character"]
-        mode_minutes = [mode_seconds[key] / 60.0 for key in mode_order]
-        training_minutes = [
-            training_seconds["training"] / 60.0,
-            training_seconds["regular"] / 60.0
-        ]
+        mode_minutes = np.array(
+            [mode_seconds[key] for key in mode_order]
+        ) / 60.0
+        training_minutes = np.array(
+            [training_seconds["training"], training_seconds["regular"]]
+        ) / 60.0
 
         mode_colors = palette["pie_mode_colors"]
         _build_pie_chart(
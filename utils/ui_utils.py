@@ -13,6 +13,8 @@ import random
 import string
 import time
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, List
@@ -25,6 +27,8 @@ import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import ttk, messagebox
 
+import numpy as np
+
 try:
     import winreg
 except ImportError:
@@ -32,6 +36,8 @@ except ImportError:
 
 from .backend import (
     calculate_end_error_percentage,
+    scan_text_change,
+    text_to_codepoints,
     save_blind_letter_result,
     save_blind_number_result,
     save_blind_special_result,
@@ -124,6 +130,21 @@ SPECIAL_MODE_CHARACTERS = string.punctuation + "\u00a7\u00b2\u00b3"
 NUMBER_SEQUENCE_LENGTH = 100
 TARGET_TEXT_DISPLAY_WIDTH = 90
 TARGET_TEXT_LINE_LENGTH = 80
+TYPING_IDLE_UPDATE_INTERVAL_MS = 1000
+LETTER_PROGRESS_TEMPLATE = "Letter mode: type the {kind} letter shown ({index}/{total})"
+LETTER_SUDDEN_DEATH_PROGRESS_TEMPLATE = (
+    "Sudden death letter mode: type the letter shown (streak {index})"
+)
+SPECIAL_PROGRESS_TEMPLATE = (
+    "Special character mode: type the symbol shown ({index}/{total})"
+)
+SPECIAL_SUDDEN_DEATH_PROGRESS_TEMPLATE = (
+    "Sudden death special mode: type the symbol shown (streak {index})"
+)
+NUMBER_PROGRESS_TEMPLATE = "Number mode: type the digit shown ({index}/{total})"
+NUMBER_SUDDEN_DEATH_PROGRESS_TEMPLATE = (
+    "Sudden death number mode: type the digit shown (streak {index})"
+)
 LIGHT_THEME = {
     "background": "#f4f6fb",
     "surface": "#ffffff",
@@ -186,6 +207,17 @@ DARK_THEME = {
 }
 
 
+@dataclass(slots=True)
+class SequenceModeState:
+    """
+    Progress of a single-character training mode (letters, symbols or digits).
+    """
+    sequence: str = ""
+    index: int = 0
+    total: int = 0
+    correct: int = 0
+    errors: int = 0
+    history: List[str] = field(default_factory=list)
 
 
 class TypingTrainerApp(PlotMixin):
@@ -211,9 +243,12 @@ class TypingTrainerApp(PlotMixin):
         self.texts = texts
 
         self.selected_text: str = ""
-        self.target_text: str = ""
+        self.target_text = ""
         self.start_time: float | None = None
+        self._last_elapsed_decis: int = -1
+        self._elapsed_text: str = "0.0"
         self.update_job_id: str | None = None
+        self.typing_update_idle_id: str | None = None
         self.finished: bool = False
         self.stats_file_path: Path = get__file_path(STATS_FILE_NAME)
         self.letter_stats_file_path: Path = get__file_path(LETTER_STATS_FILE_NAME)
@@ -252,28 +287,23 @@ class TypingTrainerApp(PlotMixin):
         self.correct_count: int = 0
         self.previous_text: str = ""
         self.is_letter_mode: bool = False
-        self.letter_sequence: List[str] = []
-        self.letter_index: int = 0
-        self.letter_total_letters: int = 0
-        self.letter_errors: int = 0
-        self.letter_correct_letters: int = 0
+        self.letter_state = SequenceModeState()
         self.letter_previous_text: str = ""
         self.is_special_mode: bool = False
-        self.special_sequence: List[str] = []
-        self.special_index: int = 0
-        self.special_total_chars: int = 0
-        self.special_errors: int = 0
-        self.special_correct_chars: int = 0
+        self.special_state = SequenceModeState()
         self.is_number_mode: bool = False
-        self.number_sequence: List[str] = []
-        self.number_index: int = 0
-        self.number_total_digits: int = 0
-        self.number_errors: int = 0
-        self.number_correct_digits: int = 0
-        self.letter_input_history: List[str] = []
-        self.special_input_history: List[str] = []
-        self.number_input_history: List[str] = []
+        self.number_state = SequenceModeState()
         self.last_session_mode: str = "typing"
+        self._display_text_cache: dict[tk.Text, str] = {}
+        self._stats_summary_key: tuple[Any, ...] | None = None
+        self._error_tagged_inputs: set[tk.Text] = set()
+        self._typed_error_mask: np.ndarray = np.zeros(0, dtype=bool)
+        self._error_mask_widget: tk.Text | None = None
+        self._error_mask_tags_shown: bool = False
+        self._stats_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="stats"
+        )
         self.style = ttk.Style()
         self.dark_mode_enabled: bool = self._detect_system_dark_mode()
         self.dark_mode_var = tk.BooleanVar(
@@ -302,6 +332,20 @@ class TypingTrainerApp(PlotMixin):
 
         self._build_gui()
 
+    @property
+    def target_text(self) -> str:
+        """
+        Text the user has to type in the typing mode.
+        """
+        return self._target_text
+
+    @target_text.setter
+    def target_text(self, value: str) -> None:
+        """
+        Store the target text together with its code point array.
+        """
+        self._target_text = value
+        self._target_codepoints = text_to_codepoints(value)
 
     def _build_gui(self) -> None:
         """
@@ -733,6 +777,17 @@ class TypingTrainerApp(PlotMixin):
             return not is_training_run
         return True
 
+    def _training_filter_mask(self, training: np.ndarray) -> np.ndarray:
+        """
+        Vectorized variant of _should_include_training_entry for flag arrays.
+        """
+        filter_key = self._get_stats_filter_key()
+        if filter_key == "training_only":
+            return training
+        if filter_key == "regular_only":
+            return ~training
+        return np.ones(len(training), dtype=bool)
+
     def _block_target_copy(self, event: tk.Event) -> str:
         """
         Prevent copying from the target display widget.
@@ -900,6 +955,15 @@ class TypingTrainerApp(PlotMixin):
 
         self._render_typed_text_with_errors(typed_text, self.target_text)
 
+    def _clear_input_error_tags(self) -> None:
+        """
+        Remove the error tag from the active input widget if it was applied.
+        """
+        if self.input_text not in self._error_tagged_inputs:
+            return
+        self.input_text.tag_remove("error", "1.0", tk.END)
+        self._error_tagged_inputs.discard(self.input_text)
+
     def _render_typed_text_with_errors(
         self,
         typed_text: str,
@@ -908,20 +972,20 @@ class TypingTrainerApp(PlotMixin):
         """
         Populate the input widget with typed text and highlight mismatches.
         """
-        self.input_text.delete("1.0", tk.END)
-        self.input_text.tag_remove("error", "1.0", tk.END)
+        self._clear_input_error_tags()
+        self.input_text.replace("1.0", tk.END, typed_text)
 
         if not typed_text:
             return
 
-        self.input_text.insert("1.0", typed_text)
-
+        single_line = "\n" not in typed_text
         for index, char in enumerate(typed_text):
             target_char = target_text[index] if index < len(target_text) else ""
             if char != target_char:
-                start = f"1.0 + {index} chars"
-                end = f"1.0 + {index + 1} chars"
+                start = self._text_index(index, single_line)
+                end = self._text_index(index + 1, single_line)
                 self.input_text.tag_add("error", start, end)
+                self._error_tagged_inputs.add(self.input_text)
 
         self.input_text.see("end")
 
@@ -939,6 +1003,35 @@ class TypingTrainerApp(PlotMixin):
 
         self._render_typed_text_with_errors(typed_text, target_sequence)
 
+    def _set_display_text(self, content: str) -> None:
+        """
+        Replace the target display contents, rewriting only the changed span.
+        """
+        previous = self._display_text_cache.get(self.display_text)
+        if previous == content:
+            return
+        self.display_text.configure(state="normal")
+        if previous is None:
+            self.display_text.replace("1.0", tk.END, content)
+        else:
+            shared = min(len(previous), len(content))
+            prefix_len = 0
+            while prefix_len < shared and previous[prefix_len] == content[prefix_len]:
+                prefix_len += 1
+            suffix_len = 0
+            while (
+                suffix_len < shared - prefix_len
+                and previous[-suffix_len - 1] == content[-suffix_len - 1]
+            ):
+                suffix_len += 1
+            self.display_text.replace(
+                f"1.0 + {prefix_len} chars",
+                f"1.0 + {len(previous) - suffix_len} chars",
+                content[prefix_len:len(content) - suffix_len]
+            )
+        self.display_text.configure(state="disabled")
+        self._display_text_cache[self.display_text] = content
+
     def _apply_theme(self) -> None:
         """
         Apply the currently selected color theme to Tk and ttk widgets.
@@ -1352,10 +1445,7 @@ class TypingTrainerApp(PlotMixin):
         ]
         self.target_text = self._format_target_text(normalized_lines)
 
-        self.display_text.configure(state="normal")
-        self.display_text.delete("1.0", tk.END)
-        self.display_text.insert("1.0", self.target_text)
-        self.display_text.configure(state="disabled")
+        self._set_display_text(self.target_text)
         self._update_blind_target_indicator(0)
 
         self.info_text_var.set(
@@ -1382,62 +1472,65 @@ class TypingTrainerApp(PlotMixin):
         :param exit_special_mode: Whether special mode should be deactivated
         """
         if clear_display:
-            self.display_text.configure(state="normal")
-            self.display_text.delete("1.0", tk.END)
-            self.display_text.configure(state="disabled")
+            self._set_display_text("")
             self.selected_text = ""
             self.target_text = ""
 
         self.input_text.delete("1.0", tk.END)
-        self.input_text.tag_remove("error", "1.0", tk.END)
+        self._clear_input_error_tags()
 
         self.start_time = None
         self.finished = False
         self.error_count = 0
         self.correct_count = 0
         self.previous_text = ""
+        self._typed_error_mask = np.zeros(0, dtype=bool)
+        self._error_mask_widget = None
         self.sudden_death_failure_triggered = False
-        self.letter_errors = 0
-        self.letter_correct_letters = 0
+        self.letter_state.errors = 0
+        self.letter_state.correct = 0
         self.letter_previous_text = ""
-        self.number_errors = 0
-        self.number_correct_digits = 0
-        self.special_errors = 0
-        self.special_correct_chars = 0
-
-        self.letter_input_history = []
-        self.special_input_history = []
-        self.number_input_history = []
+        self.number_state.errors = 0
+        self.number_state.correct = 0
+        self.special_state.errors = 0
+        self.special_state.correct = 0
+
+        self.letter_state.history = []
+        self.special_state.history = []
+        self.number_state.history = []
         self.blind_reveal_active = False
 
         if exit_letter_mode:
             self.is_letter_mode = False
-            self.letter_sequence = []
-            self.letter_index = 0
-            self.letter_total_letters = 0
+            self.letter_state.sequence = ""
+            self.letter_state.index = 0
+            self.letter_state.total = 0
 
         if exit_number_mode:
             self.is_number_mode = False
-            self.number_sequence = []
-            self.number_index = 0
-            self.number_total_digits = 0
+            self.number_state.sequence = ""
+            self.number_state.index = 0
+            self.number_state.total = 0
 
         if exit_special_mode:
             self.is_special_mode = False
-            self.special_sequence = []
-            self.special_index = 0
-            self.special_total_chars = 0
+            self.special_state.sequence = ""
+            self.special_state.index = 0
+            self.special_state.total = 0
 
         if exit_letter_mode and exit_number_mode and exit_special_mode:
             self.last_session_mode = "typing"
 
-        self.stats_summary_var.set(
+        self._set_stats_summary(
             "Time: 0.0 s  |  WPM: 0.0  |  Errors: 0  |  Error %: 0.0"
         )
 
         if self.update_job_id is not None:
             self.master.after_cancel(self.update_job_id)
             self.update_job_id = None
+        if self.typing_update_idle_id is not None:
+            self.master.after_cancel(self.typing_update_idle_id)
+            self.typing_update_idle_id = None
         self._update_input_visibility()
         self._update_blind_target_indicator()
 
@@ -1467,22 +1560,13 @@ class TypingTrainerApp(PlotMixin):
         """
         self.reset_session(clear_display=True)
         self.is_letter_mode = True
-        self.letter_sequence = []
-        self.letter_index = 0
-        self.letter_total_letters = 0
+        self.letter_state.sequence = ""
+        self.letter_state.index = 0
+        self.letter_state.total = 0
         self._extend_letter_sequence()
-        self.letter_errors = 0
-        self.letter_correct_letters = 0
+        self.letter_state.errors = 0
+        self.letter_state.correct = 0
         self.start_time = None
-        if self.is_sudden_death_active():
-            info_text = (
-                "Sudden death letter mode: random letters until the first mistake."
-            )
-        else:
-            info_text = (
-                "Letter mode: random letters (upper/lower). Progress 0/100."
-            )
-        self.info_text_var.set(info_text)
         self._update_letter_display()
         self.update_letter_status_label()
         self.last_session_mode = "letter"
@@ -1494,16 +1578,17 @@ class TypingTrainerApp(PlotMixin):
         if chunk_size <= 0:
             return
         previous_lower = (
-            self.letter_sequence[-1].lower() if self.letter_sequence else ""
+            self.letter_state.sequence[-1].lower() if self.letter_state.sequence else ""
         )
-        target_length = len(self.letter_sequence) + chunk_size
-        while len(self.letter_sequence) < target_length:
+        new_letters: List[str] = []
+        while len(new_letters) < chunk_size:
             candidate = random.choice(LETTER_MODE_CHARACTERS)
             if previous_lower and candidate.lower() == previous_lower:
                 continue
-            self.letter_sequence.append(candidate)
+            new_letters.append(candidate)
             previous_lower = candidate.lower()
-        self.letter_total_letters = len(self.letter_sequence)
+        self.letter_state.sequence += "".join(new_letters)
+        self.letter_state.total = len(self.letter_state.sequence)
 
 
     def handle_letter_mode_keypress(self, event: tk.Event) -> None:
@@ -1517,11 +1602,11 @@ class TypingTrainerApp(PlotMixin):
             if self._handle_letter_backspace():
                 return
 
-        if self.letter_index >= self.letter_total_letters:
+        if self.letter_state.index >= self.letter_state.total:
             return
 
         if self.start_time is None and len(event.char) == 1 and event.char.isprintable():
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
 
         # Ensure we react after Tk has updated the text widget.
         self.master.after_idle(self._process_letter_mode_input)
@@ -1534,87 +1619,87 @@ class TypingTrainerApp(PlotMixin):
         if not self.is_letter_mode:
             return
 
-        if self.letter_index >= self.letter_total_letters:
+        state = self.letter_state
+        if state.index >= state.total:
             return
 
-        typed_text = self.input_text.get("1.0", "end-1c").replace("\n", "")
+        sudden_death = self.is_sudden_death_active()
+        blind = self.is_blind_mode_active()
+        # Only the most recent character matters; the input is cleared after
+        # every evaluated key, so peek at the last character first.
+        typed_text = self.input_text.get("end-2c", "end-1c")
+        if typed_text == "\n":
+            typed_text = self.input_text.get("1.0", "end-1c").replace("\n", "")[-1:]
 
         if typed_text == "":
-            self.input_text.tag_remove("error", "1.0", tk.END)
-            self.update_letter_status_label()
+            self._clear_input_error_tags()
+            self.update_letter_status_label(sudden_death, blind)
             return
 
-        if len(typed_text) > 1:
-            typed_text = typed_text[-1]
-            self.input_text.delete("1.0", tk.END)
-            self.input_text.insert("1.0", typed_text)
-
         current_char = typed_text
-        target_letter = self.letter_sequence[self.letter_index]
+        target_letter = state.sequence[state.index]
 
         is_correct = current_char == target_letter
-        advance_on_error = self.is_blind_mode_active()
 
         if is_correct:
-            self.letter_input_history.append(current_char)
-            self.letter_correct_letters += 1
-            self.letter_index += 1
+            state.history.append(current_char)
+            state.correct += 1
+            state.index += 1
             self.input_text.delete("1.0", tk.END)
-            if self.letter_index >= self.letter_total_letters:
-                if self.is_sudden_death_active():
+            if state.index >= state.total:
+                if sudden_death:
                     self._extend_letter_sequence()
-                    self._update_letter_display()
-                    self.update_letter_status_label()
+                    self._update_letter_display(sudden_death)
+                    self.update_letter_status_label(sudden_death, blind)
                 else:
-                    self.finish_letter_mode_session(
-                        sudden_death=self.is_sudden_death_active()
-                    )
+                    self.finish_letter_mode_session()
             else:
-                self._update_letter_display()
-                self.update_letter_status_label()
+                self._update_letter_display(sudden_death)
+                self.update_letter_status_label(sudden_death, blind)
             return
 
         # incorrect input
-        self.letter_errors += 1
+        state.errors += 1
 
-        if self.is_sudden_death_active():
+        if sudden_death:
             self.finish_letter_mode_session(sudden_death=True)
             return
 
-        if advance_on_error:
-            self.letter_input_history.append(current_char)
-            self.letter_index += 1
+        if blind:
+            state.history.append(current_char)
+            state.index += 1
             self.input_text.delete("1.0", tk.END)
-            if self.letter_index >= self.letter_total_letters:
+            if state.index >= state.total:
                 self.finish_letter_mode_session()
             else:
-                self._update_letter_display()
-                self.update_letter_status_label()
+                self._update_letter_display(sudden_death)
+                self.update_letter_status_label(sudden_death, blind)
             return
 
         self.input_text.delete("1.0", tk.END)
-        self.update_letter_status_label()
+        self.update_letter_status_label(sudden_death, blind)
 
     def _handle_letter_backspace(self) -> bool:
         """
         Allow undoing the last confirmed letter when not in sudden death mode.
         """
-        if self.letter_index <= 0 or not self.letter_input_history:
+        state = self.letter_state
+        if state.index <= 0 or not state.history:
             return False
 
-        self.letter_index -= 1
-        last_char = self.letter_input_history.pop()
+        state.index -= 1
+        last_char = state.history.pop()
         target_letter = (
-            self.letter_sequence[self.letter_index]
-            if self.letter_index < len(self.letter_sequence)
+            state.sequence[state.index]
+            if state.index < len(state.sequence)
             else ""
         )
         if last_char == target_letter:
-            if self.letter_correct_letters > 0:
-                self.letter_correct_letters -= 1
+            if state.correct > 0:
+                state.correct -= 1
         else:
-            if self.letter_errors > 0:
-                self.letter_errors -= 1
+            if state.errors > 0:
+                state.errors -= 1
 
         self.input_text.delete("1.0", tk.END)
         self._update_letter_display()
@@ -1622,67 +1707,73 @@ class TypingTrainerApp(PlotMixin):
         return True
 
 
-    def _update_letter_display(self) -> None:
+    def _update_letter_display(self, sudden_death: bool | None = None) -> None:
         """
         Show the current target letter inside the display text widget.
         """
-        self.display_text.configure(state="normal")
-        self.display_text.delete("1.0", tk.END)
-
-        if self.is_letter_mode and self.letter_index < self.letter_total_letters:
-            next_letter = self.letter_sequence[self.letter_index]
+        if sudden_death is None:
+            sudden_death = self.is_sudden_death_active()
+        if self.is_letter_mode and self.letter_state.index < self.letter_state.total:
+            next_letter = self.letter_state.sequence[self.letter_state.index]
             letter_type = "(uppercase letter)" if next_letter.isupper() else ""
-            self.display_text.insert(
-                "1.0",
-                f"{next_letter}\n{letter_type.upper()}"
-            )
-            if self.is_sudden_death_active():
-                progress = (
-                    "Sudden death letter mode: type the letter shown "
-                    f"(streak {self.letter_index})"
+            content = f"{next_letter}\n{letter_type.upper()}"
+            if sudden_death:
+                progress = LETTER_SUDDEN_DEATH_PROGRESS_TEMPLATE.format(
+                    index=self.letter_state.index
                 )
             else:
-                progress = (
-                    f"Letter mode: type the {letter_type} letter shown "
-                    f"({self.letter_index}/{self.letter_total_letters})"
+                progress = LETTER_PROGRESS_TEMPLATE.format(
+                    kind=letter_type,
+                    index=self.letter_state.index,
+                    total=self.letter_state.total
                 )
             self.info_text_var.set(progress)
         else:
+            content = ""
             self.info_text_var.set(
                 "Letter mode: No active letter. Click the button to start."
             )
 
-        self.display_text.configure(state="disabled")
+        self._set_display_text(content)
 
 
-    def update_letter_status_label(self) -> None:
+    def update_letter_status_label(
+        self,
+        sudden_death: bool | None = None,
+        blind: bool | None = None
+    ) -> None:
         """
         Update the shared WPM label with letter mode specific information.
         """
         if not self.is_letter_mode:
             return
 
+        if sudden_death is None:
+            sudden_death = self.is_sudden_death_active()
+        if blind is None:
+            blind = self.is_blind_mode_active()
+
         elapsed_seconds = 0.0
         letters_per_minute = 0.0
 
         if self.start_time is not None:
-            elapsed_seconds = max(time.time() - self.start_time, 0.0001)
+            elapsed_seconds = max(time.monotonic() - self.start_time, 0.0001)
             elapsed_minutes = elapsed_seconds / 60.0
             if elapsed_minutes > 0.0:
-                letters_per_minute = self.letter_correct_letters / elapsed_minutes
+                letters_per_minute = self.letter_state.correct / elapsed_minutes
 
-        if self.is_sudden_death_active():
-            progress = f"{self.letter_correct_letters} correct (no limit)"
+        if sudden_death:
+            progress = f"{self.letter_state.correct} correct (no limit)"
         else:
-            progress = f"{self.letter_index}/{self.letter_total_letters}"
+            progress = f"{self.letter_state.index}/{self.letter_state.total}"
 
-        if self.is_blind_mode_active():
+        if blind:
             error_text = "Errors: hidden"
         else:
-            error_text = f"Errors: {self.letter_errors}"
+            error_text = f"Errors: {self.letter_state.errors}"
 
-        self.stats_summary_var.set(
-            f"Letter mode  |  Time: {elapsed_seconds:.1f} s  |  "
+        self._set_stats_summary(
+            f"Letter mode  |  Time: {self._format_elapsed(elapsed_seconds)} s  |  "
             f"Letters/min: {letters_per_minute:.1f}  |  "
             f"Progress: {progress}  |  "
             f"{error_text}"
@@ -1696,40 +1787,41 @@ class TypingTrainerApp(PlotMixin):
         if not self.is_letter_mode:
             return
 
+        is_training_run = self.training_run_var.get()
+        blind = self.is_blind_mode_active()
         elapsed_seconds = 0.0
         letters_per_minute = 0.0
         if self.start_time is not None:
-            elapsed_seconds = max(time.time() - self.start_time, 0.0001)
+            elapsed_seconds = max(time.monotonic() - self.start_time, 0.0001)
             elapsed_minutes = elapsed_seconds / 60.0
             if elapsed_minutes > 0.0:
-                letters_per_minute = self.letter_correct_letters / elapsed_minutes
+                letters_per_minute = self.letter_state.correct / elapsed_minutes
 
-        completed_sequence = self.letter_index >= self.letter_total_letters
-        typed_letters_text = "".join(self.letter_input_history)
+        completed_sequence = self.letter_state.index >= self.letter_state.total
+        typed_letters_text = "".join(self.letter_state.history)
         typed_letters_count = len(typed_letters_text)
         blind_end_error_percentage: float | None = None
-        if self.is_blind_mode_active() and typed_letters_count > 0:
+        if blind and typed_letters_count > 0:
             if sudden_death:
                 total_targets = max(typed_letters_count, 1)
             else:
-                total_targets = max(self.letter_total_letters, 1)
-            target_letters = "".join(self.letter_sequence[:total_targets])
+                total_targets = max(self.letter_state.total, 1)
             blind_end_error_percentage = calculate_end_error_percentage(
-                target_letters,
+                self.letter_state.sequence,
                 typed_letters_text,
                 total_targets
             )
 
         if sudden_death:
-            correct_letters = self.letter_correct_letters
-            if not self.is_blind_mode_active():
+            correct_letters = self.letter_state.correct
+            if not blind:
                 save_sudden_death_letter_result(
                     self.sudden_death_letter_stats_file_path,
                     letters_per_minute,
                     correct_letters,
                     elapsed_seconds,
                     completed=completed_sequence,
-                    is_training_run=self.training_run_var.get()
+                    is_training_run=is_training_run
                 )
             if completed_sequence:
                 display_message = (
@@ -1739,16 +1831,7 @@ class TypingTrainerApp(PlotMixin):
                 info_message = (
                     "Sudden death letter mode complete. Start a new run to continue."
                 )
-                summary = (
-                    f"Sudden death letter complete  |  Time: {elapsed_seconds:.1f} s  |  "
-                    f"Letters/min: {letters_per_minute:.1f}  |  "
-                    f"Correct letters: {correct_letters}"
-                    + (
-                        f"  |  End error %: {blind_end_error_percentage:.1f}"
-                        if blind_end_error_percentage is not None
-                        else ""
-                    )
-                )
+                outcome = "complete"
             else:
                 display_message = (
                     f"Sudden death failed after {correct_letters} letters. "
@@ -1757,26 +1840,27 @@ class TypingTrainerApp(PlotMixin):
                 info_message = (
                     "Sudden death letter mode failed. Start a new run to retry."
                 )
-                summary = (
-                    f"Sudden death letter failed  |  Time: {elapsed_seconds:.1f} s  |  "
-                    f"Letters/min: {letters_per_minute:.1f}  |  "
-                    f"Correct letters: {correct_letters}"
-                    + (
-                        f"  |  End error %: {blind_end_error_percentage:.1f}"
-                        if blind_end_error_percentage is not None
-                        else ""
-                    )
+                outcome = "failed"
+            summary = (
+                f"Sudden death letter {outcome}  |  Time: {elapsed_seconds:.1f} s  |  "
+                f"Letters/min: {letters_per_minute:.1f}  |  "
+                f"Correct letters: {correct_letters}"
+                + (
+                    f"  |  End error %: {blind_end_error_percentage:.1f}"
+                    if blind_end_error_percentage is not None
+                    else ""
                 )
+            )
         else:
-            total_letters = max(self.letter_total_letters, 1)
-            error_percentage = (self.letter_errors / total_letters) * 100.0
-            if not self.is_blind_mode_active():
+            total_letters = max(self.letter_state.total, 1)
+            error_percentage = (self.letter_state.errors / total_letters) * 100.0
+            if not blind:
                 save_letter_result(
                     self.letter_stats_file_path,
                     letters_per_minute,
                     error_percentage,
                     elapsed_seconds,
-                    self.training_run_var.get()
+                    is_training_run
                 )
             display_message = (
                 "Letter mode finished. Click 'Letter mode' to start again."
@@ -1784,7 +1868,7 @@ class TypingTrainerApp(PlotMixin):
             info_message = (
                 "Letter mode finished. Start a new run via the Letter mode button."
             )
-            if self.is_blind_mode_active():
+            if blind:
                 if blind_end_error_percentage is not None:
                     error_summary = (
                         f"End error %: {blind_end_error_percentage:.1f}"
@@ -1793,7 +1877,7 @@ class TypingTrainerApp(PlotMixin):
                     error_summary = "Errors: hidden"
             else:
                 error_summary = (
-                    f"Errors: {self.letter_errors}  |  "
+                    f"Errors: {self.letter_state.errors}  |  "
                     f"Error %: {error_percentage:.1f}"
                 )
             summary = (
@@ -1802,20 +1886,14 @@ class TypingTrainerApp(PlotMixin):
                 f"{error_summary}"
             )
 
-        target_letters_for_display = "".join(
-            self.letter_sequence[:len(typed_letters_text)]
-        )
+        target_letters_for_display = self.letter_state.sequence[:len(typed_letters_text)]
 
-        self.display_text.configure(state="normal")
-        self.display_text.delete("1.0", tk.END)
-        display_content = (
+        self._set_display_text(
             f"{display_message}\n\nTarget sequence:\n{target_letters_for_display}"
         )
-        self.display_text.insert("1.0", display_content)
-        self.display_text.configure(state="disabled")
 
         self.info_text_var.set(info_message)
-        self.stats_summary_var.set(summary)
+        self._set_stats_summary(summary)
 
         self._display_sequence_result(
             typed_letters_text,
@@ -1824,12 +1902,12 @@ class TypingTrainerApp(PlotMixin):
 
         self.is_letter_mode = False
         self.start_time = None
-        self.letter_sequence = []
-        self.letter_index = 0
-        self.letter_total_letters = 0
-        self.letter_errors = 0
-        self.letter_correct_letters = 0
-        self.letter_input_history = []
+        self.letter_state.sequence = ""
+        self.letter_state.index = 0
+        self.letter_state.total = 0
+        self.letter_state.errors = 0
+        self.letter_state.correct = 0
+        self.letter_state.history = []
         self.last_session_mode = "letter"
 
         if blind_end_error_percentage is not None:
@@ -1840,7 +1918,7 @@ class TypingTrainerApp(PlotMixin):
                 duration_seconds=elapsed_seconds,
                 completed=completed_sequence if sudden_death else True,
                 end_error_percentage=blind_end_error_percentage,
-                is_training_run=self.training_run_var.get()
+                is_training_run=is_training_run
             )
 
 
@@ -1850,22 +1928,13 @@ class TypingTrainerApp(PlotMixin):
         """
         self.reset_session(clear_display=True)
         self.is_special_mode = True
-        self.special_sequence = []
-        self.special_index = 0
-        self.special_total_chars = 0
+        self.special_state.sequence = ""
+        self.special_state.index = 0
+        self.special_state.total = 0
         self._extend_special_sequence()
-        self.special_errors = 0
-        self.special_correct_chars = 0
+        self.special_state.errors = 0
+        self.special_state.correct = 0
         self.start_time = None
-        if self.is_sudden_death_active():
-            info_text = (
-                "Sudden death special mode: punctuation practice until the first error."
-            )
-        else:
-            info_text = (
-                "Special character mode: focus on punctuation and symbols. Progress 0/100."
-            )
-        self.info_text_var.set(info_text)
         self._update_special_display()
         self.update_special_status_label()
         self.last_session_mode = "special"
@@ -1876,15 +1945,16 @@ class TypingTrainerApp(PlotMixin):
         """
         if chunk_size <= 0:
             return
-        previous_char = self.special_sequence[-1] if self.special_sequence else ""
-        target_length = len(self.special_sequence) + chunk_size
-        while len(self.special_sequence) < target_length:
+        previous_char = self.special_state.sequence[-1] if self.special_state.sequence else ""
+        new_chars: List[str] = []
+        while len(new_chars) < chunk_size:
             candidate = random.choice(SPECIAL_MODE_CHARACTERS)
             if previous_char and candidate == previous_char:
                 continue
-            self.special_sequence.append(candidate)
+            new_chars.append(candidate)
             previous_char = candidate
-        self.special_total_chars = len(self.special_sequence)
+        self.special_state.sequence += "".join(new_chars)
+        self.special_state.total = len(self.special_state.sequence)
 
     def handle_special_mode_keypress(self, event: tk.Event) -> None:
         """
@@ -1897,11 +1967,11 @@ class TypingTrainerApp(PlotMixin):
             if self._handle_special_backspace():
                 return
 
-        if self.special_index >= self.special_total_chars:
+        if self.special_state.index >= self.special_state.total:
             return
 
         if self.start_time is None and len(event.char) == 1 and event.char.isprintable():
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
 
         self.master.after_idle(self._process_special_mode_input)
 
@@ -1912,151 +1982,156 @@ class TypingTrainerApp(PlotMixin):
         if not self.is_special_mode:
             return
 
-        if self.special_index >= self.special_total_chars:
+        state = self.special_state
+        if state.index >= state.total:
             return
 
-        typed_text = self.input_text.get("1.0", "end-1c").replace("\n", "")
+        sudden_death = self.is_sudden_death_active()
+        blind = self.is_blind_mode_active()
+        # Only the most recent character matters; the input is cleared after
+        # every evaluated key, so peek at the last character first.
+        typed_text = self.input_text.get("end-2c", "end-1c")
+        if typed_text == "\n":
+            typed_text = self.input_text.get("1.0", "end-1c").replace("\n", "")[-1:]
 
         if typed_text == "":
-            self.input_text.tag_remove("error", "1.0", tk.END)
-            self.update_special_status_label()
+            self._clear_input_error_tags()
+            self.update_special_status_label(sudden_death, blind)
             return
 
-        if len(typed_text) > 1:
-            typed_text = typed_text[-1]
-            self.input_text.delete("1.0", tk.END)
-            self.input_text.insert("1.0", typed_text)
-
         current_char = typed_text
-        target_symbol = self.special_sequence[self.special_index]
+        target_symbol = state.sequence[state.index]
 
         is_correct = current_char == target_symbol
-        advance_on_error = self.is_blind_mode_active()
 
         if is_correct:
-            self.special_input_history.append(current_char)
-            self.special_correct_chars += 1
-            self.special_index += 1
+            state.history.append(current_char)
+            state.correct += 1
+            state.index += 1
             self.input_text.delete("1.0", tk.END)
-            if self.special_index >= self.special_total_chars:
-                if self.is_sudden_death_active():
+            if state.index >= state.total:
+                if sudden_death:
                     self._extend_special_sequence()
-                    self._update_special_display()
-                    self.update_special_status_label()
+                    self._update_special_display(sudden_death)
+                    self.update_special_status_label(sudden_death, blind)
                 else:
-                    self.finish_special_mode_session(
-                        sudden_death=self.is_sudden_death_active()
-                    )
+                    self.finish_special_mode_session()
             else:
-                self._update_special_display()
-                self.update_special_status_label()
+                self._update_special_display(sudden_death)
+                self.update_special_status_label(sudden_death, blind)
             return
 
         # incorrect input
-        self.special_errors += 1
+        state.errors += 1
 
-        if self.is_sudden_death_active():
+        if sudden_death:
             self.finish_special_mode_session(sudden_death=True)
             return
 
-        if advance_on_error:
-            self.special_input_history.append(current_char)
-            self.special_index += 1
+        if blind:
+            state.history.append(current_char)
+            state.index += 1
             self.input_text.delete("1.0", tk.END)
-            if self.special_index >= self.special_total_chars:
+            if state.index >= state.total:
                 self.finish_special_mode_session()
             else:
-                self._update_special_display()
-                self.update_special_status_label()
+                self._update_special_display(sudden_death)
+                self.update_special_status_label(sudden_death, blind)
             return
 
         self.input_text.delete("1.0", tk.END)
-        self.update_special_status_label()
+        self.update_special_status_label(sudden_death, blind)
 
     def _handle_special_backspace(self) -> bool:
         """
         Allow undoing the last confirmed symbol when not in sudden death mode.
         """
-        if self.special_index <= 0 or not self.special_input_history:
+        state = self.special_state
+        if state.index <= 0 or not state.history:
             return False
 
-        self.special_index -= 1
-        last_char = self.special_input_history.pop()
+        state.index -= 1
+        last_char = state.history.pop()
         target_symbol = (
-            self.special_sequence[self.special_index]
-            if self.special_index < len(self.special_sequence)
+            state.sequence[state.index]
+            if state.index < len(state.sequence)
             else ""
         )
         if last_char == target_symbol:
-            if self.special_correct_chars > 0:
-                self.special_correct_chars -= 1
+            if state.correct > 0:
+                state.correct -= 1
         else:
-            if self.special_errors > 0:
-                self.special_errors -= 1
+            if state.errors > 0:
+                state.errors -= 1
         self.input_text.delete("1.0", tk.END)
         self._update_special_display()
         self.update_special_status_label()
         return True
 
-    def _update_special_display(self) -> None:
+    def _update_special_display(self, sudden_death: bool | None = None) -> None:
         """
         Show the current target symbol inside the display text widget.
         """
-        self.display_text.configure(state="normal")
-        self.display_text.delete("1.0", tk.END)
-
-        if self.is_special_mode and self.special_index < self.special_total_chars:
-            next_symbol = self.special_sequence[self.special_index]
-            self.display_text.insert(
-                "1.0",
-                f"{next_symbol}\n(SYMBOL)"
-            )
-            if self.is_sudden_death_active():
-                progress = (
-                    "Sudden death special mode: type the symbol shown "
-                    f"(streak {self.special_index})"
+        if sudden_death is None:
+            sudden_death = self.is_sudden_death_active()
+        if self.is_special_mode and self.special_state.index < self.special_state.total:
+            next_symbol = self.special_state.sequence[self.special_state.index]
+            content = f"{next_symbol}\n(SYMBOL)"
+            if sudden_death:
+                progress = SPECIAL_SUDDEN_DEATH_PROGRESS_TEMPLATE.format(
+                    index=self.special_state.index
                 )
             else:
-                progress = (
-                    "Special character mode: type the symbol shown "
-                    f"({self.special_index}/{self.special_total_chars})"
+                progress = SPECIAL_PROGRESS_TEMPLATE.format(
+                    index=self.special_state.index,
+                    total=self.special_state.total
                 )
             self.info_text_var.set(progress)
         else:
+            content = ""
             self.info_text_var.set(
                 "Special character mode: No active symbol. Click the button to start."
             )
 
-        self.display_text.configure(state="disabled")
+        self._set_display_text(content)
 
-    def update_special_status_label(self) -> None:
+    def update_special_status_label(
+        self,
+        sudden_death: bool | None = None,
+        blind: bool | None = None
+    ) -> None:
         """
         Update the shared WPM label with special mode specific information.
         """
         if not self.is_special_mode:
             return
 
+        if sudden_death is None:
+            sudden_death = self.is_sudden_death_active()
+        if blind is None:
+            blind = self.is_blind_mode_active()
+
         elapsed_seconds = 0.0
         symbols_per_minute = 0.0
 
         if self.start_time is not None:
-            elapsed_seconds = max(time.time() - self.start_time, 0.0001)
+            elapsed_seconds = max(time.monotonic() - self.start_time, 0.0001)
             elapsed_minutes = elapsed_seconds / 60.0
             if elapsed_minutes > 0.0:
-                symbols_per_minute = self.special_correct_chars / elapsed_minutes
+                symbols_per_minute = self.special_state.correct / elapsed_minutes
 
-        if self.is_sudden_death_active():
-            progress = f"{self.special_correct_chars} correct (no limit)"
+        if sudden_death:
+            progress = f"{self.special_state.correct} correct (no limit)"
         else:
-            progress = f"{self.special_index}/{self.special_total_chars}"
+            progress = f"{self.special_state.index}/{self.special_state.total}"
 
-        if self.is_blind_mode_active():
+        if blind:
             error_text = "Errors: hidden"
         else:
-            error_text = f"Errors: {self.special_errors}"
+            error_text = f"Errors: {self.special_state.errors}"
 
-        self.stats_summary_var.set(
-            f"Special char mode  |  Time: {elapsed_seconds:.1f} s  |  "
+        self._set_stats_summary(
+            f"Special char mode  |  Time: {self._format_elapsed(elapsed_seconds)} s  |  "
             f"Symbols/min: {symbols_per_minute:.1f}  |  "
             f"Progress: {progress}  |  "
             f"{error_text}"
@@ -2069,40 +2144,41 @@ class TypingTrainerApp(PlotMixin):
         if not self.is_special_mode:
             return
 
+        is_training_run = self.training_run_var.get()
+        blind = self.is_blind_mode_active()
         elapsed_seconds = 0.0
         symbols_per_minute = 0.0
         if self.start_time is not None:
-            elapsed_seconds = max(time.time() - self.start_time, 0.0001)
+            elapsed_seconds = max(time.monotonic() - self.start_time, 0.0001)
             elapsed_minutes = elapsed_seconds / 60.0
             if elapsed_minutes > 0.0:
-                symbols_per_minute = self.special_correct_chars / elapsed_minutes
+                symbols_per_minute = self.special_state.correct / elapsed_minutes
 
-        completed_sequence = self.special_index >= self.special_total_chars
-        typed_symbols_text = "".join(self.special_input_history)
+        completed_sequence = self.special_state.index >= self.special_state.total
+        typed_symbols_text = "".join(self.special_state.history)
         typed_symbols_count = len(typed_symbols_text)
         blind_end_error_percentage: float | None = None
-        if self.is_blind_mode_active() and typed_symbols_count > 0:
+        if blind and typed_symbols_count > 0:
             if sudden_death:
                 total_targets = max(typed_symbols_count, 1)
             else:
-                total_targets = max(self.special_total_chars, 1)
-            target_symbols = "".join(self.special_sequence[:total_targets])
+                total_targets = max(self.special_state.total, 1)
             blind_end_error_percentage = calculate_end_error_percentage(
-                target_symbols,
+                self.special_state.sequence,
                 typed_symbols_text,
                 total_targets
             )
 
         if sudden_death:
-            correct_symbols = self.special_correct_chars
-            if not self.is_blind_mode_active():
+            correct_symbols = self.special_state.correct
+            if not blind:
                 save_sudden_death_special_result(
                     self.sudden_death_special_stats_file_path,
                     symbols_per_minute,
                     correct_symbols,
                     elapsed_seconds,
                     completed=completed_sequence,
-                    is_training_run=self.training_run_var.get()
+                    is_training_run=is_training_run
                 )
             if completed_sequence:
                 display_message = (
@@ -2112,16 +2188,7 @@ class TypingTrainerApp(PlotMixin):
                 info_message = (
                     "Sudden death special mode complete. Start a new run to continue."
                 )
-                summary = (
-                    f"Sudden death special complete  |  Time: {elapsed_seconds:.1f} s  |  "
-                    f"Symbols/min: {symbols_per_minute:.1f}  |  "
-                    f"Correct symbols: {correct_symbols}"
-                    + (
-                        f"  |  End error %: {blind_end_error_percentage:.1f}"
-                        if blind_end_error_percentage is not None
-                        else ""
-                    )
-                )
+                outcome = "complete"
             else:
                 display_message = (
                     f"Sudden death failed after {correct_symbols} symbols. "
@@ -2130,26 +2197,27 @@ class TypingTrainerApp(PlotMixin):
                 info_message = (
                     "Sudden death special mode failed. Start a new run to retry."
                 )
-                summary = (
-                    f"Sudden death special failed  |  Time: {elapsed_seconds:.1f} s  |  "
-                    f"Symbols/min: {symbols_per_minute:.1f}  |  "
-                    f"Correct symbols: {correct_symbols}"
-                    + (
-                        f"  |  End error %: {blind_end_error_percentage:.1f}"
-                        if blind_end_error_percentage is not None
-                        else ""
-                    )
+                outcome = "failed"
+            summary = (
+                f"Sudden death special {outcome}  |  Time: {elapsed_seconds:.1f} s  |  "
+                f"Symbols/min: {symbols_per_minute:.1f}  |  "
+                f"Correct symbols: {correct_symbols}"
+                + (
+                    f"  |  End error %: {blind_end_error_percentage:.1f}"
+                    if blind_end_error_percentage is not None
+                    else ""
                 )
+            )
         else:
-            total_symbols = max(self.special_total_chars, 1)
-            error_percentage = (self.special_errors / total_symbols) * 100.0
-            if not self.is_blind_mode_active():
+            total_symbols = max(self.special_state.total, 1)
+            error_percentage = (self.special_state.errors / total_symbols) * 100.0
+            if not blind:
                 save_special_result(
                     self.special_stats_file_path,
                     symbols_per_minute,
                     error_percentage,
                     elapsed_seconds,
-                    self.training_run_var.get()
+                    is_training_run
                 )
             display_message = (
                 "Special character mode finished. Click 'Special char mode' to start again."
@@ -2157,7 +2225,7 @@ class TypingTrainerApp(PlotMixin):
             info_message = (
                 "Special character mode finished. Start a new run via the Special char mode button."
             )
-            if self.is_blind_mode_active():
+            if blind:
                 if blind_end_error_percentage is not None:
                     error_summary = (
                         f"End error %: {blind_end_error_percentage:.1f}"
@@ -2166,7 +2234,7 @@ class TypingTrainerApp(PlotMixin):
                     error_summary = "Errors: hidden"
             else:
                 error_summary = (
-                    f"Errors: {self.special_errors}  |  "
+                    f"Errors: {self.special_state.errors}  |  "
                     f"Error %: {error_percentage:.1f}"
                 )
             summary = (
@@ -2175,20 +2243,14 @@ class TypingTrainerApp(PlotMixin):
                 f"{error_summary}"
             )
 
-        target_symbols_for_display = "".join(
-            self.special_sequence[:len(typed_symbols_text)]
-        )
+        target_symbols_for_display = self.special_state.sequence[:len(typed_symbols_text)]
 
-        self.display_text.configure(state="normal")
-        self.display_text.delete("1.0", tk.END)
-        display_content = (
+        self._set_display_text(
             f"{display_message}\n\nTarget sequence:\n{target_symbols_for_display}"
         )
-        self.display_text.insert("1.0", display_content)
-        self.display_text.configure(state="disabled")
 
         self.info_text_var.set(info_message)
-        self.stats_summary_var.set(summary)
+        self._set_stats_summary(summary)
 
         self._display_sequence_result(
             typed_symbols_text,
@@ -2197,12 +2259,12 @@ class TypingTrainerApp(PlotMixin):
 
         self.is_special_mode = False
         self.start_time = None
-        self.special_sequence = []
-        self.special_index = 0
-        self.special_total_chars = 0
-        self.special_errors = 0
-        self.special_correct_chars = 0
-        self.special_input_history = []
+        self.special_state.sequence = ""
+        self.special_state.index = 0
+        self.special_state.total = 0
+        self.special_state.errors = 0
+        self.special_state.correct = 0
+        self.special_state.history = []
         self.last_session_mode = "special"
 
         if blind_end_error_percentage is not None:
@@ -2213,7 +2275,7 @@ class TypingTrainerApp(PlotMixin):
                 duration_seconds=elapsed_seconds,
                 completed=completed_sequence if sudden_death else True,
                 end_error_percentage=blind_end_error_percentage,
-                is_training_run=self.training_run_var.get()
+                is_training_run=is_training_run
             )
 
 
@@ -2223,22 +2285,13 @@ class TypingTrainerApp(PlotMixin):
         """
         self.reset_session(clear_display=True)
         self.is_number_mode = True
-        self.number_sequence = []
-        self.number_index = 0
-        self.number_total_digits = 0
+        self.number_state.sequence = ""
+        self.number_state.index = 0
+        self.number_state.total = 0
         self._extend_number_sequence()
-        self.number_errors = 0
-        self.number_correct_digits = 0
+        self.number_state.errors = 0
+        self.number_state.correct = 0
         self.start_time = None
-        if self.is_sudden_death_active():
-            info_text = (
-                "Sudden death number mode: keep typing digits until the first error."
-            )
-        else:
-            info_text = (
-                "Number mode: type digits with the numeric keypad. Progress 0/100."
-            )
-        self.info_text_var.set(info_text)
         self._update_number_display()
         self.update_number_status_label()
         self.last_session_mode = "number"
@@ -2249,15 +2302,16 @@ class TypingTrainerApp(PlotMixin):
         """
         if chunk_size <= 0:
             return
-        previous_digit = self.number_sequence[-1] if self.number_sequence else ""
-        target_length = len(self.number_sequence) + chunk_size
-        while len(self.number_sequence) < target_length:
+        previous_digit = self.number_state.sequence[-1] if self.number_state.sequence else ""
+        new_digits: List[str] = []
+        while len(new_digits) < chunk_size:
             candidate = random.choice(string.digits)
             if previous_digit and candidate == previous_digit:
                 continue
-            self.number_sequence.append(candidate)
+            new_digits.append(candidate)
             previous_digit = candidate
-        self.number_total_digits = len(self.number_sequence)
+        self.number_state.sequence += "".join(new_digits)
+        self.number_state.total = len(self.number_state.sequence)
 
 
     def handle_number_mode_keypress(self, event: tk.Event) -> None:
@@ -2271,11 +2325,11 @@ class TypingTrainerApp(PlotMixin):
             if self._handle_number_backspace():
                 return
 
-        if self.number_index >= self.number_total_digits:
+        if self.number_state.index >= self.number_state.total:
             return
 
         if self.start_time is None and len(event.char) == 1 and event.char.isprintable():
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
 
         self.master.after_idle(self._process_number_mode_input)
 
@@ -2287,152 +2341,157 @@ class TypingTrainerApp(PlotMixin):
         if not self.is_number_mode:
             return
 
-        if self.number_index >= self.number_total_digits:
+        state = self.number_state
+        if state.index >= state.total:
             return
 
-        typed_text = self.input_text.get("1.0", "end-1c").replace("\n", "")
+        sudden_death = self.is_sudden_death_active()
+        blind = self.is_blind_mode_active()
+        # Only the most recent character matters; the input is cleared after
+        # every evaluated key, so peek at the last character first.
+        typed_text = self.input_text.get("end-2c", "end-1c")
+        if typed_text == "\n":
+            typed_text = self.input_text.get("1.0", "end-1c").replace("\n", "")[-1:]
 
         if typed_text == "":
-            self.input_text.tag_remove("error", "1.0", tk.END)
-            self.update_number_status_label()
+            self._clear_input_error_tags()
+            self.update_number_status_label(sudden_death, blind)
             return
 
-        if len(typed_text) > 1:
-            typed_text = typed_text[-1]
-            self.input_text.delete("1.0", tk.END)
-            self.input_text.insert("1.0", typed_text)
-
         current_char = typed_text
-        target_digit = self.number_sequence[self.number_index]
+        target_digit = state.sequence[state.index]
 
         is_correct = current_char == target_digit
-        advance_on_error = self.is_blind_mode_active()
 
         if is_correct:
-            self.number_input_history.append(current_char)
-            self.number_correct_digits += 1
-            self.number_index += 1
+            state.history.append(current_char)
+            state.correct += 1
+            state.index += 1
             self.input_text.delete("1.0", tk.END)
-            if self.number_index >= self.number_total_digits:
-                if self.is_sudden_death_active():
+            if state.index >= state.total:
+                if sudden_death:
                     self._extend_number_sequence()
-                    self._update_number_display()
-                    self.update_number_status_label()
+                    self._update_number_display(sudden_death)
+                    self.update_number_status_label(sudden_death, blind)
                 else:
-                    self.finish_number_mode_session(
-                        sudden_death=self.is_sudden_death_active()
-                    )
+                    self.finish_number_mode_session()
             else:
-                self._update_number_display()
-                self.update_number_status_label()
+                self._update_number_display(sudden_death)
+                self.update_number_status_label(sudden_death, blind)
             return
 
         # incorrect input
-        self.number_errors += 1
+        state.errors += 1
 
-        if self.is_sudden_death_active():
+        if sudden_death:
             self.finish_number_mode_session(sudden_death=True)
             return
 
-        if advance_on_error:
-            self.number_input_history.append(current_char)
-            self.number_index += 1
+        if blind:
+            state.history.append(current_char)
+            state.index += 1
             self.input_text.delete("1.0", tk.END)
-            if self.number_index >= self.number_total_digits:
+            if state.index >= state.total:
                 self.finish_number_mode_session()
             else:
-                self._update_number_display()
-                self.update_number_status_label()
+                self._update_number_display(sudden_death)
+                self.update_number_status_label(sudden_death, blind)
             return
 
         self.input_text.delete("1.0", tk.END)
-        self.update_number_status_label()
+        self.update_number_status_label(sudden_death, blind)
 
     def _handle_number_backspace(self) -> bool:
         """
         Allow undoing the last confirmed digit when not in sudden death mode.
         """
-        if self.number_index <= 0 or not self.number_input_history:
+        state = self.number_state
+        if state.index <= 0 or not state.history:
             return False
 
-        self.number_index -= 1
-        last_char = self.number_input_history.pop()
+        state.index -= 1
+        last_char = state.history.pop()
         target_digit = (
-            self.number_sequence[self.number_index]
-            if self.number_index < len(self.number_sequence)
+            state.sequence[state.index]
+            if state.index < len(state.sequence)
             else ""
         )
         if last_char == target_digit:
-            if self.number_correct_digits > 0:
-                self.number_correct_digits -= 1
+            if state.correct > 0:
+                state.correct -= 1
         else:
-            if self.number_errors > 0:
-                self.number_errors -= 1
+            if state.errors > 0:
+                state.errors -= 1
         self.input_text.delete("1.0", tk.END)
         self._update_number_display()
         self.update_number_status_label()
         return True
 
-    def _update_number_display(self) -> None:
+    def _update_number_display(self, sudden_death: bool | None = None) -> None:
         """
         Show the current target digit inside the display text widget.
         """
-        self.display_text.configure(state="normal")
-        self.display_text.delete("1.0", tk.END)
-
-        if self.is_number_mode and self.number_index < self.number_total_digits:
-            next_digit = self.number_sequence[self.number_index]
-            self.display_text.insert(
-                "1.0",
-                f"{next_digit}\n(DIGIT)"
-            )
-            if self.is_sudden_death_active():
-                progress = (
-                    "Sudden death number mode: type the digit shown "
-                    f"(streak {self.number_index})"
+        if sudden_death is None:
+            sudden_death = self.is_sudden_death_active()
+        if self.is_number_mode and self.number_state.index < self.number_state.total:
+            next_digit = self.number_state.sequence[self.number_state.index]
+            content = f"{next_digit}\n(DIGIT)"
+            if sudden_death:
+                progress = NUMBER_SUDDEN_DEATH_PROGRESS_TEMPLATE.format(
+                    index=self.number_state.index
                 )
             else:
-                progress = (
-                    f"Number mode: type the digit shown "
-                    f"({self.number_index}/{self.number_total_digits})"
+                progress = NUMBER_PROGRESS_TEMPLATE.format(
+                    index=self.number_state.index,
+                    total=self.number_state.total
                 )
             self.info_text_var.set(progress)
         else:
+            content = ""
             self.info_text_var.set(
                 "Number mode: No active digit. Click the button to start."
             )
 
-        self.display_text.configure(state="disabled")
+        self._set_display_text(content)
 
 
-    def update_number_status_label(self) -> None:
+    def update_number_status_label(
+        self,
+        sudden_death: bool | None = None,
+        blind: bool | None = None
+    ) -> None:
         """
         Update the shared WPM label with number mode specific information.
         """
         if not self.is_number_mode:
             return
 
+        if sudden_death is None:
+            sudden_death = self.is_sudden_death_active()
+        if blind is None:
+            blind = self.is_blind_mode_active()
+
         elapsed_seconds = 0.0
         digits_per_minute = 0.0
 
         if self.start_time is not None:
-            elapsed_seconds = max(time.time() - self.start_time, 0.0001)
+            elapsed_seconds = max(time.monotonic() - self.start_time, 0.0001)
             elapsed_minutes = elapsed_seconds / 60.0
             if elapsed_minutes > 0.0:
-                digits_per_minute = self.number_correct_digits / elapsed_minutes
+                digits_per_minute = self.number_state.correct / elapsed_minutes
 
-        if self.is_sudden_death_active():
-            progress = f"{self.number_correct_digits} correct (no limit)"
+        if sudden_death:
+            progress = f"{self.number_state.correct} correct (no limit)"
         else:
-            progress = f"{self.number_index}/{self.number_total_digits}"
+            progress = f"{self.number_state.index}/{self.number_state.total}"
 
-        if self.is_blind_mode_active():
+        if blind:
             error_text = "Errors: hidden"
         else:
-            error_text = f"Errors: {self.number_errors}"
+            error_text = f"Errors: {self.number_state.errors}"
 
-        self.stats_summary_var.set(
-            f"Number mode  |  Time: {elapsed_seconds:.1f} s  |  "
+        self._set_stats_summary(
+            f"Number mode  |  Time: {self._format_elapsed(elapsed_seconds)} s  |  "
             f"Digits/min: {digits_per_minute:.1f}  |  "
             f"Progress: {progress}  |  "
             f"{error_text}"
@@ -2446,40 +2505,41 @@ class TypingTrainerApp(PlotMixin):
         if not self.is_number_mode:
             return
 
+        is_training_run = self.training_run_var.get()
+        blind = self.is_blind_mode_active()
         elapsed_seconds = 0.0
         digits_per_minute = 0.0
         if self.start_time is not None:
-            elapsed_seconds = max(time.time() - self.start_time, 0.0001)
+            elapsed_seconds = max(time.monotonic() - self.start_time, 0.0001)
             elapsed_minutes = elapsed_seconds / 60.0
             if elapsed_minutes > 0.0:
-                digits_per_minute = self.number_correct_digits / elapsed_minutes
+                digits_per_minute = self.number_state.correct / elapsed_minutes
 
-        completed_sequence = self.number_index >= self.number_total_digits
-        typed_digits_text = "".join(self.number_input_history)
+        completed_sequence = self.number_state.index >= self.number_state.total
+        typed_digits_text = "".join(self.number_state.history)
         typed_digits_count = len(typed_digits_text)
         blind_end_error_percentage: float | None = None
-        if self.is_blind_mode_active() and typed_digits_count > 0:
+        if blind and typed_digits_count > 0:
             if sudden_death:
                 total_targets = max(typed_digits_count, 1)
             else:
-                total_targets = max(self.number_total_digits, 1)
-            target_digits = "".join(self.number_sequence[:total_targets])
+                total_targets = max(self.number_state.total, 1)
             blind_end_error_percentage = calculate_end_error_percentage(
-                target_digits,
+                self.number_state.sequence,
                 typed_digits_text,
                 total_targets
             )
 
         if sudden_death:
-            correct_digits = self.number_correct_digits
-            if not self.is_blind_mode_active():
+            correct_digits = self.number_state.correct
+            if not blind:
                 save_sudden_death_number_result(
                     self.sudden_death_number_stats_file_path,
                     digits_per_minute,
                     correct_digits,
                     elapsed_seconds,
                     completed=completed_sequence,
-                    is_training_run=self.training_run_var.get()
+                    is_training_run=is_training_run
                 )
             if completed_sequence:
                 display_message = (
@@ -2489,16 +2549,7 @@ class TypingTrainerApp(PlotMixin):
                 info_message = (
                     "Sudden death number mode complete. Start a new run to continue."
                 )
-                summary = (
-                    f"Sudden death number complete  |  Time: {elapsed_seconds:.1f} s  |  "
-                    f"Digits/min: {digits_per_minute:.1f}  |  "
-                    f"Correct digits: {correct_digits}"
-                    + (
-                        f"  |  End error %: {blind_end_error_percentage:.1f}"
-                        if blind_end_error_percentage is not None
-                        else ""
-                    )
-                )
+                outcome = "complete"
             else:
                 display_message = (
                     f"Sudden death failed after {correct_digits} digits. "
@@ -2507,26 +2558,27 @@ class TypingTrainerApp(PlotMixin):
                 info_message = (
                     "Sudden death number mode failed. Start a new run to retry."
                 )
-                summary = (
-                    f"Sudden death number failed  |  Time: {elapsed_seconds:.1f} s  |  "
-                    f"Digits/min: {digits_per_minute:.1f}  |  "
-                    f"Correct digits: {correct_digits}"
-                    + (
-                        f"  |  End error %: {blind_end_error_percentage:.1f}"
-                        if blind_end_error_percentage is not None
-                        else ""
-                    )
+                outcome = "failed"
+            summary = (
+                f"Sudden death number {outcome}  |  Time: {elapsed_seconds:.1f} s  |  "
+                f"Digits/min: {digits_per_minute:.1f}  |  "
+                f"Correct digits: {correct_digits}"
+                + (
+                    f"  |  End error %: {blind_end_error_percentage:.1f}"
+                    if blind_end_error_percentage is not None
+                    else ""
                 )
+            )
         else:
-            total_digits = max(self.number_total_digits, 1)
-            error_percentage = (self.number_errors / total_digits) * 100.0
-            if not self.is_blind_mode_active():
+            total_digits = max(self.number_state.total, 1)
+            error_percentage = (self.number_state.errors / total_digits) * 100.0
+            if not blind:
                 save_number_result(
                     self.number_stats_file_path,
                     digits_per_minute,
                     error_percentage,
                     elapsed_seconds,
-                    self.training_run_var.get()
+                    is_training_run
                 )
             display_message = (
                 "Number mode finished. Click 'Number mode' to start again."
@@ -2534,7 +2586,7 @@ class TypingTrainerApp(PlotMixin):
             info_message = (
                 "Number mode finished. Start a new run via the Number mode button."
             )
-            if self.is_blind_mode_active():
+            if blind:
                 if blind_end_error_percentage is not None:
                     error_summary = (
                         f"End error %: {blind_end_error_percentage:.1f}"
@@ -2543,7 +2595,7 @@ class TypingTrainerApp(PlotMixin):
                     error_summary = "Errors: hidden"
             else:
                 error_summary = (
-                    f"Errors: {self.number_errors}  |  "
+                    f"Errors: {self.number_state.errors}  |  "
                     f"Error %: {error_percentage:.1f}"
                 )
             summary = (
@@ -2552,20 +2604,14 @@ class TypingTrainerApp(PlotMixin):
                 f"{error_summary}"
             )
 
-        target_digits_for_display = "".join(
-            self.number_sequence[:len(typed_digits_text)]
-        )
+        target_digits_for_display = self.number_state.sequence[:len(typed_digits_text)]
 
-        self.display_text.configure(state="normal")
-        self.display_text.delete("1.0", tk.END)
-        display_content = (
+        self._set_display_text(
             f"{display_message}\n\nTarget sequence:\n{target_digits_for_display}"
         )
-        self.display_text.insert("1.0", display_content)
-        self.display_text.configure(state="disabled")
 
         self.info_text_var.set(info_message)
-        self.stats_summary_var.set(summary)
+        self._set_stats_summary(summary)
 
         self._display_sequence_result(
             typed_digits_text,
@@ -2574,12 +2620,12 @@ class TypingTrainerApp(PlotMixin):
 
         self.is_number_mode = False
         self.start_time = None
-        self.number_sequence = []
-        self.number_index = 0
-        self.number_total_digits = 0
-        self.number_errors = 0
-        self.number_correct_digits = 0
-        self.number_input_history = []
+        self.number_state.sequence = ""
+        self.number_state.index = 0
+        self.number_state.total = 0
+        self.number_state.errors = 0
+        self.number_state.correct = 0
+        self.number_state.history = []
         self.last_session_mode = "number"
 
         if blind_end_error_percentage is not None:
@@ -2590,7 +2636,7 @@ class TypingTrainerApp(PlotMixin):
                 duration_seconds=elapsed_seconds,
                 completed=completed_sequence if sudden_death else True,
                 end_error_percentage=blind_end_error_percentage,
-                is_training_run=self.training_run_var.get()
+                is_training_run=is_training_run
             )
 
 
@@ -2626,22 +2672,43 @@ class TypingTrainerApp(PlotMixin):
         if self.start_time is None:
             if len(event.char) == 0:
                 return
-            self.start_time = time.time()
-            self.schedule_periodic_update()
+            self.start_time = time.monotonic()
+            self.update_job_id = self.master.after(
+                TYPING_IDLE_UPDATE_INTERVAL_MS,
+                self.schedule_periodic_update,
+            )
 
+        # The <Key> binding runs before the widget inserts the character, so
+        # evaluate the input once the event has been fully processed.
+        if self.typing_update_idle_id is None:
+            self.typing_update_idle_id = self.master.after_idle(
+                self._run_pending_typing_update
+            )
+
+    def _run_pending_typing_update(self) -> None:
+        """
+        Evaluate the input after a key event has been applied to the widget.
+        """
+        self.typing_update_idle_id = None
         self.update_typing_state()
 
 
     def schedule_periodic_update(self) -> None:
         """
-        Schedule periodic updates of WPM and error highlighting.
+        Schedule periodic updates of the WPM label while the session runs.
+
+        Edits made without a key event (e.g. pasting with the mouse) are picked
+        up through the widget's modified flag.
         """
         if self.finished:
             return
 
-        self.update_typing_state()
+        if self.input_text.edit_modified():
+            self.update_typing_state()
+        else:
+            self.update_wpm(self.previous_text)
         self.update_job_id = self.master.after(
-            200,
+            TYPING_IDLE_UPDATE_INTERVAL_MS,
             self.schedule_periodic_update,
         )
 
@@ -2653,73 +2720,71 @@ class TypingTrainerApp(PlotMixin):
         if self.finished:
             return
 
+        now = time.monotonic()
         typed_text = self.input_text.get("1.0", "end-1c")
+        self.input_text.edit_modified(False)
+        if typed_text == self.previous_text:
+            # Nothing was edited since the last pass; only the timer moved on.
+            self.update_wpm(typed_text, now)
+            return
+
         if self.is_blind_mode_active():
             self._update_blind_target_indicator(len(typed_text))
 
         # First update cumulative error counter based on the change.
-        self._update_error_counter(self.previous_text, typed_text)
+        changed_span = self._update_error_counter(self.previous_text, typed_text)
 
         # Then update current error highlighting and correct-count.
-        first_error_index = self.highlight_errors(typed_text)
+        first_error_index = self.highlight_errors(typed_text, changed_span)
 
         if (
             self.is_sudden_death_active()
             and first_error_index is not None
         ):
-            self.handle_sudden_death_text_failure(first_error_index)
+            self.handle_sudden_death_text_failure(first_error_index, now)
             return
 
         # Update statistics row and check for completion.
-        self.update_wpm(typed_text)
-        self.check_completion(typed_text)
+        self.update_wpm(typed_text, now)
+        self.check_completion(typed_text, now)
 
         # Store current text for next comparison.
         self.previous_text = typed_text
 
 
-    def _update_error_counter(self, previous: str, current: str) -> None:
+    def _update_error_counter(
+        self,
+        previous: str,
+        current: str
+    ) -> tuple[int, int, int]:
         """
         Update the cumulative error counter based on the change in text.
 
         An error is counted whenever a new character appears or a character
         changes and the resulting character does not match the target text
         at that position.
+
+        :return: Common prefix length and the end of the changed span in the
+            previous and in the current text.
         """
         # Fast path when nothing changed
         if previous == current:
-            return
-
-        # Determine the common prefix where everything is identical
-        prefix_len = 0
-        max_prefix = min(len(previous), len(current))
-        while (
-            prefix_len < max_prefix
-            and previous[prefix_len] == current[prefix_len]
-        ):
-            prefix_len += 1
-
-        # Determine the common suffix (after the prefix) that is also identical
-        prev_suffix = len(previous)
-        curr_suffix = len(current)
-        while (
-            prev_suffix > prefix_len
-            and curr_suffix > prefix_len
-            and previous[prev_suffix - 1] == current[curr_suffix - 1]
-        ):
-            prev_suffix -= 1
-            curr_suffix -= 1
-
-        # Only examine the truly new/changed characters in the current text
-        for index in range(prefix_len, curr_suffix):
-            new_char = current[index]
-            if index >= len(self.target_text):
-                self.error_count += 1
-            elif new_char != self.target_text[index]:
-                self.error_count += 1
+            return len(current), len(previous), len(current)
 
+        # Only the truly new/changed characters count towards the errors
+        prefix_len, prev_end, curr_end, new_errors = scan_text_change(
+            previous,
+            current,
+            self._target_codepoints
+        )
+        self.error_count += new_errors
+        return prefix_len, prev_end, curr_end
 
-    def highlight_errors(self, typed_text: str) -> int | None:
+    def highlight_errors(
+        self,
+        typed_text: str,
+        changed_span: tuple[int, int, int] | None = None
+    ) -> int | None:
         """
         Highlight incorrect characters in the input text.
 
@@ -2727,37 +2792,106 @@ class TypingTrainerApp(PlotMixin):
         text at the same position. Additional characters beyond the length of
         the target are also considered incorrect. This function also updates
         the current number of correct characters.
+
+        Only the span reported by ``_update_error_counter`` is re-evaluated;
+        without it, or after switching widgets or blind mode, everything is.
         """
-        self.input_text.tag_remove("error", "1.0", tk.END)
         show_error_tags = not self.is_blind_mode_active()
+        widget = self.input_text
+        error_mask = self._typed_error_mask
+
+        full_refresh = (
+            changed_span is None
+            or widget is not self._error_mask_widget
+            or show_error_tags != self._error_mask_tags_shown
+        )
+        if full_refresh:
+            # Start from an empty mask so the counts of the previous widget
+            # or tag state are not subtracted from the fresh recount.
+            error_mask = error_mask[:0]
+            prefix_len, prev_end, curr_end = 0, 0, len(typed_text)
+            self._clear_input_error_tags()
+            self.correct_count = 0
+        else:
+            prefix_len, prev_end, curr_end = changed_span
+            if len(typed_text) != len(error_mask):
+                # Characters after the edit moved to new target positions.
+                prev_end, curr_end = len(error_mask), len(typed_text)
+
+        if full_refresh or prev_end > prefix_len or curr_end > prefix_len:
+            segment = text_to_codepoints(typed_text[prefix_len:curr_end])
+            target_segment = self._target_codepoints[prefix_len:curr_end]
+            segment_mask = np.ones(len(segment), dtype=bool)
+            overlap = len(target_segment)
+            segment_mask[:overlap] = segment[:overlap] != target_segment
+
+            replaced_mask = error_mask[prefix_len:prev_end]
+            self.correct_count += (
+                int(np.count_nonzero(~segment_mask))
+                - int(np.count_nonzero(~replaced_mask))
+            )
+            error_mask = np.concatenate(
+                (error_mask[:prefix_len], segment_mask, error_mask[prev_end:])
+            )
+            self._typed_error_mask = error_mask
+
+            if show_error_tags:
+                single_line = "\n" not in typed_text
+                if not full_refresh:
+                    widget.tag_remove(
+                        "error",
+                        self._text_index(prefix_len, single_line),
+                        self._text_index(curr_end, single_line)
+                    )
+                error_ranges = self._collapse_error_ranges(
+                    np.flatnonzero(segment_mask) + prefix_len
+                )
+                if error_ranges:
+                    widget.tag_add(
+                        "error",
+                        *[
+                            self._text_index(index, single_line)
+                            for index in error_ranges
+                        ]
+                    )
+                    self._error_tagged_inputs.add(widget)
 
-        correct = 0
-        first_error_index: int | None = None
+        self._error_mask_widget = widget
+        self._error_mask_tags_shown = show_error_tags
 
-        for index, char in enumerate(typed_text):
-            if index >= len(self.target_text):
-                if show_error_tags:
-                    start = f"1.0 + {index} chars"
-                    end = f"1.0 + {index + 1} chars"
-                    self.input_text.tag_add("error", start, end)
-                if first_error_index is None:
-                    first_error_index = index
-                continue
+        if not error_mask.any():
+            return None
+        return int(error_mask.argmax())
 
-            if char != self.target_text[index]:
-                if show_error_tags:
-                    start = f"1.0 + {index} chars"
-                    end = f"1.0 + {index + 1} chars"
-                    self.input_text.tag_add("error", start, end)
-                if first_error_index is None:
-                    first_error_index = index
-            else:
-                correct += 1
+    @staticmethod
+    def _text_index(offset: int, single_line: bool) -> str:
+        """
+        Return a Tk index for a character offset from the start of a widget.
 
-        self.correct_count = correct
-        return first_error_index
+        Single-line content can use a direct line.column index, which Tk
+        resolves without counting characters from the start.
+        """
+        if single_line:
+            return f"1.{offset}"
+        return f"1.0+{offset}c"
 
-    def handle_sudden_death_text_failure(self, failure_index: int) -> None:
+    @staticmethod
+    def _collapse_error_ranges(error_indices: np.ndarray) -> tuple[int, ...]:
+        """
+        Merge sorted error indices into flat (start, end) pairs of adjacent runs.
+        """
+        if len(error_indices) == 0:
+            return ()
+        breaks = np.flatnonzero(np.diff(error_indices) != 1)
+        starts = np.concatenate((error_indices[:1], error_indices[breaks + 1]))
+        ends = np.concatenate((error_indices[breaks], error_indices[-1:])) + 1
+        return tuple(np.column_stack((starts, ends)).ravel().tolist())
+
+    def handle_sudden_death_text_failure(
+        self,
+        failure_index: int,
+        now: float | None = None
+    ) -> None:
         """
         Finalize a typing session when sudden death detects a mistake.
         """
@@ -2776,7 +2910,9 @@ class TypingTrainerApp(PlotMixin):
         elapsed_seconds = 0.0
         wpm = 0.0
         if self.start_time is not None:
-            elapsed_seconds = max(time.time() - self.start_time, 0.0001)
+            if now is None:
+                now = time.monotonic()
+            elapsed_seconds = max(now - self.start_time, 0.0001)
             elapsed_minutes = elapsed_seconds / 60.0
             correct_segment = self.target_text[:safe_index]
             words = len(correct_segment.split())
@@ -2785,29 +2921,31 @@ class TypingTrainerApp(PlotMixin):
         else:
             correct_segment = self.target_text[:safe_index]
 
+        is_training_run = self.training_run_var.get()
+        blind = self.is_blind_mode_active()
         blind_end_error_percentage: float | None = None
-        if self.is_blind_mode_active():
+        if blind:
             blind_end_error_percentage = calculate_end_error_percentage(
                 self.target_text,
                 typed_text,
                 len(self.target_text)
             )
 
-        if not self.is_blind_mode_active():
+        if not blind:
             save_sudden_death_wpm_result(
                 self.sudden_death_typing_stats_file_path,
                 wpm,
                 safe_index,
                 elapsed_seconds,
                 completed=False,
-                is_training_run=self.training_run_var.get()
+                is_training_run=is_training_run
             )
 
         self.info_text_var.set(
             f"Sudden death failed after {safe_index} characters. "
             "Load a text to try again."
         )
-        self.stats_summary_var.set(
+        self._set_stats_summary(
             f"Sudden death  |  Time: {elapsed_seconds:.1f} s  |  "
             f"Correct chars: {safe_index}  |  WPM: {wpm:.1f}"
             + (
@@ -2816,7 +2954,7 @@ class TypingTrainerApp(PlotMixin):
                 else ""
             )
         )
-        if self.is_blind_mode_active():
+        if blind:
             self._update_blind_target_indicator(len(typed_text))
             self._show_blind_final_text(typed_text)
             save_blind_typing_result(
@@ -2826,20 +2964,46 @@ class TypingTrainerApp(PlotMixin):
                 duration_seconds=elapsed_seconds,
                 completed=False,
                 end_error_percentage=blind_end_error_percentage or 0.0,
-                is_training_run=self.training_run_var.get()
+                is_training_run=is_training_run
             )
 
 
-    def update_wpm(self, typed_text: str) -> None:
+    def _format_elapsed(self, elapsed_seconds: float) -> str:
+        """
+        Return the elapsed time with one decimal, reformatting only when it changes.
+        """
+        decis = int(elapsed_seconds * 10)
+        if decis != self._last_elapsed_decis:
+            self._last_elapsed_decis = decis
+            self._elapsed_text = f"{decis / 10:.1f}"
+        return self._elapsed_text
+
+    def _set_stats_summary(
+        self,
+        text: str,
+        key: tuple[Any, ...] | None = None
+    ) -> None:
+        """
+        Show the given statistics line and remember the values it was built from.
+
+        :param key: Displayed values behind ``text``; callers passing the same
+            key again can skip rebuilding the line.
+        """
+        self.stats_summary_var.set(text)
+        self._stats_summary_key = key
+
+    def update_wpm(self, typed_text: str, now: float | None = None) -> None:
         if self.start_time is None:
             if self.is_blind_mode_active():
                 text = "Time: 0.0 s  |  WPM: 0.0"
             else:
                 text = "Time: 0.0 s  |  WPM: 0.0  |  Errors: 0  |  Error %: 0.0"
-            self.stats_summary_var.set(text)
+            self._set_stats_summary(text)
             return
 
-        elapsed_seconds = max(time.time() - self.start_time, 0.0001)
+        if now is None:
+            now = time.monotonic()
+        elapsed_seconds = max(now - self.start_time, 0.0001)
         elapsed_minutes = elapsed_seconds / 60.0
 
         words = len(typed_text.split())
@@ -2854,27 +3018,41 @@ class TypingTrainerApp(PlotMixin):
         else:
             error_percentage = (errors / total_typed) * 100.0
 
-        self.stats_summary_var.set(
-            f"Time: {elapsed_seconds:.1f} s  |  "
+        # Compare the values as displayed so unchanged labels are not reformatted
+        blind = self.is_blind_mode_active()
+        summary_key = (
+            int(elapsed_seconds * 10),
+            round(wpm, 1),
+            errors,
+            round(error_percentage, 1),
+            blind
+        )
+        if summary_key == self._stats_summary_key:
+            return
+
+        self._set_stats_summary(
+            f"Time: {self._format_elapsed(elapsed_seconds)} s  |  "
             f"WPM: {wpm:.1f}  |  "
             + (
                 "Errors: hidden  |  Error %: hidden"
-                if self.is_blind_mode_active()
+                if blind
                 else f"Errors: {errors}  |  Error %: {error_percentage:.1f}"
-            )
+            ),
+            summary_key
         )
 
 
-    def check_completion(self, typed_text: str) -> None:
+    def check_completion(self, typed_text: str, now: float | None = None) -> None:
         """
         Check whether the user has fully and correctly typed the target text.
 
         Once the text is completed, the timer is stopped and the result is
         saved to the statistics file.
         """
+        blind = self.is_blind_mode_active()
         final_typed_text = typed_text
         target_length = len(self.target_text)
-        if self.is_blind_mode_active():
+        if blind:
             if len(typed_text) < target_length:
                 return
             typed_text = typed_text[:target_length]
@@ -2892,7 +3070,9 @@ class TypingTrainerApp(PlotMixin):
             self.update_job_id = None
 
         words = len(typed_text.split())
-        elapsed_seconds = max(time.time() - self.start_time, 0.0001)
+        if now is None:
+            now = time.monotonic()
+        elapsed_seconds = max(now - self.start_time, 0.0001)
         elapsed_minutes = elapsed_seconds / 60.0
         wpm = words / elapsed_minutes if elapsed_minutes > 0.0 else 0.0
 
@@ -2904,28 +3084,30 @@ class TypingTrainerApp(PlotMixin):
         else:
             error_percentage = (errors / total) * 100.0
 
+        is_training_run = self.training_run_var.get()
+        sudden_death = self.is_sudden_death_active()
         end_error_percentage: float | None = None
-        if self.is_blind_mode_active():
+        if blind:
             end_error_percentage = calculate_end_error_percentage(
                 self.target_text,
                 final_typed_text,
                 target_length
             )
 
-        if self.is_sudden_death_active():
-            if not self.is_blind_mode_active():
+        if sudden_death:
+            if not blind:
                 save_sudden_death_wpm_result(
                     self.sudden_death_typing_stats_file_path,
                     wpm,
                     target_length,
                     elapsed_seconds,
                     completed=True,
-                    is_training_run=self.training_run_var.get()
+                    is_training_run=is_training_run
                 )
             self.info_text_var.set(
                 "Sudden death complete. Start another run when ready."
             )
-            self.stats_summary_var.set(
+            self._set_stats_summary(
                 f"Sudden death  |  Time: {elapsed_seconds:.1f} s  |  "
                 f"WPM: {wpm:.1f}  |  Correct chars: {target_length}"
                 + (
@@ -2934,7 +3116,7 @@ class TypingTrainerApp(PlotMixin):
                     else ""
                 )
             )
-            if self.is_blind_mode_active():
+            if blind:
                 self._update_blind_target_indicator(target_length)
                 self._show_blind_final_text(final_typed_text)
                 save_blind_typing_result(
@@ -2944,18 +3126,18 @@ class TypingTrainerApp(PlotMixin):
                     duration_seconds=elapsed_seconds,
                     completed=True,
                     end_error_percentage=end_error_percentage or 0.0,
-                    is_training_run=self.training_run_var.get()
+                    is_training_run=is_training_run
                 )
         else:
-            if not self.is_blind_mode_active():
+            if not blind:
                 save_wpm_result(
                     self.stats_file_path,
                     wpm,
                     error_percentage,
                     elapsed_seconds,
-                    self.training_run_var.get()
+                    is_training_run
                 )
-            if self.is_blind_mode_active():
+            if blind:
                 self._show_blind_final_text(final_typed_text)
                 save_blind_typing_result(
                     self.blind_typing_stats_file_path,
@@ -2964,10 +3146,10 @@ class TypingTrainerApp(PlotMixin):
                     duration_seconds=elapsed_seconds,
                     completed=True,
                     end_error_percentage=end_error_percentage or 0.0,
-                    is_training_run=self.training_run_var.get()
+                    is_training_run=is_training_run
                 )
 
-            if self.is_blind_mode_active():
+            if blind:
                 summary = (
                     f"Typing complete  |  Time: {elapsed_seconds:.1f} s  |  "
                     f"WPM: {wpm:.1f}  |  End error %: {end_error_percentage or 0.0:.1f}"
@@ -2978,7 +3160,7 @@ class TypingTrainerApp(PlotMixin):
                     f"WPM: {wpm:.1f}  |  Errors: {errors}  |  "
                     f"Error %: {error_percentage:.1f}"
                 )
-            self.stats_summary_var.set(summary)
+            self._set_stats_summary(summary)
 
 
     def show_result(self) -> None:
@@ -2999,7 +3181,7 @@ class TypingTrainerApp(PlotMixin):
             )
             return
 
-        elapsed_seconds = max(time.time() - self.start_time, 0.0001)
+        elapsed_seconds = max(time.monotonic() - self.start_time, 0.0001)
         elapsed_minutes = elapsed_seconds / 60.0
         wpm = words / elapsed_minutes if elapsed_minutes > 0.0 else 0.0
 